@@ -0,0 +1,53 @@
+import time
+import yaml
+from pathlib import Path
+from vm_lifecycle.params import DEFAULT_CACHE_PATH, DEFAULT_CACHE_TTL
+
+
+class CacheManager:
+    """
+    Persists slow-changing GCP lookups, e.g. the disk types of a zone, so they
+    are not fetched on every command. Entries expire after ttl seconds.
+    """
+
+    def __init__(
+        self, cache_path: Path = DEFAULT_CACHE_PATH, ttl: int = DEFAULT_CACHE_TTL
+    ):
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.cache = self._load_cache()
+
+    def _load_cache(self):
+        if self.cache_path.exists():
+            with self.cache_path.open("r", encoding="utf-8") as f:
+                return yaml.safe_load(f) or {}
+        return {}
+
+    def save_cache(self):
+        with self.cache_path.open("w", encoding="utf-8") as f:
+            yaml.dump(self.cache, f)
+
+    def get(self, key: str):
+        entry = self.cache.get(key)
+        if not entry or entry.get("expires", 0) < time.time():
+            return None
+        return entry["value"]
+
+    def set(self, key: str, value):
+        self.cache[key] = {"expires": time.time() + self.ttl, "value": value}
+        self.save_cache()
+
+    def get_or_fetch(self, key: str, fetch_fn, *args, **kwargs):
+        value = self.get(key)
+        if value is None:
+            value = fetch_fn(*args, **kwargs)
+            self.set(key, value)
+        return value
+
+    def clear(self):
+        self.cache = {}
+        self.save_cache()
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,218 @@
+import click
+import sys
+import time
+from googleapiclient.errors import HttpError
+
+from vm_lifecycle.commands.connect import ssh_host_alias, write_ssh_host
+from vm_lifecycle.gcp_helpers import (
+    error_message,
+    poll_with_spinner,
+    init_gcp_context,
+    record_timing,
+    image_guest_os_features,
+)
+from vm_lifecycle.params import (
+    STARTUP_SCRIPTS,
+    DEFAULT_STARTUP_SCRIPT,
+    BAKED_FAMILY_PREFIX,
+    BAKE_DISK_SIZE,
+    BAKE_TIMEOUT,
+    BAKED_IMAGE_VERSIONS,
+    GCLOUD_SSH_KEY_PATH,
+)
+from vm_lifecycle.readiness import startup_scripts_done, wait_until_ready
+from vm_lifecycle.ssh_config import SSHConfigManager
+from vm_lifecycle.timing_manager import TimingManager
+from vm_lifecycle.utils import spinner
+from vm_lifecycle.vscode_server import bake_vscode_server
+
+
+def baked_family(startup_script: str) -> str:
+    """Image family 'vmlc bake' versions the images of a startup script in."""
+    return f"{BAKED_FAMILY_PREFIX}-{startup_script}"
+
+
+@click.command(name="bake")
+@click.option(
+    "-s",
+    "--startup-script",
+    type=click.Choice(STARTUP_SCRIPTS),
+    default=DEFAULT_STARTUP_SCRIPT,
+    help="Startup script to provision the image with.",
+)
+@click.option(
+    "-k",
+    "--keep",
+    is_flag=True,
+    help="Keep the builder instance if provisioning fails, to inspect it.",
+)
+def bake_image(startup_script, keep):
+    """Provision a VM once and image it, so 'vmlc create --baked' skips provisioning"""
+    config_manager, compute_manager, active_zone = init_gcp_context()
+    if not config_manager:
+        sys.exit(1)
+
+    profile = config_manager.active_profile
+    builder = f"{profile['instance_name']}-bake"
+    family = baked_family(startup_script)
+    bake_start = time.monotonic()
+
+    op = compute_manager.create_instance(
+        instance_name=builder,
+        machine_type=profile["machine_type"],
+        disk_size=BAKE_DISK_SIZE,
+        instance_user=profile["instance_user"],
+        zone=active_zone,
+        startup_script_type=startup_script,
+    )
+    result = poll_with_spinner(
+        compute_manager=compute_manager,
+        op_name=op["name"],
+        text=f"Creating builder instance: '{builder}' in zone: '{active_zone}'",
+        done_text=f"✅ Builder instance: '{builder}' created",
+        scope="zone",
+        zone=active_zone,
+    )
+    if not result["success"]:
+        click.echo(f"❌ Failed to create builder instance: '{builder}'")
+        sys.exit(1)
+
+    try:
+        with spinner(
+            text=f"Provisioning builder instance: '{builder}' with startup script: '{startup_script}'",
+            done_text=f"✅ Builder instance: '{builder}' provisioned",
+        ):
+            phases = wait_until_ready(
+                compute_manager, builder, active_zone, timeout=BAKE_TIMEOUT
+            )
+    except TimeoutError as e:
+        click.echo(f"❌ {e}")
+        if not keep:
+            _delete_builder(compute_manager, builder, active_zone)
+        sys.exit(1)
+
+    # The guest agent logs the marker once the script exited, whatever its status,
+    # an instance without the startup script never logs it
+    if not _startup_scripts_finished(compute_manager, builder, active_zone):
+        click.echo(
+            f"❌ Startup script: '{startup_script}' did not finish on builder instance: '{builder}', not imaging it"
+        )
+        if not keep:
+            _delete_builder(compute_manager, builder, active_zone)
+        sys.exit(1)
+
+    # What every boot from the base image pays, compare with 'boot' timings
+    TimingManager().record(
+        config_manager.active, "bake", "provision", list(phases.values())[-1]
+    )
+
+    if profile.get("vscode_server", False):
+        _bake_vscode_server(compute_manager, profile, builder, active_zone)
+
+    if not _stop_builder(compute_manager, builder, active_zone):
+        _delete_builder(compute_manager, builder, active_zone)
+        sys.exit(1)
+
+    op = compute_manager.create_image_from_instance(
+        instance_name=builder,
+        image_name=family,
+        family=family,
+        zone=active_zone,
+        storage_location=profile.get("image_storage_location") or profile["region"],
+        guest_os_features=image_guest_os_features(profile),
+    )
+    image_name = op["targetLink"].split("/")[-1] if "targetLink" in op else family
+    result = poll_with_spinner(
+        compute_manager=compute_manager,
+        op_name=op["name"],
+        text=f"Creating image from builder instance: '{builder}'",
+        done_text=f"✅ Image: '{image_name}' added to family: '{family}'",
+        scope="global",
+    )
+    _delete_builder(compute_manager, builder, active_zone)
+
+    if not result["success"]:
+        click.echo(f"❌ Failed to create image: {error_message(result)}")
+        sys.exit(1)
+    record_timing(config_manager, "bake", "image", result)
+    TimingManager().record(
+        config_manager.active, "bake", "total", time.monotonic() - bake_start
+    )
+
+    _prune_baked_images(compute_manager, family)
+    click.echo(
+        f"💡 Create instances without provisioning with 'vmlc create --baked -s {startup_script}'"
+    )
+
+
+def _startup_scripts_finished(compute_manager, builder: str, zone: str) -> bool:
+    """Whether the serial console of the builder shows its startup scripts finished."""
+    try:
+        console_output, _ = compute_manager.get_serial_port_output(builder, zone=zone)
+    except HttpError:
+        return False
+    return startup_scripts_done(console_output)
+
+
+def _bake_vscode_server(compute_manager, profile: dict, builder: str, zone: str):
+    """Install the local VS Code server on the builder through a temporary SSH entry."""
+    if not GCLOUD_SSH_KEY_PATH.exists():
+        click.echo("⚠️ No gcloud SSH key found, skipping VS Code server install")
+        return
+
+    host = ssh_host_alias({**profile, "instance_name": builder}, zone)
+    instance = compute_manager.get_instance(builder, zone=zone)
+    write_ssh_host(compute_manager, host, instance, profile, echo=False)
+    try:
+        bake_vscode_server(host)
+    finally:
+        SSHConfigManager().remove_host(host)
+
+
+def _stop_builder(compute_manager, builder: str, zone: str) -> bool:
+    """Shut the builder down, images of a stopped disk are consistent."""
+    op = compute_manager.stop_instance(instance_name=builder, zone=zone)
+    result = poll_with_spinner(
+        compute_manager=compute_manager,
+        op_name=op["name"],
+        text=f"Stopping builder instance: '{builder}'",
+        done_text=f"✅ Builder instance: '{builder}' stopped",
+        scope="zone",
+        zone=zone,
+    )
+    if not result["success"]:
+        click.echo(f"❌ Failed to stop builder instance: '{builder}'")
+    return result["success"]
+
+
+def _delete_builder(compute_manager, builder: str, zone: str):
+    op = compute_manager.delete_instance(instance_name=builder, zone=zone)
+    result = poll_with_spinner(
+        compute_manager=compute_manager,
+        op_name=op["name"],
+        text=f"Destroying builder instance: '{builder}' in zone: '{zone}'",
+        done_text=f"🗑️ Builder instance: '{builder}' destroyed",
+        scope="zone",
+        zone=zone,
+    )
+    if not result["success"]:
+        click.echo(
+            f"⚠️ Failed to destroy builder instance: '{builder}', delete it with 'vmlc destroy --vm'"
+        )
+
+
+def _prune_baked_images(compute_manager, family: str):
+    """Keep the newest BAKED_IMAGE_VERSIONS images of the family."""
+    images = sorted(
+        compute_manager.list_images(family=family),
+        key=lambda image: image.get("creationTimestamp", ""),
+    )
+    for image in images[:-BAKED_IMAGE_VERSIONS]:
+        op = compute_manager.delete_image(image["name"])
+        poll_with_spinner(
+            compute_manager=compute_manager,
+            op_name=op["name"],
+            text=f"Destroying old baked image: '{image['name']}'",
+            done_text=f"🗑️ Image: '{image['name']}' destroyed",
+            scope="global",
+        )
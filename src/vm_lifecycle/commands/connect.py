@@ -1,30 +1,67 @@
 import click
+import os
 import subprocess
 import sys
 
 from vm_lifecycle.gcp_helpers import init_gcp_context
+from vm_lifecycle.params import (
+    GCLOUD_SSH_KEY_PATH,
+    GCLOUD_KNOWN_HOSTS_PATH,
+    HOSTKEYS_GUEST_NAMESPACE,
+    SSH_MULTIPLEXING_OPTIONS,
+)
+from vm_lifecycle.readiness import external_ip
+from vm_lifecycle.ssh_config import SSHConfigManager
 from vm_lifecycle.utils import create_vm_ssh_connection
 
 
 @click.command(name="connect")
 @click.option("-p", "--path", type=click.Path(), help="Path to Open VS Code on VM")
-def vscode_connect(path):
+@click.option(
+    "-w",
+    "--warm",
+    is_flag=True,
+    help="Open the shared SSH connection in the background while VS Code starts.",
+)
+def vscode_connect(path, warm):
     config_manager, compute_manager, target_zone = init_gcp_context()
     if not config_manager:
         sys.exit(1)
 
+    instance = running_instance(config_manager, compute_manager, target_zone)
+    host = ssh_host_alias(config_manager.active_profile, target_zone)
+
+    # Create SSH Connection
+    managed = GCLOUD_SSH_KEY_PATH.exists() and external_ip(instance)
+    if managed:
+        write_ssh_host(compute_manager, host, instance, config_manager.active_profile)
+    else:
+        # No gcloud key yet, let gcloud generate the config
+        create_vm_ssh_connection(
+            project_id=config_manager.active_profile["project_id"],
+            instance_name=config_manager.active_profile["instance_name"],
+            zone=target_zone,
+        )
+
+    launch_vscode(config_manager.active_profile, host, path, warm, managed)
+
+
+def running_instance(config_manager, compute_manager, zone: str) -> dict:
+    """The profile's instance, exits unless it is running."""
+    instance = {}
     try:
-        instance_status = compute_manager.get_instance_status(
+        instance = compute_manager.find_instance(
             config_manager.active_profile["instance_name"],
-            zone=target_zone,
+            zone=zone,
         )
+        instance_status = instance.get("status", "UNKNOWN")
     except ValueError as e:
         if "not found in zone" in str(e):
             instance_status = "UNKNOWN"
 
     if instance_status == "UNKNOWN":
         click.echo(
-            f"❗ Instance: '{config_manager.active_profile['instance_name']}' not found in zone: '{target_zone}'"
+            f"❗ Instance: '{config_manager.active_profile['instance_name']}' not found in zone: '{zone}'"
         )
         sys.exit(1)
     elif instance_status == "TERMINATED":
@@ -32,25 +69,126 @@ def vscode_connect(path):
             f"❗ Instance: '{config_manager.active_profile['instance_name']}' found, but not running. Run 'vmlc start' to turn on VM"
         )
         sys.exit(1)
+    elif instance_status in ("SUSPENDING", "SUSPENDED"):
+        click.echo(
+            f"❗ Instance: '{config_manager.active_profile['instance_name']}' is suspended. Run 'vmlc start' to resume VM"
+        )
+        sys.exit(1)
+    return instance
 
-    # Create SSH Connection
-    create_vm_ssh_connection(
-        project_id=config_manager.active_profile["project_id"],
-        instance_name=config_manager.active_profile["instance_name"],
-        zone=target_zone,
-    )
+
+def ssh_host_alias(profile: dict, zone: str) -> str:
+    # Same host alias as 'gcloud compute config-ssh', existing VS Code hosts keep working
+    return f"{profile['instance_name']}.{zone}.{profile['project_id']}"
+
+
+def launch_vscode(
+    profile: dict, host: str, path: str = None, warm: bool = False, managed=False
+):
+    """Open VS Code on host, warming the shared SSH connection first if asked to."""
+    # Only the managed entry shares connections, a plain one would stay open
+    if warm and managed and os.name != "nt":
+        _warm_ssh_master(host)
+    elif warm:
+        click.echo("⚠️ SSH connection sharing is not configured, skipping --warm")
 
     # Connect to instance
-    instance_name = f"{config_manager.active_profile['instance_name']}.{target_zone}.{config_manager.active_profile['project_id']}"
     if path:
         conn_path = path
     else:
-        conn_path = f"/home/{config_manager.active_profile['instance_user']}"
+        conn_path = f"/home/{profile['instance_user']}"
 
     subprocess.run(
         [
             "code",
             "--folder-uri",
-            f"vscode-remote://ssh-remote+{instance_name}{conn_path}",
+            f"vscode-remote://ssh-remote+{host}{conn_path}",
         ]
     )
+
+
+def write_ssh_host(
+    compute_manager, host: str, instance: dict, profile: dict, echo: bool = True
+):
+    """
+    Point the managed SSH config entry of host at the instance's current IP.
+    Returns whether the entry changed.
+    """
+    host_key_alias = f"compute.{instance['id']}"
+    instance_name, zone, _ = host.split(".", 2)
+    ssh_config = SSHConfigManager()
+    # 'gcloud compute config-ssh' publishes the key to the project metadata, which
+    # is only needed before the first connection. Later instances, restored ones
+    # with a new id included, get the key from the project, only their host key
+    # is new and is recorded without the slow gcloud round trip
+    if ssh_config.get_host(host) is None:
+        create_vm_ssh_connection(
+            project_id=profile["project_id"], instance_name=instance_name, zone=zone
+        )
+    if not host_key_known(host_key_alias):
+        add_host_keys(compute_manager, instance_name, zone, host_key_alias)
+
+    # No User, gcloud registers the key for the local user name
+    options = {
+        "HostName": external_ip(instance),
+        "IdentityFile": GCLOUD_SSH_KEY_PATH,
+        "UserKnownHostsFile": GCLOUD_KNOWN_HOSTS_PATH,
+        # Host keys follow the instance, not its ephemeral IP
+        "HostKeyAlias": host_key_alias,
+        "IdentitiesOnly": "yes",
+        "CheckHostIP": "no",
+    }
+    # Booting instances publish their host keys late, trust the first one seen
+    if not host_key_known(host_key_alias):
+        options["StrictHostKeyChecking"] = "accept-new"
+    # OpenSSH for Windows has no connection sharing
+    if os.name != "nt":
+        options.update(SSH_MULTIPLEXING_OPTIONS)
+    updated = ssh_config.update_host(host, options)
+    if updated and echo:
+        click.echo(f"✅ Updated SSH host: {host} ({options['HostName']})")
+    return updated
+
+
+def host_key_known(host_key_alias: str) -> bool:
+    """Whether the gcloud known hosts file has a key for host_key_alias."""
+    if not GCLOUD_KNOWN_HOSTS_PATH.exists():
+        return False
+    with GCLOUD_KNOWN_HOSTS_PATH.open(encoding="utf-8") as f:
+        return any(host_key_alias in line.split(" ", 1)[0].split(",") for line in f)
+
+
+def add_host_keys(
+    compute_manager, instance_name: str, zone: str, host_key_alias: str
+) -> bool:
+    """
+    Record the host keys the guest agent published in guest attributes under
+    host_key_alias, as gcloud does. Returns False if none are published yet.
+    """
+    host_keys = compute_manager.get_guest_attributes(
+        instance_name, HOSTKEYS_GUEST_NAMESPACE, zone=zone
+    )
+    if not host_keys:
+        return False
+    GCLOUD_KNOWN_HOSTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with GCLOUD_KNOWN_HOSTS_PATH.open("a", encoding="utf-8") as f:
+        for key_type, key in host_keys.items():
+            f.write(f"{host_key_alias} {key_type} {key}\n")
+    return True
+
+
+def _warm_ssh_master(host: str):
+    """Start the shared SSH connection of host unless one is already open."""
+    check = subprocess.run(["ssh", "-O", "check", host], capture_output=True, text=True)
+    if check.returncode == 0:
+        click.echo(f"🔥 SSH connection to: {host} already open")
+        return
+
+    # -f backgrounds ssh once authenticated, -N runs no remote command
+    subprocess.Popen(
+        ["ssh", "-f", "-N", host],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    click.echo(f"🔥 Opening SSH connection to: {host} in the background")
@@ -1,14 +1,62 @@
 import click
 import sys
+from googleapiclient.errors import HttpError
 
-from vm_lifecycle.gcp_helpers import poll_with_spinner, init_gcp_context
+from vm_lifecycle.commands.bake import baked_family
+from vm_lifecycle.machine_catalog import MachineTypeCatalog
+from vm_lifecycle.gcp_helpers import (
+    poll_with_spinner,
+    wait_for_ready,
+    init_gcp_context,
+    check_disk_type,
+    disk_settings,
+    network_settings,
+    static_ip_settings,
+    error_message,
+)
+from vm_lifecycle.params import DEFAULT_STARTUP_SCRIPT, STARTUP_SCRIPTS
+from vm_lifecycle.placement import is_stockout, fallback_zones, place_instance
 
 
 @click.command(name="create")
 @click.option("-i", "--image", help="Name of a custom VM Image to use")
-@click.option("-s", "--startup-script", help="Name of a custom startup script")
+@click.option(
+    "-s",
+    "--startup-script",
+    type=click.Choice(STARTUP_SCRIPTS),
+    help="Startup script to provision the VM with",
+)
 @click.option("-z", "--zone", help="GCP Zone override")
-def create_vm_instance(image, startup_script, zone):
+@click.option(
+    "--min-vcpus",
+    type=click.IntRange(min=1),
+    help="Use the cheapest machine type in the zone with at least this many vCPUs. Updates 'machine_type' for current profile.",
+)
+@click.option(
+    "--min-memory",
+    type=click.FloatRange(min=0),
+    help="Use the cheapest machine type in the zone with at least this much memory in GB. Updates 'machine_type' for current profile.",
+)
+@click.option(
+    "--race",
+    is_flag=True,
+    help="Create in two zones of the region at once and keep the first instance that comes up.",
+)
+@click.option(
+    "-b",
+    "--baked",
+    is_flag=True,
+    help="Boot from the latest image baked by 'vmlc bake' for the startup script, nothing is provisioned on boot.",
+)
+@click.option(
+    "-w",
+    "--wait-ready",
+    is_flag=True,
+    help="Return once the VM accepts SSH connections and its startup script finished.",
+)
+def create_vm_instance(
+    image, startup_script, zone, min_vcpus, min_memory, race, baked, wait_ready
+):
     """Create a GCP VM instance"""
     config_manager, compute_manager, active_zone = init_gcp_context(zone_override=zone)
     if not config_manager:
@@ -25,6 +73,13 @@ def create_vm_instance(image, startup_script, zone):
                 )
                 sys.exit(1)
 
+    # A boot disk kept by 'vmlc stop --strategy disk' blocks the default disk name
+    if compute_manager.get_disk(config_manager.active_profile["instance_name"]):
+        click.echo(
+            f"❗ Parked disk for instance: '{config_manager.active_profile['instance_name']}' in zone '{active_zone}' already exists. Start the instance"
+        )
+        sys.exit(1)
+
     # Check if image corresponding to this profile exists
     images = compute_manager.list_images(
         family=config_manager.active_profile["image_base_name"]
@@ -39,36 +94,156 @@ def create_vm_instance(image, startup_script, zone):
             click.echo("❌ Aborted.")
             sys.exit(1)
 
-    # Create instance
-    op = compute_manager.create_instance(
-        instance_name=config_manager.active_profile["instance_name"],
-        machine_type=config_manager.active_profile["machine_type"],
-        disk_size=config_manager.active_profile["disk_size"],
-        instance_user=config_manager.active_profile["instance_user"],
-        zone=active_zone,
-        custom_image_name=None,
-        image_project="ubuntu-os-cloud" if not image else None,
-        image_family="ubuntu-2204-lts" if not image else None,
-        startup_script_type=startup_script or None,
+    machine_type = _select_machine_type(
+        config_manager, compute_manager, active_zone, min_vcpus, min_memory
     )
 
-    # Works
-    # TODO: Add logic if creation fails
-    # Opts: zone_out_of_resources, quota
+    if not check_disk_type(compute_manager, config_manager.active_profile, active_zone):
+        sys.exit(1)
+
+    ip_settings = static_ip_settings(
+        compute_manager,
+        config_manager.active_profile,
+        "-".join(active_zone.split("-")[:-1]),
+    )
+    if ip_settings is None:
+        sys.exit(1)
+    if ip_settings and race:
+        click.echo(
+            "⚠️ A static IP can only be attached to one instance, not racing zones"
+        )
+        race = False
+
+    image_project = "ubuntu-os-cloud" if not image else None
+    image_family = "ubuntu-2204-lts" if not image else None
+    if baked:
+        image_project = config_manager.active_profile["project_id"]
+        image_family = baked_family(startup_script or DEFAULT_STARTUP_SCRIPT)
+        try:
+            compute_manager.get_latest_image_from_family(image_family)
+        except HttpError:
+            click.echo(
+                f"❌ No baked image in family: '{image_family}'. Run 'vmlc bake' first"
+            )
+            sys.exit(1)
+        # Provisioned when the image was baked
+        startup_script = None
 
-    spinner_text = f"Creating instance: '{config_manager.active_profile['instance_name']}' in zone: '{active_zone}'"
-    done_text = f"✅ Instance: '{config_manager.active_profile['instance_name']}' created in zone: '{active_zone}'"
+    def create_in_zone(target_zone: str):
+        return compute_manager.create_instance(
+            instance_name=config_manager.active_profile["instance_name"],
+            machine_type=machine_type,
+            disk_size=config_manager.active_profile["disk_size"],
+            instance_user=config_manager.active_profile["instance_user"],
+            zone=target_zone,
+            custom_image_name=None,
+            image_project=image_project,
+            image_family=image_family,
+            startup_script_type=startup_script or None,
+            **disk_settings(config_manager.active_profile),
+            **network_settings(config_manager.active_profile),
+            **ip_settings,
+        )
 
-    result = poll_with_spinner(
-        compute_manager=compute_manager,
-        op_name=op["name"],
-        text=spinner_text,
-        done_text=done_text,
-        scope="zone",
-        zone=active_zone,
+    spinner_text = (
+        f"Creating instance: '{config_manager.active_profile['instance_name']}'"
     )
 
+    if race:
+        placed, result = place_instance(
+            compute_manager,
+            create_in_zone,
+            [active_zone] + fallback_zones(compute_manager, active_zone, machine_type),
+            config_manager.active_profile["instance_name"],
+            machine_type,
+            spinner_text,
+            race=True,
+        )
+    else:
+        op = create_in_zone(active_zone)
+        result = poll_with_spinner(
+            compute_manager=compute_manager,
+            op_name=op["name"],
+            text=f"{spinner_text} in zone: '{active_zone}'",
+            done_text=f"✅ Instance: '{config_manager.active_profile['instance_name']}' created in zone: '{active_zone}'",
+            scope="zone",
+            zone=active_zone,
+        )
+        placed = active_zone if result["success"] else None
+
+        # Zone ran out of capacity, try the other zones of the region
+        if not result["success"] and is_stockout(result.get("error")):
+            click.echo(
+                f"⚠️ Zone: '{active_zone}' has no capacity for machine type: '{machine_type}'"
+            )
+            placed, result = place_instance(
+                compute_manager,
+                create_in_zone,
+                fallback_zones(compute_manager, active_zone, machine_type),
+                config_manager.active_profile["instance_name"],
+                machine_type,
+                spinner_text,
+            )
+
+    if not result["success"]:
+        click.echo(f"❌ Failed to create instance: {error_message(result)}")
+        sys.exit(1)
+    active_zone = placed
+
     if config_manager.update_active_zone_region(result["success"], zone=active_zone):
         click.echo(
             f"✅ Updated zone in profile: '{config_manager.active}' to '{active_zone}'"
         )
+
+    if (
+        result["success"]
+        and machine_type != config_manager.active_profile["machine_type"]
+    ):
+        config_manager.set_profile_option("machine_type", machine_type)
+        click.echo(
+            f"✅ Updated machine type in profile: '{config_manager.active}' to '{machine_type}'"
+        )
+
+    if wait_ready and not wait_for_ready(config_manager, compute_manager, active_zone):
+        sys.exit(1)
+
+
+def _select_machine_type(
+    config_manager, compute_manager, zone: str, min_vcpus: int, min_memory: float
+) -> str:
+    """
+    Recommend a machine type when minimums are given, otherwise check the
+    profile machine type is offered in the zone.
+    """
+    catalog = MachineTypeCatalog(compute_manager)
+    machine_type = config_manager.active_profile["machine_type"]
+
+    if min_vcpus or min_memory:
+        try:
+            recommended = catalog.recommend(
+                zone, min_vcpus=min_vcpus or 0, min_memory_gb=min_memory or 0
+            )
+        except HttpError as e:
+            click.echo(f"❗ Error: {e}")
+            sys.exit(1)
+        if not recommended:
+            click.echo(
+                f"❌ No machine type with at least {min_vcpus or 0} vCPUs and {min_memory or 0} GB memory in zone: '{zone}'"
+            )
+            sys.exit(1)
+        click.echo(
+            f"💡 Machine type: '{recommended['name']}' ({recommended['vcpus']} vCPUs, {recommended['memory_gb']} GB) is the cheapest match in zone: '{zone}'"
+        )
+        return recommended["name"]
+
+    try:
+        offered = catalog.get(zone, machine_type)
+    except HttpError:
+        # The insert reports an unknown machine type anyway
+        return machine_type
+    if not offered:
+        click.echo(
+            f"❌ Machine type: '{machine_type}' is not offered in zone: '{zone}'. Pick another zone or use --min-vcpus / --min-memory"
+        )
+        sys.exit(1)
+    return machine_type
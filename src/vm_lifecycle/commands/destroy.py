@@ -1,7 +1,12 @@
 import click
 import sys
 
-from vm_lifecycle.gcp_helpers import poll_with_spinner, init_gcp_context
+from vm_lifecycle.gcp_helpers import (
+    poll_with_spinner,
+    init_gcp_context,
+    release_static_ip,
+    static_ip_name,
+)
 from vm_lifecycle.utils import select_from_list, spinner
 
 
@@ -75,7 +80,7 @@ def destroy_vm_instance(vm, images):
                 spinner_text = f"Destroying VM instance: {instance_name} in zone: '{instance_zone}'"
                 done_text = f"🗑️ VM instance: '{instance_name}' in zone: '{instance_zone}' destroyed."
 
-                poll_with_spinner(
+                result = poll_with_spinner(
                     compute_manager=compute_manager,
                     op_name=op["name"],
                     text=spinner_text,
@@ -83,6 +88,10 @@ def destroy_vm_instance(vm, images):
                     scope="zone",
                     zone=active_zone,
                 )
+                if result["success"]:
+                    _release_static_ips(
+                        config_manager, compute_manager, instance_name, instance_zone
+                    )
         elif isinstance(selected, tuple) and len(selected) == 2:
             instance_name, instance_zone = selected
             op = compute_manager.delete_instance(
@@ -94,7 +103,7 @@ def destroy_vm_instance(vm, images):
             )
             done_text = f"🗑️ VM instance: '{instance_name}' in zone: '{instance_zone}' destroyed."
 
-            poll_with_spinner(
+            result = poll_with_spinner(
                 compute_manager=compute_manager,
                 op_name=op["name"],
                 text=spinner_text,
@@ -102,6 +111,10 @@ def destroy_vm_instance(vm, images):
                 scope="zone",
                 zone=active_zone,
             )
+            if result["success"]:
+                _release_static_ips(
+                    config_manager, compute_manager, instance_name, instance_zone
+                )
 
         else:
             click.echo("❌ Invalid selection.")
@@ -171,11 +184,24 @@ def destroy_vm_instance(vm, images):
     # Check Instance exists
     existing_instances = compute_manager.list_instances()
 
-    if not existing_instances:
-        click.echo(
-            f"❗ No GCP Compute Engine instances found in zone: '{config_manager.active_profile['zone']}'."
-        )
-        sys.exit(1)
+    instance_names = [instance["name"] for instance in existing_instances or []]
+
+    if config_manager.active_profile["instance_name"] not in instance_names:
+        if not existing_instances:
+            click.echo(
+                f"❗ No GCP Compute Engine instances found in zone: '{config_manager.active_profile['zone']}'."
+            )
+        else:
+            click.echo(
+                f"❗ No instance named: '{config_manager.active_profile['instance_name']}' found in zone: '{config_manager.active_profile['zone']}'."
+            )
+        # A parked VM has no instance, but its kept boot disk and reserved
+        # address are still billed
+        deleted_disk = _delete_parked_disk(config_manager, compute_manager)
+        released_ip = _release_parked_static_ip(config_manager, compute_manager)
+        if not deleted_disk and not released_ip:
+            sys.exit(1)
+        return
 
     for instance in existing_instances:
         if instance["name"] == config_manager.active_profile["instance_name"]:
@@ -194,7 +220,7 @@ def destroy_vm_instance(vm, images):
     spinner_text = f"Destroying VM instance: '{config_manager.active_profile['instance_name']}' in zone: '{config_manager.active_profile['zone']}'"
     done_text = f"🗑️ VM instance: '{config_manager.active_profile['instance_name']}' in zone: '{active_zone}' destroyed."
 
-    poll_with_spinner(
+    result = poll_with_spinner(
         compute_manager=compute_manager,
         op_name=op["name"],
         text=spinner_text,
@@ -202,3 +228,65 @@ def destroy_vm_instance(vm, images):
         scope="zone",
         zone=active_zone,
     )
+
+    # A reserved address is billed until it is released
+    if result["success"] and config_manager.active_profile.get("static_ip"):
+        release_static_ip(
+            compute_manager,
+            config_manager.active_profile,
+            config_manager.active_profile["region"],
+        )
+
+
+def _delete_parked_disk(config_manager, compute_manager) -> bool:
+    """Offer to delete the boot disk kept by the 'disk' park strategy, returns whether it was."""
+    profile = config_manager.active_profile
+    disk = compute_manager.get_disk(profile["instance_name"], zone=profile["zone"])
+    # A disk in use belongs to an instance, not to a parked VM
+    if not disk or disk.get("users"):
+        return False
+    if not click.confirm(
+        f"❓ Destroy parked boot disk: '{disk['name']}' in zone: '{profile['zone']}'?",
+        default=False,
+    ):
+        click.echo("❌ Aborted.")
+        return False
+
+    op = compute_manager.delete_disk(disk["name"], zone=profile["zone"])
+    result = poll_with_spinner(
+        compute_manager=compute_manager,
+        op_name=op["name"],
+        text=f"Destroying parked boot disk: '{disk['name']}' in zone: '{profile['zone']}'",
+        done_text=f"🗑️ Parked boot disk: '{disk['name']}' in zone: '{profile['zone']}' destroyed.",
+        scope="zone",
+        zone=profile["zone"],
+    )
+    return bool(result.get("success"))
+
+
+def _release_parked_static_ip(config_manager, compute_manager) -> bool:
+    """Offer to release the static IP of the active profile, returns whether it was."""
+    profile = config_manager.active_profile
+    if not profile.get("static_ip"):
+        return False
+    address_name = static_ip_name(profile)
+    if not compute_manager.get_address(address_name, profile["region"]):
+        return False
+    if not click.confirm(
+        f"❓ Release static IP: '{address_name}' in region: '{profile['region']}'?",
+        default=False,
+    ):
+        click.echo("❌ Aborted.")
+        return False
+    return release_static_ip(compute_manager, profile, profile["region"])
+
+
+def _release_static_ips(config_manager, compute_manager, instance_name: str, zone: str):
+    """Release the static IPs of profiles whose instance was destroyed in zone."""
+    region = "-".join(zone.split("-")[:-1])
+    for name, profile in config_manager.config.items():
+        if name == "active" or profile.get("instance_name") != instance_name:
+            continue
+        if not profile.get("static_ip"):
+            continue
+        release_static_ip(compute_manager, profile, region)
@@ -1,7 +1,9 @@
 import click
 import os
 import sys
+from vm_lifecycle.compute_manager import GCPComputeManager
 from vm_lifecycle.config_manager import ConfigManager
+from vm_lifecycle.machine_catalog import MachineTypeCatalog
 from vm_lifecycle.utils import (
     is_valid_profile_name,
     is_valid_instance_name,
@@ -10,7 +12,7 @@ from vm_lifecycle.utils import (
     select_from_list,
 )
 
-from vm_lifecycle.params import GCP_MACHINE_TYPES
+from vm_lifecycle.params import GCP_MACHINE_TYPES, PROFILE_OPTIONS
 
 
 @click.group(name="profile")
@@ -42,14 +44,24 @@ def create_profile():
         "instance_user": click.prompt(
             "Instance User", type=str, default=os.environ.get("USER")
         ),
-        "machine_type": click.prompt(
-            "Machine type",
-            type=click.Choice(GCP_MACHINE_TYPES),
-            default="e2-standard-4",
-        ),
-        "disk_size": click.prompt("Disk size", type=int, default=100),
     }
 
+    # Offer every machine type of the zone, too many to list in the prompt
+    machine_types = _zone_machine_types(
+        profile_config["project_id"], profile_config["zone"]
+    )
+    profile_config["machine_type"] = click.prompt(
+        "Machine type",
+        type=click.Choice(machine_types or GCP_MACHINE_TYPES),
+        default=(
+            "e2-standard-4"
+            if not machine_types or "e2-standard-4" in machine_types
+            else machine_types[0]
+        ),
+        show_choices=not machine_types,
+    )
+    profile_config["disk_size"] = click.prompt("Disk size", type=int, default=100)
+
     # Derive additional config
     profile_config["region"] = "-".join(profile_config["zone"].split("-")[:-1])
     profile_config["image_base_name"] = profile_config["instance_name"] + "-image"
@@ -82,6 +94,16 @@ def create_profile():
     click.echo(f"✅ Active profile set to: '{manager.get_active_profile()}'")
 
 
+def _zone_machine_types(project_id: str, zone: str):
+    """Machine types offered in zone, None if the catalog can not be fetched."""
+    try:
+        compute_manager = GCPComputeManager(project_id, zone)
+        return MachineTypeCatalog(compute_manager).machine_types(zone) or None
+    except Exception:
+        # No credentials or API access yet, fall back to the built-in list
+        return None
+
+
 @profile.command(name="show")
 def list_profiles():
     manager = ConfigManager()
@@ -173,3 +195,37 @@ def delete_profile(profile_name, delete_all):
         if selected:
             manager.delete_profile(selected)
             click.echo(f"\n🗑️ Deleted profile '{selected}'")
+
+
+@profile.command(name="option")
+@click.argument("key", required=False, type=click.Choice(list(PROFILE_OPTIONS)))
+@click.argument("value", required=False)
+def profile_option(key, value):
+    """Show or set optional settings of the active profile"""
+    manager = ConfigManager()
+
+    if not manager.active_profile:
+        click.echo(
+            f"❗ No active profile found in {manager.config_path}. Run 'vmlc profile create' to create a profile."
+        )
+        sys.exit(1)
+
+    if not key:
+        for name, option in PROFILE_OPTIONS.items():
+            current = manager.active_profile.get(name, option["default"])
+            click.echo(f"  {name}: {current}\t({option['help']})")
+        return
+
+    option = PROFILE_OPTIONS[key]
+    if value is None:
+        click.echo(f"{key}: {manager.active_profile.get(key, option['default'])}")
+        return
+
+    try:
+        converted = option["type"].convert(value, None, None)
+    except click.BadParameter as e:
+        click.echo(f"❌ Invalid value for '{key}': {e.message}")
+        sys.exit(1)
+
+    manager.set_profile_option(key, converted)
+    click.echo(f"✅ Set '{key}' to '{converted}' for profile: '{manager.active}'")
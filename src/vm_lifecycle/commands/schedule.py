@@ -0,0 +1,188 @@
+import click
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from vm_lifecycle.config_manager import ConfigManager
+from vm_lifecycle.params import PROFILE_ENV_VAR, SCHEDULE_ACTIONS, SYSTEMD_USER_DIR
+from vm_lifecycle.scheduler import (
+    action_command,
+    due_rules,
+    parse_cron,
+    write_systemd_units,
+)
+
+
+@click.group(name="schedule")
+def schedule():
+    """Scheduled start and stop Commands"""
+    pass
+
+
+def _active_manager() -> ConfigManager:
+    manager = ConfigManager()
+    if not manager.active_profile:
+        click.echo(
+            f"❗ No active profile found in {manager.config_path}. Run 'vmlc profile create' to create a profile."
+        )
+        sys.exit(1)
+    return manager
+
+
+@schedule.command(name="add")
+@click.argument("action", type=click.Choice(SCHEDULE_ACTIONS))
+@click.argument("cron")
+def add_schedule(action, cron):
+    """Run ACTION for the active profile on a cron schedule, e.g. "30 7 * * 1-5" """
+    manager = _active_manager()
+    try:
+        parse_cron(cron)
+    except ValueError as e:
+        click.echo(f"❌ Invalid cron expression: '{cron}': {e}")
+        sys.exit(1)
+
+    manager.add_schedule(action, cron)
+    click.echo(
+        f"✅ Scheduled 'vmlc {action}' at '{cron}' for profile: '{manager.active}'"
+    )
+    click.echo(
+        "💡 Run 'vmlc schedule install' to (re)generate systemd timers, or keep 'vmlc schedule agent' running"
+    )
+
+
+@schedule.command(name="show")
+@click.option(
+    "-a", "--all", "show_all", is_flag=True, help="Show rules of all profiles"
+)
+def show_schedules(show_all):
+    """List schedule rules of the active profile"""
+    manager = _active_manager()
+    schedules = (
+        manager.list_schedules()
+        if show_all
+        else {manager.active: manager.active_profile.get("schedules", [])}
+    )
+
+    if not any(schedules.values()):
+        click.echo("No schedule rules. Add one with 'vmlc schedule add'.")
+        return
+
+    for profile_name, rules in schedules.items():
+        click.echo(f"\n{profile_name}")
+        for index, rule in enumerate(rules, 1):
+            click.echo(f"  [{index}] {rule['action']}\t{rule['cron']}")
+
+
+@schedule.command(name="remove")
+@click.argument("index", type=click.IntRange(min=1))
+def remove_schedule(index):
+    """Remove the rule at INDEX, as listed by 'vmlc schedule show'"""
+    manager = _active_manager()
+    removed = manager.remove_schedule(index)
+    if not removed:
+        click.echo(f"❌ No schedule rule [{index}] for profile: '{manager.active}'")
+        sys.exit(1)
+    click.echo(
+        f"🗑️ Removed 'vmlc {removed['action']}' at '{removed['cron']}' for profile: '{manager.active}'"
+    )
+
+
+@schedule.command(name="install")
+@click.option(
+    "-e", "--enable", is_flag=True, help="Reload systemd and enable the timers."
+)
+def install_schedules(enable):
+    """Generate systemd user timers for the schedule rules of all profiles"""
+    manager = ConfigManager()
+    try:
+        timers, removed = write_systemd_units(
+            manager.list_schedules(), SYSTEMD_USER_DIR
+        )
+    except ValueError as e:
+        click.echo(f"❌ {e}. Use 'vmlc schedule agent' for this rule instead.")
+        sys.exit(1)
+
+    for timer in removed:
+        click.echo(f"🗑️ Removed timer: '{timer}'")
+    for timer in timers:
+        click.echo(f"✅ Wrote timer: '{timer}' to {SYSTEMD_USER_DIR}")
+
+    commands = [["systemctl", "--user", "daemon-reload"]]
+    if timers:
+        commands.append(["systemctl", "--user", "enable", "--now", *timers])
+
+    if not enable:
+        click.echo("💡 Enable the timers with:")
+        for command in commands:
+            click.echo(f"  {' '.join(command)}")
+        return
+
+    for command in commands:
+        result = subprocess.run(command, capture_output=True, text=True)
+        if result.returncode != 0:
+            click.echo(f"❗ Error running systemctl: {result.stderr.strip()}")
+            sys.exit(1)
+    click.echo(f"⏰ Enabled {len(timers)} timer{'s' if len(timers) != 1 else ''}")
+
+
+@schedule.command(name="agent")
+@click.option("--once", is_flag=True, help="Run the rules due this minute and exit.")
+def run_agent(once):
+    """Run the schedule rules of all profiles, checking every minute"""
+    running = []
+    last_minute = None
+
+    if not once:
+        click.echo("⏰ Schedule agent running, press Ctrl+C to stop")
+
+    try:
+        while True:
+            now = datetime.now().replace(second=0, microsecond=0)
+            if now != last_minute:
+                last_minute = now
+                # Reloaded every minute, so rule changes apply without a restart
+                for profile_name, action in due_rules(
+                    ConfigManager().list_schedules(), now
+                ):
+                    click.echo(
+                        f"▶️ {now:%Y-%m-%d %H:%M} Running 'vmlc {action}' for profile: '{profile_name}'"
+                    )
+                    running.append(
+                        (profile_name, action, _run_action(profile_name, action))
+                    )
+
+            if once:
+                for _, _, process in running:
+                    process.wait()
+            running = _reap(running)
+            if once:
+                return
+            time.sleep(60 - datetime.now().second)
+    except KeyboardInterrupt:
+        click.echo("\n❗ Schedule agent stopped.")
+
+
+def _run_action(profile_name: str, action: str) -> subprocess.Popen:
+    """Start a vmlc action for a profile in the background, without a terminal to prompt on."""
+    return subprocess.Popen(
+        action_command(action),
+        env={**os.environ, PROFILE_ENV_VAR: profile_name},
+        stdin=subprocess.DEVNULL,
+    )
+
+
+def _reap(running: list) -> list:
+    """Report finished actions and return the ones still running."""
+    still_running = []
+    for profile_name, action, process in running:
+        if process.poll() is None:
+            still_running.append((profile_name, action, process))
+        elif process.returncode == 0:
+            click.echo(f"✅ 'vmlc {action}' for profile: '{profile_name}' finished")
+        else:
+            click.echo(
+                f"❌ 'vmlc {action}' for profile: '{profile_name}' failed with exit code {process.returncode}"
+            )
+    return still_running
@@ -2,25 +2,109 @@ import click
 from googleapiclient.errors import HttpError
 import sys
 
-from vm_lifecycle.gcp_helpers import poll_with_spinner, init_gcp_context
+from vm_lifecycle.gcp_helpers import (
+    poll_with_spinner,
+    poll_many_with_spinner,
+    init_gcp_context,
+    prefetch,
+    record_timing,
+    wait_for_ready,
+    check_disk_type,
+    disk_settings,
+    prewarm_settings,
+    network_settings,
+    image_guest_os_features,
+    static_ip_settings,
+    release_static_ip,
+    error_message,
+    next_snapshot_seq,
+)
+from vm_lifecycle.params import (
+    MIGRATION_STRATEGIES,
+    DEFAULT_PARK_STRATEGY,
+    DEFAULT_COPY_IMAGE,
+    SNAPSHOT_SEQ_LABEL,
+)
+from vm_lifecycle.placement import is_stockout, fallback_zones, place_instance
+from vm_lifecycle.utils import region_in_storage_locations, is_interactive
 
 
 @click.command(name="start")
 @click.option(
     "-z", "--zone", help="GCP Zone override. Updates 'zone' for current profile."
 )
-def start_vm_instance(zone):
+@click.option(
+    "--strategy",
+    type=click.Choice(MIGRATION_STRATEGIES),
+    default=DEFAULT_PARK_STRATEGY,
+    help="Move the VM between zones with a full image, a disk snapshot or a machine image.",
+)
+@click.option(
+    "--race",
+    is_flag=True,
+    help="Restore in two zones of the region at once and keep the first instance that comes up.",
+)
+@click.option(
+    "-w",
+    "--wait-ready",
+    is_flag=True,
+    help="Return once the VM accepts SSH connections and its startup script finished.",
+)
+def start_vm_instance(zone, strategy, race, wait_ready):
     """Start a GCP VM instance from profile"""
     config_manager, compute_manager, active_zone = init_gcp_context(zone_override=zone)
 
     if not config_manager:
         return
 
-    # Check if instance exists
-    existing_instances = compute_manager.list_instances(
-        zone=config_manager.active_profile["zone"]
+    active_zone = start_instance(
+        config_manager, compute_manager, active_zone, strategy, race
     )
+
+    if wait_ready and not wait_for_ready(config_manager, compute_manager, active_zone):
+        sys.exit(1)
+
+
+def start_instance(
+    config_manager,
+    compute_manager,
+    active_zone: str,
+    strategy: str = DEFAULT_PARK_STRATEGY,
+    race: bool = False,
+) -> str:
+    """
+    Start, resume or restore the profile's instance in active_zone. Exits if it
+    can not be started, returns the zone the instance is running in.
+    """
+    # Look up the instance, a parked disk and the latest image, snapshot and
+    # machine image concurrently. Restore sources are discarded if the instance exists
+    instances_future = prefetch(
+        compute_manager.list_instances, zone=config_manager.active_profile["zone"]
+    )
+    image_future = prefetch(
+        compute_manager.get_latest_image_from_family,
+        family=config_manager.active_profile["image_base_name"],
+    )
+    snapshot_future = prefetch(
+        compute_manager.get_latest_snapshot_from_chain,
+        chain=config_manager.active_profile["image_base_name"],
+    )
+    machine_image_future = prefetch(
+        compute_manager.get_latest_machine_image,
+        base_name=config_manager.active_profile["image_base_name"],
+    )
+    disk_future = prefetch(
+        compute_manager.get_disk,
+        config_manager.active_profile["instance_name"],
+        zone=config_manager.active_profile["zone"],
+    )
+
+    # Check if instance exists
+    existing_instances = instances_future.result()
     instance_exists = False
+    instance_suspended = False
+    restored_from = None
+    result = None
     if existing_instances:
         for instance in existing_instances:
             if (
@@ -30,117 +114,515 @@ def start_vm_instance(zone):
                 click.echo(
                     f"❗ Instance: '{config_manager.active_profile['instance_name']}' is already running."
                 )
-                return
+                return config_manager.active_profile["zone"]
             elif (
                 instance["name"] == config_manager.active_profile["instance_name"]
                 and instance["status"] == "TERMINATED"
             ):
                 instance_exists = True
+            elif (
+                instance["name"] == config_manager.active_profile["instance_name"]
+                and instance["status"] == "SUSPENDED"
+            ):
+                instance_exists = True
+                instance_suspended = True
+            elif (
+                instance["name"] == config_manager.active_profile["instance_name"]
+                and instance["status"] == "SUSPENDING"
+            ):
+                click.echo(
+                    f"❗ Instance: '{config_manager.active_profile['instance_name']}' is being suspended. Start it again once it is suspended."
+                )
+                sys.exit(1)
+
+    if instance_suspended and active_zone != config_manager.active_profile["zone"]:
+        click.echo(
+            f"❗ Instance: '{config_manager.active_profile['instance_name']}' is suspended. Resume it, or stop it with 'vmlc stop --basic', before changing zone."
+        )
+        sys.exit(1)
 
+    # Resume suspended instance, memory state is restored
+    if instance_suspended:
+        spinner_text = f"Instance: '{config_manager.active_profile['instance_name']}' is suspended. Resuming Instance."
+        op = compute_manager.resume_instance(
+            instance_name=config_manager.active_profile["instance_name"],
+            zone=config_manager.active_profile["zone"],
+        )
     # Start instance if exists and not different zone
-    if instance_exists and active_zone == config_manager.active_profile["zone"]:
+    elif instance_exists and active_zone == config_manager.active_profile["zone"]:
         spinner_text = f"Instance: '{config_manager.active_profile['instance_name']}' exists. Starting Instance."
         op = compute_manager.start_instance(
             instance_name=config_manager.active_profile["instance_name"],
             zone=config_manager.active_profile["zone"],
         )
+        restored_from = "instance"
     # Create image from existing stopped instance, create new VM from image in new zone
     elif instance_exists and active_zone != config_manager.active_profile["zone"]:
-        # Create image from stopped instance
-        op = compute_manager.create_image_from_instance(
+        result = _migrate_instance(
+            config_manager, compute_manager, active_zone, strategy
+        )
+
+    # Reattach a boot disk kept by 'vmlc stop --strategy disk'
+    parked_disk = None
+    if not instance_exists and result is None:
+        try:
+            disk = disk_future.result()
+        except HttpError as e:
+            click.echo(f"❗ Error: {e}")
+            sys.exit(1)
+        if disk and not disk.get("users"):
+            parked_disk = disk["name"]
+
+    if parked_disk and active_zone == config_manager.active_profile["zone"]:
+        spinner_text = f"Creating instance from parked disk: '{parked_disk}'"
+        op = compute_manager.create_instance(
             instance_name=config_manager.active_profile["instance_name"],
-            image_name=config_manager.active_profile["image_base_name"],
-            family=config_manager.active_profile["image_base_name"],
-            zone=config_manager.active_profile["zone"],
+            machine_type=config_manager.active_profile["machine_type"],
+            disk_size=config_manager.active_profile["disk_size"],
+            instance_user=config_manager.active_profile["instance_user"],
+            zone=active_zone,
+            source_disk_name=parked_disk,
+            **network_settings(config_manager.active_profile),
+            **_static_ip(config_manager, compute_manager, active_zone),
         )
-        spinner_text = f"Creating image from instance: '{config_manager.active_profile['instance_name']}'"
-        # image_name = op["targetLink"].split("/")[-1]
-        # done_text = f"✅ Image: '{image_name}' created from instance: '{config_manager.active_profile['instance_name']}'"
+        restored_from = "disk"
+    # Disks are zonal, move it through an image or snapshot
+    elif parked_disk:
+        result = _migrate_instance(
+            config_manager, compute_manager, active_zone, strategy, parked_disk
+        )
+    # Restore from the most recent image or snapshot
+    elif not instance_exists and result is None:
+        kind, artifact = _latest_restore_source(
+            config_manager,
+            {
+                "image": image_future,
+                "snapshot": snapshot_future,
+                "machine-image": machine_image_future,
+            },
+        )
+        if kind != "machine-image" and not check_disk_type(
+            compute_manager, config_manager.active_profile, active_zone
+        ):
+            sys.exit(1)
+        if kind == "image":
+            artifact = _colocate_image(
+                config_manager, compute_manager, artifact, active_zone
+            )
+        spinner_text = f"Creating instance from {kind}: '{artifact['name']}'"
+        ip_settings = _static_ip(config_manager, compute_manager, active_zone)
+        if ip_settings and race:
+            click.echo(
+                "⚠️ A static IP can only be attached to one instance, not racing zones"
+            )
+            race = False
+
+        def restore_in_zone(target_zone: str):
+            return _create_from_artifact(
+                compute_manager,
+                config_manager.active_profile,
+                target_zone,
+                kind,
+                artifact["name"],
+                ip_settings,
+            )
+
+        machine_type = config_manager.active_profile["machine_type"]
+        if race:
+            placed, result = place_instance(
+                compute_manager,
+                restore_in_zone,
+                [active_zone]
+                + fallback_zones(compute_manager, active_zone, machine_type),
+                config_manager.active_profile["instance_name"],
+                machine_type,
+                spinner_text,
+                race=True,
+            )
+            active_zone = placed or active_zone
+        else:
+            op = restore_in_zone(active_zone)
+        restored_from = kind
+
+    if result is None:
+        done_text = f"✅ Instance: '{config_manager.active_profile['instance_name']}' created in zone: '{active_zone}'"
+
         result = poll_with_spinner(
             compute_manager=compute_manager,
             op_name=op["name"],
             text=spinner_text,
-            done_text=None,
-            scope="global",
+            done_text=done_text,
+            scope="zone",
+            zone=active_zone,
         )
 
-        if not result["success"]:
-            click.echo(f"❌ Failed to create image: {result['error']['message']}")
-            sys.exit(1)
+        # Images, snapshots and machine images are global, restore in another
+        # zone of the region when this one ran out of capacity
+        if (
+            restored_from in MIGRATION_STRATEGIES
+            and not result["success"]
+            and is_stockout(result.get("error"))
+        ):
+            click.echo(
+                f"⚠️ Zone: '{active_zone}' has no capacity for machine type: '{machine_type}'"
+            )
+            placed, result = place_instance(
+                compute_manager,
+                restore_in_zone,
+                fallback_zones(compute_manager, active_zone, machine_type),
+                config_manager.active_profile["instance_name"],
+                machine_type,
+                spinner_text,
+            )
+            active_zone = placed or active_zone
+
+    if not result["success"]:
+        click.echo(f"❌ Failed to start instance: {error_message(result)}")
+        sys.exit(1)
 
-        target_link = result.get("operation", {}).get("targetLink")
-        if not target_link:
-            click.echo("❌ Image creation did not return a targetLink.")
+    if restored_from:
+        record_timing(config_manager, "restore", restored_from, result)
+
+    if config_manager.update_active_zone_region(result["success"], zone=active_zone):
+        click.echo(
+            f"✅ Updated zone in profile: '{config_manager.active}' to '{active_zone}'"
+        )
+    return active_zone
+
+
+def _migrate_instance(
+    config_manager,
+    compute_manager,
+    target_zone: str,
+    strategy: str,
+    parked_disk: str = None,
+) -> dict:
+    """
+    Move a stopped instance, or a parked boot disk, to target_zone through an
+    image or a snapshot. Once it is READY the new instance is created from it
+    while the old instance or disk is deleted concurrently. If the new instance
+    fails, the instance is recreated in the original zone.
+    """
+    profile = config_manager.active_profile
+    source_zone = profile["zone"]
+    # Store the image next to where it is restored
+    target_region = "-".join(target_zone.split("-")[:-1])
+    source = (
+        f"disk: '{parked_disk}'"
+        if parked_disk
+        else f"instance: '{profile['instance_name']}'"
+    )
+
+    if parked_disk and strategy == "machine-image":
+        # A machine image needs an instance, the disk alone is moved as an image
+        click.echo(
+            f"⚠️ Disk: '{parked_disk}' has no instance, moving it with an image instead of a machine image"
+        )
+        strategy = "image"
+
+    # Fail before anything is created or deleted
+    if strategy != "machine-image" and not check_disk_type(
+        compute_manager, profile, target_zone
+    ):
+        sys.exit(1)
+
+    # Snapshots moving the VM count towards the chain 'vmlc stop' compacts
+    labels = None
+    if strategy == "snapshot":
+        labels = {
+            SNAPSHOT_SEQ_LABEL: str(next_snapshot_seq(config_manager, compute_manager))
+        }
+
+    if parked_disk and strategy == "snapshot":
+        op = compute_manager.create_snapshot_from_disk(
+            disk_name=parked_disk,
+            snapshot_name=profile["image_base_name"],
+            chain=profile["image_base_name"],
+            zone=source_zone,
+            labels=labels,
+        )
+    elif parked_disk:
+        op = compute_manager.create_image_from_disk(
+            disk_name=parked_disk,
+            image_name=profile["image_base_name"],
+            family=profile["image_base_name"],
+            zone=source_zone,
+            storage_location=target_region,
+            guest_os_features=image_guest_os_features(profile),
+        )
+    elif strategy == "snapshot":
+        op = compute_manager.create_snapshot_from_instance(
+            instance_name=profile["instance_name"],
+            snapshot_name=profile["image_base_name"],
+            chain=profile["image_base_name"],
+            zone=source_zone,
+            labels=labels,
+        )
+    elif strategy == "machine-image":
+        op = compute_manager.create_machine_image_from_instance(
+            instance_name=profile["instance_name"],
+            machine_image_name=profile["image_base_name"],
+            zone=source_zone,
+        )
+    else:
+        op = compute_manager.create_image_from_instance(
+            instance_name=profile["instance_name"],
+            image_name=profile["image_base_name"],
+            family=profile["image_base_name"],
+            zone=source_zone,
+            storage_location=target_region,
+            guest_os_features=image_guest_os_features(profile),
+        )
+    result = poll_with_spinner(
+        compute_manager=compute_manager,
+        op_name=op["name"],
+        text=f"Creating {strategy} from {source}",
+        done_text=f"✅ {strategy.title()} created from {source}",
+        scope="global",
+    )
+
+    if not result["success"]:
+        click.echo(f"❌ Failed to create {strategy}: {error_message(result)}")
+        sys.exit(1)
+    record_timing(config_manager, "park", strategy, result)
+
+    # The operation already names the new artifact, no need to query for it
+    target_link = result.get("operation", {}).get("targetLink")
+    if not target_link:
+        click.echo(f"❌ {strategy.title()} creation did not return a targetLink.")
+        sys.exit(1)
+    artifact_name = target_link.split("/")[-1]
+
+    # Reserved once the artifact is READY, a failed artifact leaves no billed address
+    ip_settings = _static_ip(config_manager, compute_manager, target_zone)
+
+    def issue_create():
+        return _create_from_artifact(
+            compute_manager, profile, target_zone, strategy, artifact_name, ip_settings
+        )
+
+    def issue_delete():
+        if parked_disk:
+            return compute_manager.delete_disk(parked_disk, zone=source_zone)
+        return compute_manager.delete_instance(
+            instance_name=profile["instance_name"],
+            zone=source_zone,
+        )
+
+    move_text = f"Moving instance: '{profile['instance_name']}' from zone: '{source_zone}' to zone: '{target_zone}'"
+    move_done_text = (
+        f"✅ Instance: '{profile['instance_name']}' moved to zone: '{target_zone}'"
+    )
+
+    if ip_settings and not parked_disk and target_region == profile["region"]:
+        # The stopped instance holds the static IP until it is deleted
+        delete_op = issue_delete()
+        (delete_result,) = poll_many_with_spinner(
+            compute_manager=compute_manager,
+            operations=[
+                {"op_name": delete_op["name"], "scope": "zone", "zone": source_zone}
+            ],
+            text=f"Releasing static IP held by instance: '{profile['instance_name']}'",
+        )
+        if not delete_result["success"]:
+            click.echo(
+                f"❌ Failed to destroy VM instance: '{profile['instance_name']}' in zone: '{source_zone}'"
+            )
             sys.exit(1)
+        create_op = issue_create()
+        (create_result,) = poll_many_with_spinner(
+            compute_manager=compute_manager,
+            operations=[
+                {"op_name": create_op["name"], "scope": "zone", "zone": target_zone}
+            ],
+            text=move_text,
+            done_text=move_done_text,
+        )
+    else:
+        # Insert is issued first so a rejected request never deletes the original
+        create_op = issue_create()
+        delete_op = issue_delete()
+
+        create_result, delete_result = poll_many_with_spinner(
+            compute_manager=compute_manager,
+            operations=[
+                {"op_name": create_op["name"], "scope": "zone", "zone": target_zone},
+                {"op_name": delete_op["name"], "scope": "zone", "zone": source_zone},
+            ],
+            text=move_text,
+            done_text=move_done_text,
+        )
 
-        image_name = target_link.split("/")[-1]
-        done_text = f"✅ Image: '{image_name}' created from instance: '{config_manager.active_profile['instance_name']}'"
-        click.echo(done_text)
+    source_text = (
+        f"Disk: '{parked_disk}'"
+        if parked_disk
+        else f"VM instance: '{profile['instance_name']}'"
+    )
+    if delete_result["success"]:
+        click.echo(f"🗑️ {source_text} in zone: '{source_zone}' destroyed.")
+    else:
+        click.echo(f"⚠️ Failed to destroy {source_text} in zone: '{source_zone}'")
 
-        # Destroy redundant instance
-        op = compute_manager.delete_instance(
-            instance_name=config_manager.active_profile["instance_name"],
-            zone=config_manager.active_profile["zone"],
+    if create_result["success"]:
+        record_timing(config_manager, "restore", strategy, create_result)
+        click.echo(
+            f"✅ Instance: '{profile['instance_name']}' created in zone: '{target_zone}' from {strategy}: '{artifact_name}'"
         )
+        # Addresses are regional, the one in the old region is no longer used
+        if ip_settings and target_region != profile["region"]:
+            release_static_ip(compute_manager, profile, profile["region"])
+        return create_result
 
-        spinner_text = f"Destroying VM instance: {config_manager.active_profile['instance_name']} in zone: '{config_manager.active_profile['zone']}'"
-        done_text = f"🗑️ VM instance: '{config_manager.active_profile['instance_name']}' in zone: '{active_zone}' destroyed."
+    # Nothing uses the address reserved in the new region
+    if ip_settings and target_region != profile["region"]:
+        release_static_ip(compute_manager, profile, target_region)
 
-        poll_with_spinner(
+    # The original is gone, roll back into the original zone from the image
+    # that was just created before anything else can fail
+    rollback = None
+    if delete_result["success"]:
+        op = _create_from_artifact(
+            compute_manager,
+            profile,
+            source_zone,
+            strategy,
+            artifact_name,
+            _static_ip(config_manager, compute_manager, source_zone),
+        )
+        rollback = poll_with_spinner(
             compute_manager=compute_manager,
             op_name=op["name"],
-            text=spinner_text,
-            done_text=done_text,
+            text=f"Restoring instance: '{profile['instance_name']}' in zone: '{source_zone}'",
+            done_text=f"↩️ Instance: '{profile['instance_name']}' restored in zone: '{source_zone}'",
             scope="zone",
-            zone=config_manager.active_profile["zone"],
+            zone=source_zone,
+        )
+
+    click.echo(
+        f"❌ Failed to create instance in zone: '{target_zone}': {error_message(create_result)}"
+    )
+    if rollback is not None and not rollback["success"]:
+        click.echo(
+            f"❌ Failed to restore instance, start it later from {strategy}: '{artifact_name}'"
         )
+    sys.exit(1)
+
+
+def _static_ip(config_manager, compute_manager, zone: str) -> dict:
+    """create_instance kwargs for the profile's static IP in the region of zone."""
+    region = "-".join(zone.split("-")[:-1])
+    ip_settings = static_ip_settings(
+        compute_manager, config_manager.active_profile, region
+    )
+    if ip_settings is None:
+        sys.exit(1)
+    return ip_settings
 
-        # Set flag to create from image
-        instance_exists = False
 
-    # Get latest image
-    if not instance_exists:
+def _latest_restore_source(config_manager, futures: dict):
+    """Return (kind, artifact) for the newest of the latest artifact of each kind."""
+    candidates = []
+    for kind, future in futures.items():
         try:
-            latest_image = compute_manager.get_latest_image_from_family(
-                family=config_manager.active_profile["image_base_name"]
-            )
-            if not latest_image:
-                click.echo(
-                    f"❌ No image found for family: '{config_manager.active_profile['image_base_name']}'"
-                )
-                sys.exit(1)
+            artifact = future.result()
         except HttpError as e:
+            # An empty family or chain is not an error, the other may exist
+            if e.resp.status == 404:
+                continue
             click.echo(f"❗ Error: {e}")
             sys.exit(1)
+        if artifact:
+            candidates.append((kind, artifact))
 
-    # Create instance from image
-    if not instance_exists and latest_image:
-        spinner_text = f"Creating instance from image: '{latest_image['name']}'"
-        op = compute_manager.create_instance(
-            instance_name=config_manager.active_profile["instance_name"],
-            machine_type=config_manager.active_profile["machine_type"],
-            disk_size=config_manager.active_profile["disk_size"],
-            instance_user=config_manager.active_profile["instance_user"],
-            zone=active_zone,
-            custom_image_name=latest_image["name"],
+    if not candidates:
+        click.echo(
+            f"❌ No image found for family: '{config_manager.active_profile['image_base_name']}'"
         )
+        sys.exit(1)
+
+    return max(candidates, key=lambda c: c[1].get("creationTimestamp", ""))
 
-    done_text = f"✅ Instance: '{config_manager.active_profile['instance_name']}' created in zone: '{active_zone}'"
 
+def _colocate_image(config_manager, compute_manager, image: dict, zone: str) -> dict:
+    """
+    Warn when the image is stored outside the region of the target zone, and
+    copy it into that region before restoring as the profile 'copy_image' option
+    says. Returns the image to use.
+    """
+    region = "-".join(zone.split("-")[:-1])
+    storage_locations = image.get("storageLocations", [])
+    if not storage_locations or region_in_storage_locations(region, storage_locations):
+        return image
+
+    click.echo(
+        f"⚠️ Image: '{image['name']}' is stored in: '{', '.join(storage_locations)}', outside region: '{region}'. Restoring reads it across regions."
+    )
+    copy_image = config_manager.active_profile.get("copy_image", DEFAULT_COPY_IMAGE)
+    if copy_image == "never":
+        return image
+    if copy_image == "ask":
+        # Scheduled starts have no one to answer, restore across regions
+        if not is_interactive():
+            click.echo(
+                "💡 Copy it automatically with 'vmlc profile option copy_image always'"
+            )
+            return image
+        if not click.confirm(
+            f"❓ Copy the image to region: '{region}' first?", default=False
+        ):
+            return image
+
+    op = compute_manager.copy_image(
+        source_image_name=image["name"],
+        image_name=config_manager.active_profile["image_base_name"],
+        storage_location=region,
+        family=config_manager.active_profile["image_base_name"],
+    )
     result = poll_with_spinner(
         compute_manager=compute_manager,
         op_name=op["name"],
-        text=spinner_text,
-        done_text=done_text,
-        scope="zone",
-        zone=active_zone,
+        text=f"Copying image: '{image['name']}' to region: '{region}'",
+        done_text=f"✅ Image: '{image['name']}' copied to region: '{region}'",
+        scope="global",
     )
-
     if not result["success"]:
-        click.echo(f"❌ Failed to start instance: {result['error']['message']}")
-        sys.exit(1)
+        click.echo(f"❌ Failed to copy image, restoring from: '{image['name']}'")
+        return image
 
-    if config_manager.update_active_zone_region(result["success"], zone=active_zone):
-        click.echo(
-            f"✅ Updated zone in profile: '{config_manager.active}' to '{active_zone}'"
+    # The copy is the newest in the family, the original is pruned on the next park
+    return {"name": result["operation"]["targetLink"].split("/")[-1]}
+
+
+def _create_from_artifact(
+    compute_manager, profile, zone: str, kind: str, name: str, ip_settings: dict = None
+):
+    """Issue the insert for an instance restored from an image, snapshot or machine image."""
+    if kind == "machine-image":
+        network = network_settings(profile) if ip_settings else {}
+        # One insert, the rest of the instance body is stored in the machine image
+        return compute_manager.create_instance_from_machine_image(
+            instance_name=profile["instance_name"],
+            machine_image_name=name,
+            machine_type=profile["machine_type"],
+            zone=zone,
+            **{k: v for k, v in network.items() if k != "tier1_networking"},
+            **(ip_settings or {}),
         )
+    return compute_manager.create_instance(
+        instance_name=profile["instance_name"],
+        machine_type=profile["machine_type"],
+        disk_size=profile["disk_size"],
+        instance_user=profile["instance_user"],
+        zone=zone,
+        **_restore_kwargs(kind, name),
+        **disk_settings(profile),
+        **network_settings(profile),
+        **prewarm_settings(profile),
+        **(ip_settings or {}),
+    )
+
+
+def _restore_kwargs(kind: str, name: str) -> dict:
+    if kind == "snapshot":
+        return {"source_snapshot_name": name}
+    return {"custom_image_name": name}
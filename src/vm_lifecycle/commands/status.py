@@ -3,19 +3,64 @@ import subprocess
 import sys
 
 from vm_lifecycle.gcp_helpers import init_gcp_context
+from vm_lifecycle.params import PREWARM_GUEST_ATTRIBUTE
+from vm_lifecycle.timing_manager import TimingManager
 
 
 @click.command(name="status")
 @click.option(
     "-i", "--images", is_flag=True, help="Retrieve list of images for active project."
 )
-def gcp_vm_instance_status(images):
+@click.option(
+    "-t",
+    "--timings",
+    is_flag=True,
+    help="Show recorded park and restore durations for the active profile.",
+)
+@click.option(
+    "-p",
+    "--prewarm",
+    is_flag=True,
+    help="Show the progress of the disk pre-warm after a restore.",
+)
+def gcp_vm_instance_status(images, timings, prewarm):
     """List GCP Compute Engine instance resources"""
 
     config_manager, compute_manager, active_zone = init_gcp_context()
     if not config_manager:
         sys.exit(1)
 
+    if prewarm:
+        instance_name = config_manager.active_profile["instance_name"]
+        state = compute_manager.get_guest_attribute(
+            instance_name, PREWARM_GUEST_ATTRIBUTE, zone=active_zone
+        )
+        if not state:
+            click.echo(f"❗ No disk pre-warm reported by instance: '{instance_name}'")
+            sys.exit(1)
+        if state.startswith("done"):
+            click.echo(
+                f"✅ Disk pre-warm of instance: '{instance_name}' finished in {state.split()[-1]}"
+            )
+        else:
+            click.echo(f"🔥 Disk pre-warm of instance: '{instance_name}' is {state}")
+        sys.exit(0)
+
+    if timings:
+        summary = TimingManager().summary(config_manager.active)
+        if not summary:
+            click.echo(f"❗ No timings recorded for profile: '{config_manager.active}'")
+            sys.exit(1)
+        click.echo(f"⏱️ Operation timings for profile: '{config_manager.active}':")
+        for action, strategies in summary.items():
+            for strategy, stats in sorted(
+                strategies.items(), key=lambda s: s[1]["mean"]
+            ):
+                click.echo(
+                    f"\t{action:<8}{strategy:<15}mean: {stats['mean']}s, last: {stats['last']}s ({stats['count']} run{'s' if stats['count'] > 1 else ''})"
+                )
+        sys.exit(0)
+
     if not images:
         subprocess.run(
             [
@@ -1,7 +1,28 @@
 import click
 import sys
 
-from vm_lifecycle.gcp_helpers import poll_with_spinner, init_gcp_context
+from googleapiclient.errors import HttpError
+
+from vm_lifecycle.commands.connect import ssh_host_alias
+from vm_lifecycle.gcp_helpers import (
+    poll_with_spinner,
+    init_gcp_context,
+    prefetch,
+    record_timing,
+    image_guest_os_features,
+    next_snapshot_seq,
+)
+from vm_lifecycle.params import (
+    PARK_STRATEGIES,
+    DEFAULT_PARK_STRATEGY,
+    DEFAULT_SNAPSHOT_CHAIN_LIMIT,
+    SNAPSHOT_SEQ_LABEL,
+    DIRTY_GUEST_ATTRIBUTE,
+    DEFAULT_DISK_TYPE,
+    DISK_GB_MONTH_PRICE,
+)
+from vm_lifecycle.timing_manager import TimingManager
+from vm_lifecycle.vscode_server import bake_vscode_server
 
 
 @click.command(name="stop")
@@ -12,7 +33,24 @@ from vm_lifecycle.gcp_helpers import poll_with_spinner, init_gcp_context
     is_flag=True,
     help="Only shut down the VM instance. No images will will be created, no instances will be destroyed",
 )
-def stop_vm_instance(keep, basic):
+@click.option(
+    "--strategy",
+    type=click.Choice(PARK_STRATEGIES),
+    help="Park the VM as a full image, an incremental disk snapshot, a machine image, or keep the boot disk. Defaults to the profile 'park_strategy'.",
+)
+@click.option(
+    "-s",
+    "--suspend",
+    is_flag=True,
+    help="Suspend the VM instance, memory state is kept. Resume with 'vmlc start'.",
+)
+@click.option(
+    "-f",
+    "--force",
+    is_flag=True,
+    help="Create an image even if the boot disk has not changed since the last one.",
+)
+def stop_vm_instance(keep, basic, strategy, suspend, force):
     """Stop VM instance, create image of instance, delete instance"""
     config_manager, compute_manager, active_zone = init_gcp_context()
     if not config_manager:
@@ -23,6 +61,7 @@ def stop_vm_instance(keep, basic):
 
     instance_exists = False
     instance_running = False
+    instance_suspended = False
     if existing_instances:
         for instance in existing_instances:
             if (
@@ -39,6 +78,100 @@ def stop_vm_instance(keep, basic):
                 instance_exists = True
                 instance_running = False
                 break
+            elif (
+                instance["name"] == config_manager.active_profile["instance_name"]
+                and instance["status"] == "SUSPENDED"
+            ):
+                # A suspended instance can be stopped directly, memory is discarded
+                instance_exists = True
+                instance_running = True
+                instance_suspended = True
+                break
+            elif (
+                instance["name"] == config_manager.active_profile["instance_name"]
+                and instance["status"] == "SUSPENDING"
+            ):
+                if suspend:
+                    click.echo(
+                        f"❗ Instance: '{config_manager.active_profile['instance_name']}' is already being suspended."
+                    )
+                    return
+                click.echo(
+                    f"❗ Instance: '{config_manager.active_profile['instance_name']}' is being suspended. Stop it again once it is suspended."
+                )
+                sys.exit(1)
+
+    # Suspend keeps memory and disk, nothing is parked or deleted
+    if suspend:
+        if not instance_exists:
+            click.echo(
+                f"❗ No instance named: '{config_manager.active_profile['instance_name']}' found"
+            )
+            sys.exit(1)
+        elif instance_suspended:
+            click.echo(
+                f"❗ Instance: '{config_manager.active_profile['instance_name']}' is already suspended."
+            )
+            return
+        elif not instance_running:
+            click.echo(
+                f"❗ Instance: '{config_manager.active_profile['instance_name']}' found, but not running. Nothing to suspend"
+            )
+            sys.exit(1)
+
+        op = compute_manager.suspend_instance(
+            instance_name=config_manager.active_profile["instance_name"],
+            zone=active_zone,
+        )
+
+        result = poll_with_spinner(
+            compute_manager=compute_manager,
+            op_name=op["name"],
+            text=f"Suspending instance: '{config_manager.active_profile['instance_name']}' in zone: '{active_zone}'",
+            done_text=f"💤 Instance: '{config_manager.active_profile['instance_name']}' in zone: '{active_zone}' suspended",
+            scope="zone",
+            zone=active_zone,
+        )
+
+        if not result or not result.get("success"):
+            click.echo(
+                f"❌ Failed to suspend instance: {result.get('error', {}).get('message', 'Unknown error')}"
+            )
+            sys.exit(1)
+        return
+
+    strategy = strategy or config_manager.active_profile.get(
+        "park_strategy", DEFAULT_PARK_STRATEGY
+    )
+
+    # Bake the server of the local VS Code into the disk that is parked
+    baked = None
+    if (
+        not basic
+        and instance_running
+        and not instance_suspended
+        and config_manager.active_profile.get("vscode_server", False)
+    ):
+        baked = bake_vscode_server(
+            ssh_host_alias(config_manager.active_profile, active_zone)
+        )
+
+    # The guest can only report changes while it is running
+    dirty = None
+    if baked == "installed":
+        dirty = "true"
+    elif (
+        not basic
+        and not force
+        and strategy == "image"
+        and instance_running
+        and not instance_suspended
+    ):
+        dirty = compute_manager.get_guest_attribute(
+            config_manager.active_profile["instance_name"],
+            DIRTY_GUEST_ATTRIBUTE,
+            zone=active_zone,
+        )
 
     # Stop the instance if it's running
     if instance_exists and instance_running:
@@ -76,13 +209,42 @@ def stop_vm_instance(keep, basic):
         # Unreachable
         pass
 
-    if not basic:
+    compact_chain = False
+    if not basic and strategy == "snapshot":
+        seq = next_snapshot_seq(config_manager, compute_manager)
+        limit = config_manager.active_profile.get(
+            "snapshot_chain_limit", DEFAULT_SNAPSHOT_CHAIN_LIMIT
+        )
+        if seq > limit:
+            # Fold the incremental chain back into a full image
+            click.echo(
+                f"♻️ {limit} snapshot park{'s' if limit > 1 else ''} since the last image, compacting into an image"
+            )
+            strategy = "image"
+            compact_chain = True
+        else:
+            _park_snapshot(config_manager, compute_manager, active_zone, seq)
+
+    unchanged_image = None
+    if not basic and not force and not compact_chain and strategy == "image":
+        unchanged_image = _unchanged_since_image(
+            config_manager, compute_manager, active_zone, dirty
+        )
+        if unchanged_image:
+            click.echo(
+                f"💤 Boot disk unchanged since image: '{unchanged_image['name']}', skipping image creation"
+            )
+
+    if not basic and strategy == "image" and not unchanged_image:
         # Create an image from the stopped instance
         op = compute_manager.create_image_from_instance(
             instance_name=config_manager.active_profile["instance_name"],
             image_name=config_manager.active_profile["image_base_name"],
             family=config_manager.active_profile["image_base_name"],
             zone=active_zone,
+            storage_location=config_manager.active_profile.get("image_storage_location")
+            or config_manager.active_profile["region"],
+            guest_os_features=image_guest_os_features(config_manager.active_profile),
         )
 
         spinner_text = f"Creating image from instance: '{config_manager.active_profile['instance_name']}'"
@@ -110,6 +272,7 @@ def stop_vm_instance(keep, basic):
                 f"❌ Failed to create image: {result.get('error', {}).get('message', 'Unknown error')}"
             )
             sys.exit(1)
+        record_timing(config_manager, "park", "image", result)
 
         # Delete dangling images
         dangling_images = compute_manager.get_dangling_images(
@@ -139,8 +302,37 @@ def stop_vm_instance(keep, basic):
                     )
                     sys.exit(1)
 
+        # The new image supersedes every snapshot in the chain
+        if compact_chain:
+            _delete_snapshots(
+                compute_manager,
+                [
+                    snap["name"]
+                    for snap in compute_manager.list_snapshots(
+                        chain=config_manager.active_profile["image_base_name"]
+                    )
+                ],
+            )
+
+    if not basic and strategy == "machine-image":
+        _park_machine_image(config_manager, compute_manager, active_zone)
+
+    # Keep the boot disk when the instance is deleted
+    if not keep and not basic and strategy == "disk":
+        _park_disk(config_manager, compute_manager, active_zone)
+
+    # The stopped instance matches the new image, keep it as a standby
+    standby = (
+        not keep
+        and not basic
+        and strategy == "image"
+        and config_manager.active_profile.get("standby", False)
+    )
+    if standby:
+        _report_standby(config_manager, active_zone)
+
     # Delete Compute Engine Instance
-    if not keep and not basic:
+    if not keep and not basic and not standby:
         op = compute_manager.delete_instance(
             instance_name=config_manager.active_profile["instance_name"],
             zone=active_zone,
@@ -163,3 +355,210 @@ def stop_vm_instance(keep, basic):
                 f"❌ Failed to delete instance: {result.get('error', {}).get('message', 'Unknown error')}"
             )
             sys.exit(1)
+
+
+def _park_snapshot(config_manager, compute_manager, active_zone: str, seq: int):
+    """
+    Snapshot the boot disk of the stopped instance. Older snapshots are kept as
+    restore points until the chain is compacted into an image.
+    """
+    chain = config_manager.active_profile["image_base_name"]
+
+    op = compute_manager.create_snapshot_from_instance(
+        instance_name=config_manager.active_profile["instance_name"],
+        snapshot_name=chain,
+        chain=chain,
+        zone=active_zone,
+        labels={SNAPSHOT_SEQ_LABEL: str(seq)},
+    )
+
+    spinner_text = f"Creating snapshot from instance: '{config_manager.active_profile['instance_name']}'"
+    snapshot_name = op["targetLink"].split("/")[-1] if "targetLink" in op else "unknown"
+    done_text = f"✅ Snapshot: '{snapshot_name}' created from instance: '{config_manager.active_profile['instance_name']}'"
+
+    result = poll_with_spinner(
+        compute_manager=compute_manager,
+        op_name=op["name"],
+        text=spinner_text,
+        done_text=done_text,
+        scope="global",
+    )
+
+    if not result or not result.get("success"):
+        click.echo(
+            f"❌ Failed to create snapshot: {result.get('error', {}).get('message', 'Unknown error')}"
+        )
+        sys.exit(1)
+    record_timing(config_manager, "park", "snapshot", result)
+
+
+def _park_disk(config_manager, compute_manager, active_zone: str):
+    """Flip auto-delete off on the boot disk so it survives instance deletion."""
+    op = compute_manager.set_boot_disk_auto_delete(
+        instance_name=config_manager.active_profile["instance_name"],
+        auto_delete=False,
+        zone=active_zone,
+    )
+
+    result = poll_with_spinner(
+        compute_manager=compute_manager,
+        op_name=op["name"],
+        text=f"Keeping boot disk of instance: '{config_manager.active_profile['instance_name']}'",
+        done_text=f"💾 Boot disk of instance: '{config_manager.active_profile['instance_name']}' will be kept",
+        scope="zone",
+        zone=active_zone,
+    )
+
+    if not result or not result.get("success"):
+        click.echo(
+            f"❌ Failed to keep boot disk: {result.get('error', {}).get('message', 'Unknown error')}"
+        )
+        sys.exit(1)
+    record_timing(config_manager, "park", "disk", result)
+
+
+def _park_machine_image(config_manager, compute_manager, active_zone: str):
+    """Capture the stopped instance, configuration included, and prune older machine images."""
+    base_name = config_manager.active_profile["image_base_name"]
+
+    op = compute_manager.create_machine_image_from_instance(
+        instance_name=config_manager.active_profile["instance_name"],
+        machine_image_name=base_name,
+        zone=active_zone,
+    )
+
+    spinner_text = f"Creating machine image from instance: '{config_manager.active_profile['instance_name']}'"
+    machine_image_name = (
+        op["targetLink"].split("/")[-1] if "targetLink" in op else "unknown"
+    )
+    done_text = f"✅ Machine image: '{machine_image_name}' created from instance: '{config_manager.active_profile['instance_name']}'"
+
+    result = poll_with_spinner(
+        compute_manager=compute_manager,
+        op_name=op["name"],
+        text=spinner_text,
+        done_text=done_text,
+        scope="global",
+    )
+
+    if not result or not result.get("success"):
+        click.echo(
+            f"❌ Failed to create machine image: {result.get('error', {}).get('message', 'Unknown error')}"
+        )
+        sys.exit(1)
+    record_timing(config_manager, "park", "machine-image", result)
+
+    dangling = compute_manager.get_dangling_machine_images(base_name)
+    if dangling:
+        click.echo(
+            f"🗑️ Destroying {len(dangling)} dangling machine image{'s' if len(dangling) > 1 else ''}:"
+        )
+    for machine_image in dangling:
+        op = compute_manager.delete_machine_image(machine_image)
+
+        result = poll_with_spinner(
+            compute_manager=compute_manager,
+            op_name=op["name"],
+            text=f"Destroying machine image: '{machine_image}'",
+            done_text=f"🗑️ Machine image: '{machine_image}' destroyed",
+            scope="global",
+        )
+
+        if not result or not result.get("success"):
+            click.echo(
+                f"❌ Failed to delete machine image: {result.get('error', {}).get('message', 'Unknown error')}"
+            )
+            sys.exit(1)
+
+
+def _report_standby(config_manager, active_zone: str):
+    """Print what the standby instance costs while parked and the start time it saves."""
+    profile = config_manager.active_profile
+    disk_type = profile.get("disk_type", DEFAULT_DISK_TYPE)
+    monthly = profile["disk_size"] * DISK_GB_MONTH_PRICE.get(disk_type, 0)
+
+    click.echo(
+        f"🛌 Instance: '{profile['instance_name']}' kept stopped in zone: '{active_zone}' as standby, 'vmlc start' boots it without restoring the image"
+    )
+    click.echo(
+        f"💰 Standby disk: {profile['disk_size']} GB {disk_type}, about ${monthly:.2f}/month while parked"
+    )
+
+    restores = TimingManager().summary(config_manager.active).get("restore", {})
+    if "instance" in restores and "image" in restores:
+        saved = restores["image"]["mean"] - restores["instance"]["mean"]
+        click.echo(
+            f"⚡ Starting the standby took {restores['instance']['mean']}s on average, restoring from an image {restores['image']['mean']}s ({saved:.1f}s saved)"
+        )
+
+
+def _unchanged_since_image(config_manager, compute_manager, active_zone: str, dirty):
+    """
+    Return the latest family image if the boot disk has not changed since it was
+    created, otherwise None. The disk must be the source of the image, or be
+    restored from it, and must not have been attached or started since. A
+    'false' dirty marker reported by the guest overrides the timestamps.
+    """
+    if dirty == "true":
+        return None
+
+    image_future = prefetch(
+        compute_manager.get_latest_image_from_family,
+        config_manager.active_profile["image_base_name"],
+    )
+    instance = compute_manager.get_instance(
+        config_manager.active_profile["instance_name"], zone=active_zone
+    )
+    boot_disk = next((d for d in instance.get("disks", []) if d.get("boot")), None)
+    if not boot_disk:
+        return None
+    disk = compute_manager.get_disk(
+        boot_disk["source"].split("/")[-1], zone=active_zone
+    )
+    try:
+        latest_image = image_future.result()
+    except HttpError:
+        return None
+
+    if not latest_image or not disk:
+        return None
+    if latest_image.get("sourceDiskId") != disk.get("id") and disk.get(
+        "sourceImageId"
+    ) != latest_image.get("id"):
+        return None
+
+    if dirty == "false":
+        return latest_image
+
+    # RFC 3339 timestamps from the API share a format, compare them as strings
+    last_used = max(
+        disk.get("lastAttachTimestamp", ""),
+        disk.get("lastDetachTimestamp", ""),
+        instance.get("lastStartTimestamp", ""),
+    )
+    if last_used and last_used < latest_image.get("creationTimestamp", ""):
+        return latest_image
+    return None
+
+
+def _delete_snapshots(compute_manager, snapshots: list):
+    if snapshots:
+        click.echo(
+            f"🗑️ Destroying {len(snapshots)} dangling snapshot{'s' if len(snapshots) > 1 else ''}:"
+        )
+    for snapshot in snapshots:
+        op = compute_manager.delete_snapshot(snapshot)
+
+        result = poll_with_spinner(
+            compute_manager=compute_manager,
+            op_name=op["name"],
+            text=f"Destroying snapshot: '{snapshot}'",
+            done_text=f"🗑️ Snapshot: '{snapshot}' destroyed",
+            scope="global",
+        )
+
+        if not result or not result.get("success"):
+            click.echo(
+                f"❌ Failed to delete snapshot: {result.get('error', {}).get('message', 'Unknown error')}"
+            )
+            sys.exit(1)
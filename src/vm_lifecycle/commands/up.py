@@ -0,0 +1,85 @@
+import click
+import sys
+
+from vm_lifecycle.commands.connect import (
+    launch_vscode,
+    ssh_host_alias,
+    write_ssh_host,
+)
+from vm_lifecycle.commands.start import start_instance
+from vm_lifecycle.gcp_helpers import init_gcp_context, wait_for_ready
+from vm_lifecycle.params import (
+    GCLOUD_SSH_KEY_PATH,
+    MIGRATION_STRATEGIES,
+    DEFAULT_PARK_STRATEGY,
+)
+from vm_lifecycle.readiness import external_ip
+from vm_lifecycle.utils import create_vm_ssh_connection
+
+
+@click.command(name="up")
+@click.option(
+    "-z", "--zone", help="GCP Zone override. Updates 'zone' for current profile."
+)
+@click.option(
+    "--strategy",
+    type=click.Choice(MIGRATION_STRATEGIES),
+    default=DEFAULT_PARK_STRATEGY,
+    help="Move the VM between zones with a full image, a disk snapshot or a machine image.",
+)
+@click.option(
+    "--race",
+    is_flag=True,
+    help="Restore in two zones of the region at once and keep the first instance that comes up.",
+)
+@click.option("-p", "--path", type=click.Path(), help="Path to Open VS Code on VM")
+@click.option(
+    "-w",
+    "--warm",
+    is_flag=True,
+    help="Open the shared SSH connection in the background while VS Code starts.",
+)
+def vm_up(zone, strategy, race, path, warm):
+    """Start the VM from profile and open VS Code once it accepts SSH connections"""
+    config_manager, compute_manager, active_zone = init_gcp_context(zone_override=zone)
+    if not config_manager:
+        sys.exit(1)
+
+    active_zone = start_instance(
+        config_manager, compute_manager, active_zone, strategy, race
+    )
+    profile = config_manager.active_profile
+    host = ssh_host_alias(profile, active_zone)
+
+    # The SSH entry is written as soon as the IP is known, while sshd starts
+    prepared = {}
+
+    def prepare_ssh_host(instance: dict):
+        if GCLOUD_SSH_KEY_PATH.exists():
+            prepared["ip"] = external_ip(instance)
+            prepared["updated"] = write_ssh_host(
+                compute_manager, host, instance, profile, echo=False
+            )
+
+    if not wait_for_ready(
+        config_manager,
+        compute_manager,
+        active_zone,
+        on_external_ip=prepare_ssh_host,
+        # VS Code only needs sshd, the startup script finishes in the background
+        startup_script=False,
+    ):
+        sys.exit(1)
+
+    managed = bool(prepared)
+    if prepared.get("updated"):
+        click.echo(f"✅ Updated SSH host: {host} ({prepared['ip']})")
+    elif not managed:
+        # No gcloud key yet, let gcloud generate the config
+        create_vm_ssh_connection(
+            project_id=profile["project_id"],
+            instance_name=profile["instance_name"],
+            zone=active_zone,
+        )
+
+    launch_vscode(profile, host, path, warm, managed)
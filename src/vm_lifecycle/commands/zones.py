@@ -0,0 +1,94 @@
+import click
+import sys
+from googleapiclient.errors import HttpError
+
+from vm_lifecycle.gcp_helpers import init_gcp_context
+from vm_lifecycle.latency_probe import fetch_region_endpoints, probe_regions
+from vm_lifecycle.utils import spinner
+
+
+@click.group(name="zones")
+def zones():
+    """GCP zone selection Commands"""
+    pass
+
+
+@zones.command(name="probe")
+@click.option(
+    "-a", "--apply", is_flag=True, help="Set the lowest latency zone on the profile."
+)
+@click.option(
+    "-n", "--top", default=5, show_default=True, help="Number of regions to show."
+)
+def probe_zones(apply, top):
+    """Rank zones offering the profile machine type by latency from this machine"""
+    config_manager, compute_manager, active_zone = init_gcp_context()
+    if not config_manager:
+        sys.exit(1)
+
+    machine_type = config_manager.active_profile["machine_type"]
+    try:
+        offering_zones = compute_manager.list_zones_offering_machine_type(machine_type)
+    except HttpError as e:
+        click.echo(f"❗ Error: {e}")
+        sys.exit(1)
+
+    zones_by_region = {}
+    for zone in offering_zones:
+        zones_by_region.setdefault("-".join(zone.split("-")[:-1]), []).append(zone)
+
+    try:
+        endpoints = fetch_region_endpoints()
+    except (OSError, ValueError) as e:
+        click.echo(f"❌ Failed to fetch region endpoints: {e}")
+        sys.exit(1)
+
+    with spinner(
+        text=f"Probing latency to {len(zones_by_region)} regions offering: '{machine_type}'",
+        done_text=f"⏱️ Probed regions offering: '{machine_type}'",
+    ):
+        latencies = probe_regions(endpoints, list(zones_by_region))
+
+    if not latencies:
+        click.echo("❌ No region could be reached.")
+        sys.exit(1)
+
+    ranked = sorted(latencies.items(), key=lambda item: item[1])
+    for i, (region, ms) in enumerate(ranked[:top], 1):
+        marker = (
+            " (current)" if region == config_manager.active_profile["region"] else ""
+        )
+        click.echo(
+            f"  {i}. {region:<24}{ms:>7} ms  {', '.join(zones_by_region[region])}{marker}"
+        )
+
+    best_region = ranked[0][0]
+    # Keep the current zone if it is already in the fastest region
+    best_zone = (
+        active_zone
+        if active_zone in zones_by_region[best_region]
+        else zones_by_region[best_region][0]
+    )
+    click.echo(f"💡 Lowest latency zone: '{best_zone}'")
+
+    if not apply or best_zone == active_zone:
+        return
+
+    # The instance, or its parked disk, would be left behind in the old zone
+    instance_name = config_manager.active_profile["instance_name"]
+    existing = compute_manager.list_instances(zone=active_zone) or []
+    if any(instance["name"] == instance_name for instance in existing):
+        click.echo(
+            f"❗ Instance: '{instance_name}' exists in zone: '{active_zone}'. Move it with 'vmlc start -z {best_zone}'"
+        )
+        sys.exit(1)
+    if compute_manager.get_disk(instance_name, zone=active_zone):
+        click.echo(
+            f"❗ Parked disk for instance: '{instance_name}' exists in zone: '{active_zone}'. Move it with 'vmlc start -z {best_zone}'"
+        )
+        sys.exit(1)
+
+    if config_manager.update_active_zone_region(True, zone=best_zone):
+        click.echo(
+            f"✅ Updated zone in profile: '{config_manager.active}' to '{best_zone}'"
+        )
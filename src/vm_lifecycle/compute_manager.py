@@ -1,9 +1,15 @@
 # from google.oauth2 import service_account
 from google.auth import default as google_auth_default
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest, build_http
+import shlex
+import threading
 import time
-from pathlib import Path
 
+from vm_lifecycle.params import PREWARM_GUEST_ATTRIBUTE
+from vm_lifecycle.startup_scripts import StartupScriptRenderer
 from vm_lifecycle.utils import gcphttperror
 
 
@@ -22,8 +28,33 @@ class GCPComputeManager:
         credentials, _ = google_auth_default(
             scopes=["https://www.googleapis.com/auth/cloud-platform"]
         )
-        self.compute = build("compute", "v1", credentials=credentials)
-        self.serviceusage = build("serviceusage", "v1", credentials=credentials)
+        # httplib2 is not thread safe, give each thread its own connection so
+        # independent lookups can be issued concurrently, build_http keeps the
+        # client's default socket timeout so a stalled request cannot hang
+        self._credentials = credentials
+        self._local = threading.local()
+        self.compute = build(
+            "compute",
+            "v1",
+            http=self._thread_http(),
+            requestBuilder=self._build_request,
+        )
+        self.serviceusage = build(
+            "serviceusage",
+            "v1",
+            http=self._thread_http(),
+            requestBuilder=self._build_request,
+        )
+
+    def _thread_http(self):
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = AuthorizedHttp(self._credentials, http=build_http())
+            self._local.http = http
+        return http
+
+    def _build_request(self, _http, *args, **kwargs):
+        return HttpRequest(self._thread_http(), *args, **kwargs)
 
     ### Instance Management
     def create_instance(
@@ -37,6 +68,16 @@ class GCPComputeManager:
         image_project: str = "ubuntu-os-cloud",
         image_family: str = "ubuntu-2204-lts",
         startup_script_type: str = None,
+        source_snapshot_name: str = None,
+        source_disk_name: str = None,
+        disk_type: str = "pd-balanced",
+        provisioned_iops: int = None,
+        provisioned_throughput: int = None,
+        network_tier: str = "STANDARD",
+        nic_type: str = None,
+        tier1_networking: bool = False,
+        nat_ip: str = None,
+        prewarm_paths: list = None,
     ):
         target_zone = zone or self.zone
 
@@ -51,45 +92,64 @@ class GCPComputeManager:
                 f"projects/{image_project}/global/images/family/{image_family}"
             )
 
+        initialize_params = {
+            "sourceImage": source_image,
+            "diskSizeGb": disk_size,
+            "diskType": f"zones/{target_zone}/diskTypes/{disk_type}",
+        }
+        if provisioned_iops:
+            initialize_params["provisionedIops"] = provisioned_iops
+        if provisioned_throughput:
+            initialize_params["provisionedThroughput"] = provisioned_throughput
+        if source_snapshot_name:
+            # Restore the boot disk from a snapshot instead of an image
+            del initialize_params["sourceImage"]
+            initialize_params["sourceSnapshot"] = (
+                f"projects/{self.project_id}/global/snapshots/{source_snapshot_name}"
+            )
+
+        boot_disk = {
+            "boot": True,
+            "autoDelete": True,
+            "initializeParams": initialize_params,
+        }
+        if source_disk_name:
+            # Attach an existing disk, nothing needs to be restored
+            del boot_disk["initializeParams"]
+            boot_disk["source"] = (
+                f"projects/{self.project_id}/zones/{target_zone}/disks/{source_disk_name}"
+            )
+
+        network_interface = self._network_interface(network_tier, nic_type, nat_ip)
+
         config = {
             "name": instance_name,
             "machineType": f"zones/{target_zone}/machineTypes/{machine_type}",
-            "disks": [
-                {
-                    "boot": True,
-                    "autoDelete": True,
-                    "initializeParams": {
-                        "sourceImage": source_image,
-                        "diskSizeGb": disk_size,
-                        "diskType": f"zones/{target_zone}/diskTypes/pd-balanced",
-                    },
-                }
-            ],
-            "networkInterfaces": [
-                {
-                    "network": "global/networks/default",
-                    "accessConfigs": [
-                        {
-                            "type": "ONE_TO_ONE_NAT",
-                            "name": "External NAT",
-                            "networkTier": "STANDARD",
-                        }
-                    ],
-                }
-            ],
+            "disks": [boot_disk],
+            "networkInterfaces": [network_interface],
+            # Lets the guest report state back, e.g. 'vmlc/dirty'
+            "metadata": {
+                "items": [{"key": "enable-guest-attributes", "value": "TRUE"}]
+            },
         }
 
-        if startup_script_type == "ansible":
-            # Thanks Windows
-            script_path = Path("scripts") / "startup_ansible.sh"
-            with open(script_path, encoding="utf-8") as f:
-                startup_script_template = f.read()
-
-            startup_script = startup_script_template.format(instance_user=instance_user)
+        if tier1_networking:
+            config["networkPerformanceConfig"] = {"totalEgressBandwidthTier": "TIER_1"}
+
+        scripts = [startup_script_type] if startup_script_type else []
+        if prewarm_paths:
+            scripts.append("prewarm")
+        if scripts:
+            startup_script = StartupScriptRenderer().render(
+                *scripts,
+                instance_user=instance_user,
+                prewarm_paths=" ".join(shlex.quote(p) for p in prewarm_paths or []),
+                prewarm_attribute=PREWARM_GUEST_ATTRIBUTE,
+            )
 
-            config["metadata"] = {
-                "items": [{"key": "startup-script", "value": startup_script}]
-            }
+            config["metadata"]["items"].append(
+                {"key": "startup-script", "value": startup_script}
+            )
 
         return (
             self.compute.instances()
@@ -97,6 +157,26 @@ class GCPComputeManager:
             .execute()
         )
 
+    @staticmethod
+    def _network_interface(
+        network_tier: str = "STANDARD", nic_type: str = None, nat_ip: str = None
+    ) -> dict:
+        access_config = {
+            "type": "ONE_TO_ONE_NAT",
+            "name": "External NAT",
+            "networkTier": network_tier,
+        }
+        if nat_ip:
+            # Reserved static address, ephemeral otherwise
+            access_config["natIP"] = nat_ip
+        network_interface = {
+            "network": "global/networks/default",
+            "accessConfigs": [access_config],
+        }
+        if nic_type:
+            network_interface["nicType"] = nic_type
+        return network_interface
+
     def start_instance(self, instance_name: str, zone: str = None):
         target_zone = zone or self.zone
         return (
@@ -113,6 +193,22 @@ class GCPComputeManager:
             .execute()
         )
 
+    def suspend_instance(self, instance_name: str, zone: str = None):
+        target_zone = zone or self.zone
+        return (
+            self.compute.instances()
+            .suspend(project=self.project_id, zone=target_zone, instance=instance_name)
+            .execute()
+        )
+
+    def resume_instance(self, instance_name: str, zone: str = None):
+        target_zone = zone or self.zone
+        return (
+            self.compute.instances()
+            .resume(project=self.project_id, zone=target_zone, instance=instance_name)
+            .execute()
+        )
+
     def delete_instance(self, instance_name: str, zone: str = None):
         target_zone = zone or self.zone
 
@@ -122,13 +218,94 @@ class GCPComputeManager:
             .execute()
         )
 
+    def get_instance(self, instance_name: str, zone: str = None) -> dict:
+        target_zone = zone or self.zone
+        return (
+            self.compute.instances()
+            .get(project=self.project_id, zone=target_zone, instance=instance_name)
+            .execute()
+        )
+
+    def _query_guest_attributes(
+        self, instance_name: str, query_path: str, zone: str = None
+    ) -> list:
+        """Guest attributes under query_path, empty if guest attributes are not enabled."""
+        target_zone = zone or self.zone
+        try:
+            result = (
+                self.compute.instances()
+                .getGuestAttributes(
+                    project=self.project_id,
+                    zone=target_zone,
+                    instance=instance_name,
+                    queryPath=query_path,
+                )
+                .execute()
+            )
+        except HttpError as e:
+            if e.resp.status in (400, 404):
+                return []
+            raise
+        return result.get("queryValue", {}).get("items", [])
+
+    def get_guest_attribute(
+        self, instance_name: str, query_path: str, zone: str = None
+    ):
+        """
+        Read a single guest attribute written by the VM. Returns None if it was
+        never written or guest attributes are not enabled on the instance.
+        """
+        namespace, _, key = query_path.partition("/")
+        for item in self._query_guest_attributes(instance_name, query_path, zone):
+            if item.get("namespace") == namespace and item.get("key") == key:
+                return item.get("value")
+        return None
+
+    def get_guest_attributes(
+        self, instance_name: str, namespace: str, zone: str = None
+    ) -> dict:
+        """Map of key to value of every guest attribute in namespace."""
+        return {
+            item["key"]: item.get("value")
+            for item in self._query_guest_attributes(
+                instance_name, f"{namespace}/", zone
+            )
+            if item.get("namespace") == namespace
+        }
+
+    def get_serial_port_output(
+        self, instance_name: str, zone: str = None, start: int = 0
+    ) -> tuple:
+        """
+        Console output of the instance from byte offset start. Returns the
+        contents and the offset to continue reading from.
+        """
+        target_zone = zone or self.zone
+        result = (
+            self.compute.instances()
+            .getSerialPortOutput(
+                project=self.project_id,
+                zone=target_zone,
+                instance=instance_name,
+                port=1,
+                start=start,
+            )
+            .execute()
+        )
+        return result.get("contents", ""), int(result.get("next", start))
+
     @gcphttperror()
     def get_instance_status(self, instance_name: str, zone: str = None) -> str:
+        return self.find_instance(instance_name, zone=zone).get("status", "UNKNOWN")
+
+    @gcphttperror()
+    def find_instance(self, instance_name: str, zone: str = None) -> dict:
+        """The instance from the zone listing, raises ValueError if it does not exist."""
         target_zone = zone or self.zone
         instances = self.list_instances(zone=target_zone)
         for instance in instances:
             if instance["name"] == instance_name:
-                return instance.get("status", "UNKNOWN")
+                return instance
         raise ValueError(
             f"Instance: '{instance_name}' not found in zone: '{target_zone}'"
         )
@@ -150,22 +327,70 @@ class GCPComputeManager:
         image_name: str,
         zone: str = None,
         family: str = None,
+        storage_location: str = None,
+        guest_os_features: list = None,
     ):
         target_zone = zone or self.zone
+        boot_disk = self._get_boot_disk_name(instance_name, zone=target_zone)
+        return self.create_image_from_disk(
+            disk_name=boot_disk,
+            image_name=image_name,
+            zone=target_zone,
+            family=family,
+            storage_location=storage_location,
+            guest_os_features=guest_os_features,
+        )
 
-        instance = (
-            self.compute.instances()
-            .get(project=self.project_id, zone=target_zone, instance=instance_name)
+    def create_image_from_disk(
+        self,
+        disk_name: str,
+        image_name: str,
+        zone: str = None,
+        family: str = None,
+        storage_location: str = None,
+        guest_os_features: list = None,
+    ):
+        """
+        Image a disk. Without a storage_location GCP picks the multi-region
+        closest to the disk, a region keeps the data next to where it is restored.
+        """
+        target_zone = zone or self.zone
+
+        timestamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+        image_body = {
+            "name": f"{image_name}-{timestamp}",
+            "sourceDisk": f"projects/{self.project_id}/zones/{target_zone}/disks/{disk_name}",
+        }
+
+        if family:
+            image_body["family"] = family
+        if storage_location:
+            image_body["storageLocations"] = [storage_location]
+        if guest_os_features:
+            # e.g. 'GVNIC', instances restored from the image may use that NIC
+            image_body["guestOsFeatures"] = [
+                {"type": feature} for feature in guest_os_features
+            ]
+
+        return (
+            self.compute.images()
+            .insert(project=self.project_id, body=image_body)
             .execute()
         )
-        boot_disk = next(
-            d["source"].split("/")[-1] for d in instance["disks"] if d["boot"]
-        )
 
+    def copy_image(
+        self,
+        source_image_name: str,
+        image_name: str,
+        storage_location: str,
+        family: str = None,
+    ):
+        """Copy an image into another storage location, e.g. before restoring far from it."""
         timestamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
         image_body = {
             "name": f"{image_name}-{timestamp}",
-            "sourceDisk": f"projects/{self.project_id}/zones/{target_zone}/disks/{boot_disk}",
+            "sourceImage": f"projects/{self.project_id}/global/images/{source_image_name}",
+            "storageLocations": [storage_location],
         }
 
         if family:
@@ -208,7 +433,294 @@ class GCPComputeManager:
             img["name"] for img in all_images if img["name"] != latest_image["name"]
         ]
 
+    ### Snapshot Management
+    def create_snapshot_from_instance(
+        self,
+        instance_name: str,
+        snapshot_name: str,
+        zone: str = None,
+        chain: str = None,
+        labels: dict = None,
+    ):
+        """
+        Snapshot the boot disk of an instance. Snapshots of the same disk are
+        incremental, only blocks changed since the previous snapshot are stored.
+        """
+        target_zone = zone or self.zone
+        boot_disk = self._get_boot_disk_name(instance_name, zone=target_zone)
+        return self.create_snapshot_from_disk(
+            disk_name=boot_disk,
+            snapshot_name=snapshot_name,
+            zone=target_zone,
+            chain=chain,
+            labels=labels,
+        )
+
+    def create_snapshot_from_disk(
+        self,
+        disk_name: str,
+        snapshot_name: str,
+        zone: str = None,
+        chain: str = None,
+        labels: dict = None,
+    ):
+        target_zone = zone or self.zone
+
+        timestamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+        snapshot_body = {
+            "name": f"{snapshot_name}-{timestamp}",
+            "sourceDisk": f"projects/{self.project_id}/zones/{target_zone}/disks/{disk_name}",
+        }
+
+        if chain:
+            snapshot_body["chainName"] = chain
+        if labels:
+            snapshot_body["labels"] = labels
+
+        return (
+            self.compute.snapshots()
+            .insert(project=self.project_id, body=snapshot_body)
+            .execute()
+        )
+
+    def delete_snapshot(self, snapshot_name: str):
+        return (
+            self.compute.snapshots()
+            .delete(project=self.project_id, snapshot=snapshot_name)
+            .execute()
+        )
+
+    def list_snapshots(self, chain: str = None):
+        request = self.compute.snapshots().list(project=self.project_id)
+        snapshots = []
+
+        while request is not None:
+            response = request.execute()
+            snapshots.extend(response.get("items", []))
+            request = self.compute.snapshots().list_next(
+                previous_request=request, previous_response=response
+            )
+
+        if chain:
+            snapshots = [snap for snap in snapshots if snap.get("chainName") == chain]
+
+        return snapshots
+
+    def get_latest_snapshot_from_chain(self, chain: str):
+        snapshots = [
+            snap for snap in self.list_snapshots(chain) if snap.get("status") == "READY"
+        ]
+        if not snapshots:
+            return None
+        return max(snapshots, key=lambda snap: snap["creationTimestamp"])
+
+    ### Machine Image Management
+    def create_machine_image_from_instance(
+        self,
+        instance_name: str,
+        machine_image_name: str,
+        zone: str = None,
+    ):
+        """
+        Capture an instance as a machine image. Unlike an image, it also holds the
+        machine type, metadata and network configuration of the instance.
+        """
+        target_zone = zone or self.zone
+
+        timestamp = time.strftime("%Y%m%d-%H%M%S", time.gmtime())
+        machine_image_body = {
+            "name": f"{machine_image_name}-{timestamp}",
+            "sourceInstance": f"projects/{self.project_id}/zones/{target_zone}/instances/{instance_name}",
+        }
+
+        return (
+            self.compute.machineImages()
+            .insert(project=self.project_id, body=machine_image_body)
+            .execute()
+        )
+
+    def create_instance_from_machine_image(
+        self,
+        instance_name: str,
+        machine_image_name: str,
+        machine_type: str = None,
+        zone: str = None,
+        nat_ip: str = None,
+        network_tier: str = "STANDARD",
+        nic_type: str = None,
+    ):
+        """
+        Restore an instance with a single insert, the body comes from the machine
+        image. Fields set here override the stored instance properties.
+        """
+        target_zone = zone or self.zone
+        config = {
+            "name": instance_name,
+            "sourceMachineImage": f"projects/{self.project_id}/global/machineImages/{machine_image_name}",
+        }
+        if machine_type:
+            config["machineType"] = f"zones/{target_zone}/machineTypes/{machine_type}"
+        if nat_ip:
+            # The stored interface has an ephemeral address, replace it
+            config["networkInterfaces"] = [
+                self._network_interface(network_tier, nic_type, nat_ip)
+            ]
+        return (
+            self.compute.instances()
+            .insert(project=self.project_id, zone=target_zone, body=config)
+            .execute()
+        )
+
+    def delete_machine_image(self, machine_image_name: str):
+        return (
+            self.compute.machineImages()
+            .delete(project=self.project_id, machineImage=machine_image_name)
+            .execute()
+        )
+
+    def list_machine_images(self, base_name: str = None):
+        request = self.compute.machineImages().list(project=self.project_id)
+        machine_images = []
+
+        while request is not None:
+            response = request.execute()
+            machine_images.extend(response.get("items", []))
+            request = self.compute.machineImages().list_next(
+                previous_request=request, previous_response=response
+            )
+
+        # Machine images have no family, they share the '<base_name>-' prefix
+        if base_name:
+            machine_images = [
+                mi for mi in machine_images if mi["name"].startswith(f"{base_name}-")
+            ]
+
+        return machine_images
+
+    def get_latest_machine_image(self, base_name: str):
+        machine_images = [
+            mi
+            for mi in self.list_machine_images(base_name)
+            if mi.get("status") == "READY"
+        ]
+        if not machine_images:
+            return None
+        return max(machine_images, key=lambda mi: mi["creationTimestamp"])
+
+    def get_dangling_machine_images(self, base_name: str):
+        latest_machine_image = self.get_latest_machine_image(base_name)
+        if not latest_machine_image:
+            return []
+        all_machine_images = self.list_machine_images(base_name)
+
+        return [
+            mi["name"]
+            for mi in all_machine_images
+            if mi["name"] != latest_machine_image["name"]
+        ]
+
+    ### Disk Management
+    def get_disk(self, disk_name: str, zone: str = None):
+        target_zone = zone or self.zone
+        try:
+            return (
+                self.compute.disks()
+                .get(project=self.project_id, zone=target_zone, disk=disk_name)
+                .execute()
+            )
+        except HttpError as e:
+            if e.resp.status == 404:
+                return None
+            raise
+
+    def delete_disk(self, disk_name: str, zone: str = None):
+        target_zone = zone or self.zone
+        return (
+            self.compute.disks()
+            .delete(project=self.project_id, zone=target_zone, disk=disk_name)
+            .execute()
+        )
+
+    def list_disk_types(self, zone: str = None) -> list:
+        target_zone = zone or self.zone
+        request = self.compute.diskTypes().list(
+            project=self.project_id, zone=target_zone
+        )
+        disk_types = []
+
+        while request is not None:
+            response = request.execute()
+            disk_types.extend(dt["name"] for dt in response.get("items", []))
+            request = self.compute.diskTypes().list_next(
+                previous_request=request, previous_response=response
+            )
+
+        return disk_types
+
+    def set_boot_disk_auto_delete(
+        self, instance_name: str, auto_delete: bool, zone: str = None
+    ):
+        """Control whether the boot disk is deleted together with the instance."""
+        target_zone = zone or self.zone
+        boot_disk = self._get_boot_disk(instance_name, zone=target_zone)
+        return (
+            self.compute.instances()
+            .setDiskAutoDelete(
+                project=self.project_id,
+                zone=target_zone,
+                instance=instance_name,
+                autoDelete=auto_delete,
+                deviceName=boot_disk["deviceName"],
+            )
+            .execute()
+        )
+
+    ### Address Management
+    def reserve_address(
+        self, address_name: str, region: str, network_tier: str = "STANDARD"
+    ):
+        return (
+            self.compute.addresses()
+            .insert(
+                project=self.project_id,
+                region=region,
+                body={
+                    "name": address_name,
+                    "addressType": "EXTERNAL",
+                    "networkTier": network_tier,
+                },
+            )
+            .execute()
+        )
+
+    def get_address(self, address_name: str, region: str):
+        """The reserved address, None if it does not exist."""
+        try:
+            return (
+                self.compute.addresses()
+                .get(project=self.project_id, region=region, address=address_name)
+                .execute()
+            )
+        except HttpError as e:
+            if e.resp.status == 404:
+                return None
+            raise
+
+    def delete_address(self, address_name: str, region: str):
+        return (
+            self.compute.addresses()
+            .delete(project=self.project_id, region=region, address=address_name)
+            .execute()
+        )
+
     ### Misc Methods
+    def _get_boot_disk(self, instance_name: str, zone: str = None) -> dict:
+        instance = self.get_instance(instance_name, zone=zone)
+        return next(d for d in instance["disks"] if d["boot"])
+
+    def _get_boot_disk_name(self, instance_name: str, zone: str = None) -> str:
+        return self._get_boot_disk(instance_name, zone=zone)["source"].split("/")[-1]
+
     def _list_regions(self):
         request = self.compute.regions().list(project=self.project_id)
         response = request.execute()
@@ -230,6 +742,40 @@ class GCPComputeManager:
 
         return zones
 
+    def list_machine_types(self, zone: str = None) -> list:
+        target_zone = zone or self.zone
+        request = self.compute.machineTypes().list(
+            project=self.project_id, zone=target_zone
+        )
+        machine_types = []
+
+        while request is not None:
+            response = request.execute()
+            machine_types.extend(response.get("items", []))
+            request = self.compute.machineTypes().list_next(
+                previous_request=request, previous_response=response
+            )
+
+        return machine_types
+
+    def list_zones_offering_machine_type(self, machine_type: str) -> list:
+        """Zones offering a machine type, from a single aggregated list across zones."""
+        request = self.compute.machineTypes().aggregatedList(
+            project=self.project_id, filter=f'name = "{machine_type}"'
+        )
+        zones = []
+
+        while request is not None:
+            response = request.execute()
+            for scope, scoped in response.get("items", {}).items():
+                if scoped.get("machineTypes"):
+                    zones.append(scope.split("/")[-1])
+            request = self.compute.machineTypes().aggregatedList_next(
+                previous_request=request, previous_response=response
+            )
+
+        return sorted(zones)
+
     def check_required_apis(self):
         enabled_services = []
         request = self.serviceusage.services().list(
@@ -261,12 +807,12 @@ class GCPComputeManager:
     ):
         """
         Polls a Compute Engine operation until it completes.
-        Supports both 'zone' and 'global' operations.
+        Supports 'zone', 'region' and 'global' operations.
 
         Args:
             operation_name (str): The name of the operation to poll.
-            scope (str): 'zone' (default) or 'global'.
-            zone (str): Required if scope == 'zone'.
+            scope (str): 'zone' (default), 'region' or 'global'.
+            zone (str): Required if scope == 'zone', the region if scope == 'region'.
             timeout (int): Timeout in seconds.
             poll_interval (int): Poll interval in seconds.
 
@@ -288,9 +834,16 @@ class GCPComputeManager:
                     project=self.project_id,
                     operation=operation_name,
                 )
+            elif scope == "region":
+                # Regional operations pass the region as zone
+                request = self.compute.regionOperations().get(
+                    project=self.project_id,
+                    region=zone,
+                    operation=operation_name,
+                )
             else:
                 raise ValueError(
-                    "Unsupported operation scope: must be 'zone' or 'global'."
+                    "Unsupported operation scope: must be 'zone', 'region' or 'global'."
                 )
 
             result = request.execute()
@@ -1,7 +1,8 @@
+import os
 import yaml
 import copy
 from pathlib import Path
-from vm_lifecycle.params import DEFAULT_CONFIG_PATH
+from vm_lifecycle.params import DEFAULT_CONFIG_PATH, PROFILE_ENV_VAR
 
 
 class ConfigManager:
@@ -10,7 +11,8 @@ class ConfigManager:
     def __init__(self, config_path: Path = DEFAULT_CONFIG_PATH):
         self.config_path = config_path
         self.config = self._load_config()
-        self.active = self.config.get("active", None)
+        # Scheduled runs pick their profile without changing the active one
+        self.active = os.environ.get(PROFILE_ENV_VAR) or self.config.get("active", None)
         self.active_profile = self._load_active_profile()
 
     def _load_config(self):
@@ -54,6 +56,44 @@ class ConfigManager:
             return True
         return False
 
+    def set_profile_option(self, key: str, value):
+        if not self.active or self.active not in self.config:
+            return False
+        self.config[self.active][key] = value
+        self.save_config()
+        self.active_profile = self._load_active_profile()
+        return True
+
+    def list_schedules(self):
+        """Schedule rules of every profile that has any."""
+        return {
+            name: profile["schedules"]
+            for name, profile in self.list_profiles().items()
+            if profile.get("schedules")
+        }
+
+    def add_schedule(self, action: str, cron: str):
+        if not self.active or self.active not in self.config:
+            return False
+        self.config[self.active].setdefault("schedules", []).append(
+            {"action": action, "cron": cron}
+        )
+        self.save_config()
+        self.active_profile = self._load_active_profile()
+        return True
+
+    def remove_schedule(self, index: int):
+        """Remove the rule at 1-based index from the active profile."""
+        schedules = self.active_profile.get("schedules", [])
+        if not 1 <= index <= len(schedules):
+            return None
+        removed = schedules.pop(index - 1)
+        if not schedules:
+            del self.config[self.active]["schedules"]
+        self.save_config()
+        self.active_profile = self._load_active_profile()
+        return removed
+
     def add_profile(self, profile_name, profile_config, overwrite=False):
         if profile_name in self.config and not overwrite:
             return False
@@ -93,7 +133,8 @@ class ConfigManager:
             ]
         )
 
-        if set(self.active_profile.keys()) != req_keys:
+        # Optional settings (see params.PROFILE_OPTIONS) may also be present
+        if not req_keys.issubset(self.active_profile.keys()):
             return False
         return True
 
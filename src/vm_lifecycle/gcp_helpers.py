@@ -1,10 +1,30 @@
 import click
+from concurrent.futures import Future, ThreadPoolExecutor
+from googleapiclient.errors import HttpError
 
+from vm_lifecycle.cache_manager import CacheManager
 from vm_lifecycle.compute_manager import GCPComputeManager
 from vm_lifecycle.config_manager import ConfigManager
+from vm_lifecycle.params import (
+    DEFAULT_DISK_TYPE,
+    DEFAULT_NETWORK_TIER,
+    DEFAULT_NIC_TYPE,
+    PROVISIONED_IOPS_DISK_TYPES,
+    PROVISIONED_THROUGHPUT_DISK_TYPES,
+    SNAPSHOT_SEQ_LABEL,
+    TIER1_MACHINE_FAMILIES,
+    TIER1_MIN_VCPUS,
+)
+from vm_lifecycle.readiness import wait_until_ready
+from vm_lifecycle.timing_manager import TimingManager
 from vm_lifecycle.utils import spinner
 
 
+_prefetch_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="vmlc-prefetch"
+)
+
+
 ######## GCP init context
 def init_gcp_context(zone_override: str = None, check_apis: bool = True):
     config_manager = ConfigManager()
@@ -30,6 +50,234 @@ def init_gcp_context(zone_override: str = None, check_apis: bool = True):
     return config_manager, compute_manager, active_zone
 
 
+######## Concurrent lookups
+def prefetch(fn, *args, **kwargs) -> Future:
+    """
+    Issue a GCP lookup in the background. Call .result() on the returned future
+    when the value is needed, exceptions are raised at that point. Futures that
+    turn out not to be needed can simply be dropped.
+    """
+    return _prefetch_executor.submit(fn, *args, **kwargs)
+
+
+def next_snapshot_seq(config_manager, compute_manager) -> int:
+    """Number of the next snapshot in the chain since it was last compacted."""
+    chain = config_manager.active_profile["image_base_name"]
+    snapshot_future = prefetch(compute_manager.get_latest_snapshot_from_chain, chain)
+    image_future = prefetch(compute_manager.get_latest_image_from_family, chain)
+
+    try:
+        latest_snapshot = snapshot_future.result()
+    except HttpError:
+        latest_snapshot = None
+    if not latest_snapshot:
+        return 1
+
+    try:
+        latest_image = image_future.result()
+    except HttpError:
+        latest_image = None
+
+    # An image park after the latest snapshot restarts the chain
+    if latest_image and latest_image.get("creationTimestamp", "") > latest_snapshot.get(
+        "creationTimestamp", ""
+    ):
+        return 1
+
+    return int(latest_snapshot.get("labels", {}).get(SNAPSHOT_SEQ_LABEL, 0)) + 1
+
+
+######## Disk settings
+def disk_settings(profile: dict) -> dict:
+    """create_instance kwargs for the boot disk type and performance of a profile."""
+    disk_type = profile.get("disk_type", DEFAULT_DISK_TYPE)
+    settings = {"disk_type": disk_type}
+    if disk_type in PROVISIONED_IOPS_DISK_TYPES and profile.get("disk_iops"):
+        settings["provisioned_iops"] = profile["disk_iops"]
+    if disk_type in PROVISIONED_THROUGHPUT_DISK_TYPES and profile.get(
+        "disk_throughput"
+    ):
+        settings["provisioned_throughput"] = profile["disk_throughput"]
+    return settings
+
+
+def prewarm_settings(profile: dict) -> dict:
+    """create_instance kwargs reading the profile's hot paths after a restore."""
+    paths = [
+        path.strip()
+        for path in (profile.get("prewarm_paths") or "").split(",")
+        if path.strip()
+    ]
+    return {"prewarm_paths": paths} if paths else {}
+
+
+def check_disk_type(
+    compute_manager: GCPComputeManager,
+    profile: dict,
+    zone: str,
+    cache_manager: CacheManager = None,
+) -> bool:
+    """Check the profile disk type is offered in zone, zone disk types are cached."""
+    disk_type = profile.get("disk_type", DEFAULT_DISK_TYPE)
+    if disk_type == DEFAULT_DISK_TYPE:
+        return True
+
+    cache_manager = cache_manager or CacheManager()
+    available = cache_manager.get_or_fetch(
+        f"disk_types/{profile['project_id']}/{zone}",
+        compute_manager.list_disk_types,
+        zone=zone,
+    )
+    if disk_type not in available:
+        click.echo(f"❌ Disk type: '{disk_type}' is not available in zone: '{zone}'")
+        return False
+
+    if profile.get("disk_iops") and disk_type not in PROVISIONED_IOPS_DISK_TYPES:
+        click.echo(
+            f"⚠️ Disk type: '{disk_type}' does not take provisioned IOPS, 'disk_iops' is ignored"
+        )
+    if (
+        profile.get("disk_throughput")
+        and disk_type not in PROVISIONED_THROUGHPUT_DISK_TYPES
+    ):
+        click.echo(
+            f"⚠️ Disk type: '{disk_type}' does not take provisioned throughput, 'disk_throughput' is ignored"
+        )
+    return True
+
+
+######## Network settings
+def network_settings(profile: dict) -> dict:
+    """create_instance kwargs for the network tier, NIC and bandwidth of a profile."""
+    settings = {"network_tier": profile.get("network_tier", DEFAULT_NETWORK_TIER)}
+    nic_type = profile.get("nic_type", DEFAULT_NIC_TYPE)
+
+    if profile.get("tier1_networking"):
+        if supports_tier1_networking(profile["machine_type"]):
+            # Tier_1 bandwidth is only available with gVNIC
+            nic_type = "GVNIC"
+            settings["tier1_networking"] = True
+        else:
+            click.echo(
+                f"⚠️ Machine type: '{profile['machine_type']}' does not support Tier_1 networking, using default bandwidth"
+            )
+
+    if nic_type != DEFAULT_NIC_TYPE:
+        settings["nic_type"] = nic_type
+    return settings
+
+
+def static_ip_name(profile: dict) -> str:
+    return f"{profile['instance_name']}-ip"
+
+
+def static_ip_settings(compute_manager, profile: dict, region: str) -> dict:
+    """
+    create_instance kwargs attaching the profile's static external IP in region,
+    reserved on first use. Empty if the profile uses ephemeral addresses.
+    """
+    if not profile.get("static_ip"):
+        return {}
+
+    address_name = static_ip_name(profile)
+    address = compute_manager.get_address(address_name, region)
+    if not address:
+        op = compute_manager.reserve_address(
+            address_name,
+            region,
+            network_tier=profile.get("network_tier", DEFAULT_NETWORK_TIER),
+        )
+        result = poll_with_spinner(
+            compute_manager=compute_manager,
+            op_name=op["name"],
+            text=f"Reserving static IP: '{address_name}' in region: '{region}'",
+            done_text=f"📌 Static IP: '{address_name}' reserved in region: '{region}'",
+            scope="region",
+            zone=region,
+        )
+        if not result.get("success"):
+            click.echo(f"❌ Failed to reserve static IP: '{address_name}'")
+            return None
+        address = compute_manager.get_address(address_name, region)
+    return {"nat_ip": address["address"]}
+
+
+def release_static_ip(compute_manager, profile: dict, region: str) -> bool:
+    """Release the profile's static external IP in region, if one is reserved."""
+    address_name = static_ip_name(profile)
+    if not compute_manager.get_address(address_name, region):
+        return False
+
+    op = compute_manager.delete_address(address_name, region)
+    result = poll_with_spinner(
+        compute_manager=compute_manager,
+        op_name=op["name"],
+        text=f"Releasing static IP: '{address_name}' in region: '{region}'",
+        done_text=f"🗑️ Static IP: '{address_name}' in region: '{region}' released",
+        scope="region",
+        zone=region,
+    )
+    return bool(result.get("success"))
+
+
+def image_guest_os_features(profile: dict) -> list:
+    """Guest OS features parked images need for the profile network settings."""
+    if profile.get("nic_type", DEFAULT_NIC_TYPE) == "GVNIC" or profile.get(
+        "tier1_networking"
+    ):
+        return ["GVNIC"]
+    return []
+
+
+def supports_tier1_networking(machine_type: str) -> bool:
+    parts = machine_type.split("-")
+    if parts[0] not in TIER1_MACHINE_FAMILIES:
+        return False
+    # e.g. n2-standard-32 or n2-custom-32-131072
+    vcpus = parts[2] if len(parts) > 2 and parts[1] == "custom" else parts[-1]
+    return vcpus.isdigit() and int(vcpus) >= TIER1_MIN_VCPUS
+
+
+######## Operation timings
+def record_timing(config_manager: ConfigManager, action: str, strategy: str, result):
+    """Store the duration of a finished operation, see 'vmlc status --timings'."""
+    if not result or not result.get("success"):
+        return
+    seconds = TimingManager.operation_duration(result.get("operation", {}))
+    if seconds is None:
+        return
+    TimingManager().record(config_manager.active, action, strategy, seconds)
+
+
+######## Guest readiness
+def wait_for_ready(
+    config_manager: ConfigManager, compute_manager, zone: str, **kwargs
+) -> bool:
+    """
+    Wait for the guest to accept SSH connections after its operation finished,
+    print and record how long each boot phase took. kwargs are passed on to
+    wait_until_ready.
+    """
+    instance_name = config_manager.active_profile["instance_name"]
+    try:
+        with spinner(
+            text=f"Waiting for instance: '{instance_name}' to accept SSH connections",
+            done_text=f"🚀 Instance: '{instance_name}' is ready",
+        ):
+            phases = wait_until_ready(compute_manager, instance_name, zone, **kwargs)
+    except TimeoutError as e:
+        click.echo(f"❌ {e}")
+        return False
+
+    timing_manager = TimingManager()
+    previous = 0
+    for phase, seconds in phases.items():
+        click.echo(f"  {phase}: {seconds}s (+{round(seconds - previous, 1)}s)")
+        timing_manager.record(config_manager.active, "boot", phase, seconds)
+        previous = seconds
+    return True
+
+
 def poll_with_spinner(
     compute_manager: GCPComputeManager,
     op_name: str,
@@ -39,6 +287,7 @@ def poll_with_spinner(
     done_text: str = "✅ Operation Complete!",
     fail_text: str = "❗ Operation Failed!",
 ):
+    failed = None
     try:
         with spinner(text=text, done_text=done_text, fail_text=fail_text):
             gen = compute_manager.wait_for_operation(op_name, scope, zone=zone)
@@ -53,9 +302,64 @@ def poll_with_spinner(
                         return update
                 except StopIteration as stop:
                     update = stop.value
-                    if not update.get("succes", True):
+                    if not update.get("success", True):
+                        # Keep the operation error, callers read its codes
+                        failed = update
                         raise RuntimeError("GCP Operation completed with errors")
                     return update
     except Exception as e:
         print("Error during polling: ", str(e))
-        return {"success": False, "error": str(e)}
+        return failed or {"success": False, "error": str(e)}
+
+
+def error_message(result: dict) -> str:
+    """
+    Readable message of a failed operation result. Operation errors hold an
+    'errors' list, errors raised while polling a 'message'.
+    """
+    error = result.get("error")
+    if not isinstance(error, dict):
+        return str(error)
+    return error.get("message") or "; ".join(
+        e.get("message", e.get("code", "")) for e in error.get("errors", [])
+    )
+
+
+def poll_many_with_spinner(
+    compute_manager: GCPComputeManager,
+    operations: list,
+    text: str,
+    done_text: str = "✅ Operation Complete!",
+    fail_text: str = "❗ Operation Failed!",
+):
+    """
+    Poll several operations concurrently behind a single spinner. Each entry in
+    operations holds 'op_name', 'scope' and optionally 'zone'. Returns the final
+    result for each operation, in the same order.
+    """
+
+    def drain(operation: dict):
+        gen = compute_manager.wait_for_operation(
+            operation["op_name"], operation["scope"], zone=operation.get("zone")
+        )
+        while True:
+            try:
+                next(gen)
+            except StopIteration as stop:
+                return stop.value
+
+    results = []
+    try:
+        with spinner(text=text, done_text=done_text, fail_text=fail_text):
+            with ThreadPoolExecutor(max_workers=len(operations)) as executor:
+                futures = [executor.submit(drain, op) for op in operations]
+                for future in futures:
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        results.append({"success": False, "error": {"message": str(e)}})
+            if not all(result.get("success") for result in results):
+                raise RuntimeError("GCP Operation completed with errors")
+    except RuntimeError:
+        pass
+    return results
@@ -0,0 +1,75 @@
+import http.client
+import json
+import statistics
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from vm_lifecycle.cache_manager import CacheManager
+from vm_lifecycle.params import (
+    PROBE_ENDPOINTS_URL,
+    PROBE_PATH,
+    PROBE_ATTEMPTS,
+    PROBE_TIMEOUT,
+)
+
+
+def fetch_region_endpoints(cache_manager: CacheManager = None) -> dict:
+    """
+    Map of region to the URL of its probe endpoint, cached. Raises OSError if
+    it can not be fetched and ValueError if the response is malformed.
+    """
+    cache_manager = cache_manager or CacheManager()
+
+    def fetch():
+        with urllib.request.urlopen(PROBE_ENDPOINTS_URL, timeout=PROBE_TIMEOUT) as r:
+            endpoints = json.load(r)
+        if not isinstance(endpoints, dict):
+            raise ValueError(f"unexpected region endpoints: {endpoints!r:.80}")
+        return {
+            region: endpoint["URL"]
+            for region, endpoint in endpoints.items()
+            if isinstance(endpoint, dict) and endpoint.get("URL")
+        }
+
+    return cache_manager.get_or_fetch("probe_endpoints", fetch)
+
+
+def probe_latency(
+    url: str, attempts: int = PROBE_ATTEMPTS, timeout: float = PROBE_TIMEOUT
+):
+    """
+    Median round trip in ms of an HTTPS request to url, or None if it can not be
+    reached. The first request opens the TCP and TLS connection and is not
+    counted, the following ones reuse it so each is a single round trip.
+    """
+    parsed = urlparse(url)
+    conn = http.client.HTTPSConnection(parsed.netloc, timeout=timeout)
+    samples = []
+    try:
+        for i in range(attempts + 1):
+            start = time.perf_counter()
+            conn.request("GET", PROBE_PATH)
+            conn.getresponse().read()
+            if i:
+                samples.append((time.perf_counter() - start) * 1000)
+    except (OSError, http.client.HTTPException):
+        return None
+    finally:
+        conn.close()
+    return round(statistics.median(samples), 1)
+
+
+def probe_regions(endpoints: dict, regions: list) -> dict:
+    """Probe regions concurrently, returns {region: ms} for reachable regions."""
+    targets = [region for region in regions if region in endpoints]
+    if not targets:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(targets), 16)) as executor:
+        results = executor.map(lambda r: probe_latency(endpoints[r]), targets)
+        return {region: ms for region, ms in zip(targets, results) if ms is not None}
+
+
+if __name__ == "__main__":
+    pass
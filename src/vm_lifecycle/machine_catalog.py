@@ -0,0 +1,107 @@
+import bisect
+
+from vm_lifecycle.cache_manager import CacheManager
+from vm_lifecycle.params import MACHINE_FAMILY_RELATIVE_COST, MEMORY_GB_RELATIVE_COST
+
+
+class MachineTypeCatalog:
+    """
+    Machine types offered in a zone, fetched from the Compute API and cached.
+    Entries are indexed by vCPU count and family so size queries only scan
+    machine types that are large enough.
+    """
+
+    def __init__(self, compute_manager, cache_manager: CacheManager = None):
+        self.compute_manager = compute_manager
+        self.cache_manager = cache_manager or CacheManager()
+        self._zones = {}
+
+    def _load_zone(self, zone: str) -> dict:
+        if zone in self._zones:
+            return self._zones[zone]
+
+        rows = self.cache_manager.get_or_fetch(
+            f"machine_types/{self.compute_manager.project_id}/{zone}",
+            self._fetch_zone,
+            zone,
+        )
+        entries = sorted(
+            (
+                {
+                    "name": name,
+                    "family": name.split("-")[0],
+                    "vcpus": vcpus,
+                    "memory_gb": round(memory_mb / 1024, 1),
+                }
+                for name, vcpus, memory_mb in rows
+            ),
+            key=lambda e: (e["vcpus"], e["memory_gb"]),
+        )
+        by_family = {}
+        for entry in entries:
+            by_family.setdefault(entry["family"], []).append(entry)
+
+        self._zones[zone] = {
+            "entries": entries,
+            "vcpus": [e["vcpus"] for e in entries],
+            "by_name": {e["name"]: e for e in entries},
+            "by_family": by_family,
+        }
+        return self._zones[zone]
+
+    def _fetch_zone(self, zone: str) -> list:
+        # Only the fields the catalog needs are cached
+        return [
+            [mt["name"], mt["guestCpus"], mt["memoryMb"]]
+            for mt in self.compute_manager.list_machine_types(zone=zone)
+        ]
+
+    def machine_types(self, zone: str) -> list:
+        return [e["name"] for e in self._load_zone(zone)["entries"]]
+
+    def get(self, zone: str, machine_type: str):
+        return self._load_zone(zone)["by_name"].get(machine_type)
+
+    def families(self, zone: str) -> list:
+        return sorted(self._load_zone(zone)["by_family"])
+
+    def query(
+        self,
+        zone: str,
+        min_vcpus: int = 0,
+        min_memory_gb: float = 0,
+        families: list = None,
+    ) -> list:
+        """Machine types with at least min_vcpus and min_memory_gb, smallest first."""
+        index = self._load_zone(zone)
+        start = bisect.bisect_left(index["vcpus"], min_vcpus)
+        return [
+            entry
+            for entry in index["entries"][start:]
+            if entry["memory_gb"] >= min_memory_gb
+            and (not families or entry["family"] in families)
+        ]
+
+    def recommend(
+        self,
+        zone: str,
+        min_vcpus: int = 0,
+        min_memory_gb: float = 0,
+        families: list = None,
+    ):
+        """Cheapest machine type meeting the minimums, by approximate family price."""
+        candidates = self.query(zone, min_vcpus, min_memory_gb, families)
+        if not candidates:
+            return None
+        return min(candidates, key=self.relative_cost)
+
+    @staticmethod
+    def relative_cost(entry: dict) -> float:
+        per_vcpu = MACHINE_FAMILY_RELATIVE_COST.get(entry["family"], float("inf"))
+        return per_vcpu * (
+            entry["vcpus"] + MEMORY_GB_RELATIVE_COST * entry["memory_gb"]
+        )
+
+
+if __name__ == "__main__":
+    pass
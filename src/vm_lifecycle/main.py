@@ -2,11 +2,15 @@ import click
 
 from vm_lifecycle.commands.profile import profile
 from vm_lifecycle.commands.create import create_vm_instance
+from vm_lifecycle.commands.bake import bake_image
 from vm_lifecycle.commands.destroy import destroy_vm_instance
 from vm_lifecycle.commands.start import start_vm_instance
 from vm_lifecycle.commands.stop import stop_vm_instance
 from vm_lifecycle.commands.status import gcp_vm_instance_status
 from vm_lifecycle.commands.connect import vscode_connect
+from vm_lifecycle.commands.up import vm_up
+from vm_lifecycle.commands.zones import zones
+from vm_lifecycle.commands.schedule import schedule
 
 
 @click.group()
@@ -17,11 +21,15 @@ def cli():
 
 cli.add_command(profile)
 cli.add_command(create_vm_instance)
+cli.add_command(bake_image)
 cli.add_command(destroy_vm_instance)
 cli.add_command(start_vm_instance)
 cli.add_command(stop_vm_instance)
 cli.add_command(gcp_vm_instance_status)
 cli.add_command(vscode_connect)
+cli.add_command(vm_up)
+cli.add_command(zones)
+cli.add_command(schedule)
 
 
 if __name__ == "__main__":
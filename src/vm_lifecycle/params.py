@@ -1,3 +1,4 @@
+import click
 from pathlib import Path
 from platformdirs import user_config_dir
 
@@ -6,8 +7,33 @@ APP_NAME = "vmlc"
 CONFIG_DIR = Path(user_config_dir(APP_NAME))
 CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 DEFAULT_CONFIG_PATH = CONFIG_DIR / "config.yaml"
+DEFAULT_TIMINGS_PATH = CONFIG_DIR / "timings.yaml"
+DEFAULT_CACHE_PATH = CONFIG_DIR / "cache.yaml"
+DEFAULT_SCRIPT_CACHE_DIR = CONFIG_DIR / "scripts"
+DEFAULT_SSH_CONFIG_PATH = Path.home() / ".ssh" / "config"
+# Key and known hosts file gcloud creates and registers for Compute Engine
+GCLOUD_SSH_KEY_PATH = Path.home() / ".ssh" / "google_compute_engine"
+GCLOUD_KNOWN_HOSTS_PATH = Path.home() / ".ssh" / "google_compute_known_hosts"
+# Guest attribute namespace the guest agent publishes the VM's host keys in
+HOSTKEYS_GUEST_NAMESPACE = "hostkeys"
+# Added to the managed SSH host entry, sessions share one authenticated
+# connection that stays open for a while after the last one closes
+SSH_MULTIPLEXING_OPTIONS = {
+    "ControlMaster": "auto",
+    "ControlPath": "~/.ssh/vmlc-%C",
+    "ControlPersist": "10m",
+    "Compression": "yes",
+    "ServerAliveInterval": "30",
+    "ServerAliveCountMax": "4",
+}
+SYSTEMD_USER_DIR = Path.home() / ".config" / "systemd" / "user"
+# Runs a command against this profile instead of the active one
+PROFILE_ENV_VAR = "VMLC_PROFILE"
+# Seconds cached GCP lookups (e.g. zone disk types) are reused for
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60
 
 ##### GCP Misc lists
+# Fallback when the machine type catalog can not be fetched
 GCP_MACHINE_TYPES = [
     "e2-medium",
     "e2-standard-2",
@@ -18,5 +44,208 @@ GCP_MACHINE_TYPES = [
     "n2-standard-4",
 ]
 
+# Approximate on-demand price per vCPU relative to e2, used to rank families
+# when recommending a machine type. Families not listed rank last
+MACHINE_FAMILY_RELATIVE_COST = {
+    "e2": 1.0,
+    "t2d": 1.2,
+    "n2d": 1.3,
+    "n4": 1.4,
+    "n1": 1.45,
+    "n2": 1.45,
+    "c3d": 1.6,
+    "c2d": 1.65,
+    "c3": 1.7,
+    "c2": 1.75,
+    "c4": 1.8,
+}
+# A GB of memory costs roughly this fraction of a vCPU in the same family
+MEMORY_GB_RELATIVE_COST = 0.134
+
+##### Zone latency probe
+# Per-region endpoints, one small service deployed in every GCP region
+PROBE_ENDPOINTS_URL = "https://global.gcping.com/api/endpoints"
+PROBE_PATH = "/api/ping"
+PROBE_ATTEMPTS = 3
+PROBE_TIMEOUT = 3.0
+
+##### Disks
+DISK_TYPES = [
+    "pd-standard",
+    "pd-balanced",
+    "pd-ssd",
+    "pd-extreme",
+    "hyperdisk-balanced",
+]
+DEFAULT_DISK_TYPE = "pd-balanced"
+# Disk types that accept provisioned IOPS and throughput
+PROVISIONED_IOPS_DISK_TYPES = ["pd-extreme", "hyperdisk-balanced"]
+PROVISIONED_THROUGHPUT_DISK_TYPES = ["hyperdisk-balanced"]
+# Approximate USD per GB and month of capacity, us-central1 list prices
+DISK_GB_MONTH_PRICE = {
+    "pd-standard": 0.04,
+    "pd-balanced": 0.10,
+    "pd-ssd": 0.17,
+    "pd-extreme": 0.125,
+    "hyperdisk-balanced": 0.08,
+}
+
+##### Networking
+NETWORK_TIERS = ["STANDARD", "PREMIUM"]
+DEFAULT_NETWORK_TIER = "STANDARD"
+NIC_TYPES = ["VIRTIO_NET", "GVNIC"]
+DEFAULT_NIC_TYPE = "VIRTIO_NET"
+# Tier_1 bandwidth needs gVNIC, one of these families and enough vCPUs
+TIER1_MACHINE_FAMILIES = ["n2", "n2d", "c2", "c2d", "c3", "c3d", "m3", "z3"]
+TIER1_MIN_VCPUS = 30
+
+##### Placement
+# Operation error codes of a zone that has no capacity left for a machine type
+STOCKOUT_ERROR_CODES = [
+    "ZONE_RESOURCE_POOL_EXHAUSTED",
+    "ZONE_RESOURCE_POOL_EXHAUSTED_WITH_DETAILS",
+]
+
+##### Lifecycle
+# Artifact used to park a VM, 'disk' keeps the boot disk and drops the instance,
+# 'machine-image' also captures the instance configuration
+PARK_STRATEGIES = ["image", "snapshot", "disk", "machine-image"]
+# Artifact used to move a VM between zones
+MIGRATION_STRATEGIES = ["image", "snapshot", "machine-image"]
+DEFAULT_PARK_STRATEGY = "image"
+# Consecutive snapshot parks before the next park is compacted into an image
+DEFAULT_SNAPSHOT_CHAIN_LIMIT = 10
+SNAPSHOT_SEQ_LABEL = "vmlc-park-seq"
+# Guest attribute the VM may set to 'true' or 'false' to report disk changes
+DIRTY_GUEST_ATTRIBUTE = "vmlc/dirty"
+# Guest attribute the pre-warm stage sets to 'running', then 'done <seconds>s'
+PREWARM_GUEST_ATTRIBUTE = "vmlc/prewarm"
+# Operation durations kept per profile, action and strategy
+TIMING_SAMPLE_LIMIT = 20
+
+# Seconds 'vmlc start --wait-ready' waits for the guest, and between checks
+READY_TIMEOUT = 300
+READY_POLL_INTERVAL = 2
+SSH_PORT = 22
+# Console line of the guest agent once every startup script has run
+STARTUP_SCRIPTS_DONE_MARKER = "Finished running startup scripts"
+# Console line starting every boot, older output belongs to previous boots
+BOOT_MARKER = "Linux version"
+# Server of the locally installed VS Code, baked into the VM before it is parked
+VSCODE_SERVER_URL = (
+    "https://update.code.visualstudio.com/commit:{commit}/server-linux-{arch}/stable"
+)
+VSCODE_SERVER_TIMEOUT = 300
+# Non-interactive SSH, a stop or bake never waits on a prompt
+SSH_BATCH_OPTIONS = [
+    "-o",
+    "BatchMode=yes",
+    "-o",
+    "ConnectTimeout=10",
+    "-o",
+    "StrictHostKeyChecking=accept-new",
+]
+# Startup scripts 'vmlc create' and 'vmlc bake' can provision a VM with, and
+# their templates in vm_lifecycle/scripts
+STARTUP_SCRIPT_TEMPLATES = {"ansible": "startup_ansible.sh", "prewarm": "prewarm.sh"}
+# Choices of --startup-script, 'prewarm' is added by restores
+STARTUP_SCRIPTS = ["ansible"]
+DEFAULT_STARTUP_SCRIPT = "ansible"
+# Prepended to every template, runs each stage of a script version once
+STAGE_GUARD_TEMPLATE = "stage_guard.sh"
+# 'vmlc bake' provisions a builder VM once and images it into a family per
+# startup script, 'vmlc create --baked' boots from it without provisioning
+BAKED_FAMILY_PREFIX = "vmlc-baked"
+# Smallest Ubuntu boot disk, instances from the image may use larger disks
+BAKE_DISK_SIZE = 10
+# Seconds the builder gets to finish its startup script
+BAKE_TIMEOUT = 1200
+# Baked images kept per family, older versions are deleted
+BAKED_IMAGE_VERSIONS = 3
+# Commands that can run on a schedule, see 'vmlc schedule'
+SCHEDULE_ACTIONS = ["start", "stop"]
+
+# Whether 'vmlc start' copies an image stored outside the target region first,
+# 'ask' only prompts when run interactively and restores across regions otherwise
+COPY_IMAGE_MODES = ["ask", "always", "never"]
+DEFAULT_COPY_IMAGE = "ask"
+
+# Multi-region storage locations and the region prefixes they cover
+MULTI_REGION_PREFIXES = {"eu": "europe-", "us": "us-", "asia": "asia-"}
+
+##### Optional profile settings, set with 'vmlc profile option'
+PROFILE_OPTIONS = {
+    "park_strategy": {
+        "type": click.Choice(PARK_STRATEGIES),
+        "default": DEFAULT_PARK_STRATEGY,
+        "help": "Default artifact used by 'vmlc stop' to park the VM",
+    },
+    "image_storage_location": {
+        "type": click.STRING,
+        "default": None,
+        "help": "Region or multi-region (eu, us, asia) images are stored in, defaults to the profile region",
+    },
+    "copy_image": {
+        "type": click.Choice(COPY_IMAGE_MODES),
+        "default": DEFAULT_COPY_IMAGE,
+        "help": "Copy an image stored outside the target region before 'vmlc start' restores it, 'ask' prompts when run interactively",
+    },
+    "disk_type": {
+        "type": click.Choice(DISK_TYPES),
+        "default": DEFAULT_DISK_TYPE,
+        "help": "Boot disk type, checked against the disk types of the zone",
+    },
+    "disk_iops": {
+        "type": click.IntRange(min=1),
+        "default": None,
+        "help": "Provisioned IOPS for pd-extreme and hyperdisk-balanced disks",
+    },
+    "disk_throughput": {
+        "type": click.IntRange(min=1),
+        "default": None,
+        "help": "Provisioned throughput in MB/s for hyperdisk-balanced disks",
+    },
+    "network_tier": {
+        "type": click.Choice(NETWORK_TIERS),
+        "default": DEFAULT_NETWORK_TIER,
+        "help": "Network tier of the external IP, PREMIUM routes over Google's network",
+    },
+    "nic_type": {
+        "type": click.Choice(NIC_TYPES),
+        "default": DEFAULT_NIC_TYPE,
+        "help": "Network interface type, GVNIC also marks parked images as gVNIC capable",
+    },
+    "tier1_networking": {
+        "type": click.BOOL,
+        "default": False,
+        "help": "Tier_1 egress bandwidth, for supported machine types with 30+ vCPUs",
+    },
+    "snapshot_chain_limit": {
+        "type": click.IntRange(min=1),
+        "default": DEFAULT_SNAPSHOT_CHAIN_LIMIT,
+        "help": "Snapshot parks in a row before the chain is compacted into an image",
+    },
+    "static_ip": {
+        "type": click.BOOL,
+        "default": False,
+        "help": "Reserve a static external IP in the profile region and attach it to the VM, billed while the VM is parked",
+    },
+    "vscode_server": {
+        "type": click.BOOL,
+        "default": False,
+        "help": "Install the server of the local VS Code on the VM before 'vmlc stop' parks it",
+    },
+    "prewarm_paths": {
+        "type": click.STRING,
+        "default": None,
+        "help": "Comma separated directories read in the background after 'vmlc start' restores from an image or snapshot, e.g. /home/user/repo",
+    },
+    "standby": {
+        "type": click.BOOL,
+        "default": False,
+        "help": "Keep a stopped instance after an image park so 'vmlc start' skips the restore, the disk is billed while parked",
+    },
+}
+
 if __name__ == "__main__":
     print(DEFAULT_CONFIG_PATH)
@@ -0,0 +1,173 @@
+import click
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from googleapiclient.errors import HttpError
+
+from vm_lifecycle.compute_manager import GCPComputeManager
+from vm_lifecycle.params import STOCKOUT_ERROR_CODES
+from vm_lifecycle.utils import spinner
+
+
+def is_stockout(error) -> bool:
+    """Whether an operation error, or an HttpError, means the zone ran out of capacity."""
+    if isinstance(error, HttpError):
+        content = error.content
+        if isinstance(content, bytes):
+            content = content.decode(errors="ignore")
+        return any(code in str(content) for code in STOCKOUT_ERROR_CODES)
+    if not isinstance(error, dict):
+        return False
+    return any(e.get("code") in STOCKOUT_ERROR_CODES for e in error.get("errors", []))
+
+
+def fallback_zones(
+    compute_manager: GCPComputeManager, zone: str, machine_type: str
+) -> list:
+    """The other zones of zone's region that offer machine_type."""
+    region = "-".join(zone.split("-")[:-1])
+    try:
+        offering = compute_manager.list_zones_offering_machine_type(machine_type)
+    except HttpError as e:
+        click.echo(
+            f"⚠️ Could not list zones offering machine type: '{machine_type}': {e}"
+        )
+        return []
+    return [z for z in offering if z != zone and "-".join(z.split("-")[:-1]) == region]
+
+
+def place_instance(
+    compute_manager: GCPComputeManager,
+    create_fn,
+    zones: list,
+    instance_name: str,
+    machine_type: str,
+    text: str,
+    race: bool = False,
+):
+    """
+    Create an instance with create_fn(zone), one zone after the other while
+    zones report a stockout. With race, two zones are tried at once and the
+    instance that comes up last is deleted.
+
+    Returns the zone the instance was created in, None if none had capacity,
+    and the final operation result.
+    """
+    batch_size = 2 if race else 1
+    exhausted = []
+
+    for i in range(0, len(zones), batch_size):
+        batch = zones[i : i + batch_size]
+        placed, results = _create_in_zones(
+            compute_manager, create_fn, batch, instance_name, text
+        )
+        if placed:
+            return placed, results[placed]
+
+        for zone in batch:
+            if not is_stockout(results[zone].get("error")):
+                return None, results[zone]
+            click.echo(
+                f"⚠️ Zone: '{zone}' has no capacity for machine type: '{machine_type}'"
+            )
+            exhausted.append(zone)
+
+    return None, {
+        "success": False,
+        "error": {
+            "message": f"No capacity for machine type: '{machine_type}' in zones: {', '.join(exhausted) or '-'}"
+        },
+    }
+
+
+def _create_in_zones(
+    compute_manager: GCPComputeManager,
+    create_fn,
+    zones: list,
+    instance_name: str,
+    text: str,
+):
+    """
+    Issue the inserts for all zones and poll them behind one spinner. The first
+    instance to come up wins, the inserts of the others are waited for and
+    their instances deleted.
+    """
+    ops = {}
+    results = {}
+    for zone in zones:
+        try:
+            ops[zone] = create_fn(zone)
+        except HttpError as e:
+            error = {"message": str(e)}
+            if is_stockout(e):
+                error["errors"] = [{"code": STOCKOUT_ERROR_CODES[0]}]
+            results[zone] = {"success": False, "error": error}
+
+    won = threading.Event()
+
+    def drain(zone: str, race: bool = True):
+        gen = compute_manager.wait_for_operation(ops[zone]["name"], "zone", zone=zone)
+        while True:
+            try:
+                next(gen)
+            except StopIteration as stop:
+                return stop.value
+            # Another zone won, stop polling this one
+            if race and won.is_set():
+                return None
+
+    winner = None
+    zones_text = ", ".join(f"'{zone}'" for zone in ops)
+    try:
+        with spinner(
+            text=f"{text} in zone{'s' if len(ops) > 1 else ''}: {zones_text}",
+            done_text=f"✅ Instance: '{instance_name}' created",
+        ):
+            if ops:
+                with ThreadPoolExecutor(max_workers=len(ops)) as executor:
+                    futures = {executor.submit(drain, zone): zone for zone in ops}
+                    for future in as_completed(futures):
+                        zone = futures[future]
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            result = {"success": False, "error": {"message": str(e)}}
+                        if result is None:
+                            continue
+                        results[zone] = result
+                        if result["success"] and winner is None:
+                            winner = zone
+                            won.set()
+            if winner is None:
+                raise RuntimeError("GCP Operation completed with errors")
+    except RuntimeError:
+        pass
+
+    # GCP rejects deleting an instance whose insert is still running, wait for
+    # the losing inserts before deleting what they created
+    pending = [zone for zone in ops if zone != winner and zone not in results]
+    if pending:
+        with spinner(
+            text=f"Waiting for the insert in zone{'s' if len(pending) > 1 else ''}: {', '.join(pending)} to finish",
+            done_text=f"✅ Insert in zone{'s' if len(pending) > 1 else ''}: {', '.join(pending)} finished",
+        ):
+            for zone in pending:
+                try:
+                    results[zone] = drain(zone, race=False)
+                except Exception as e:
+                    results[zone] = {"success": False, "error": {"message": str(e)}}
+
+    # Inserts that finished after the winner leave an instance behind
+    for zone in ops:
+        if zone == winner or (zone in results and not results[zone]["success"]):
+            continue
+        try:
+            compute_manager.delete_instance(instance_name, zone=zone)
+            click.echo(f"🗑️ Deleting instance: '{instance_name}' in zone: '{zone}'")
+        except HttpError as e:
+            click.echo(
+                f"⚠️ Failed to delete instance: '{instance_name}' in zone: '{zone}': {e}"
+            )
+
+    if winner and len(zones) > 1:
+        click.echo(f"🏁 Zone: '{winner}' won the race")
+    return winner, results
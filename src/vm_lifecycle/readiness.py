@@ -0,0 +1,106 @@
+import socket
+import time
+from googleapiclient.errors import HttpError
+
+from vm_lifecycle.compute_manager import GCPComputeManager
+from vm_lifecycle.params import (
+    READY_TIMEOUT,
+    READY_POLL_INTERVAL,
+    SSH_PORT,
+    STARTUP_SCRIPTS_DONE_MARKER,
+    BOOT_MARKER,
+)
+
+
+def external_ip(instance: dict):
+    """External IP of the first network interface, None until one is allocated."""
+    for interface in instance.get("networkInterfaces", []):
+        for access_config in interface.get("accessConfigs", []):
+            if access_config.get("natIP"):
+                return access_config["natIP"]
+    return None
+
+
+def has_startup_script(instance: dict) -> bool:
+    items = instance.get("metadata", {}).get("items", [])
+    return any(
+        item.get("key") in ("startup-script", "startup-script-url") for item in items
+    )
+
+
+def ssh_ready(
+    host: str, port: int = SSH_PORT, timeout: float = READY_POLL_INTERVAL
+) -> bool:
+    """Whether sshd on host answers with its protocol banner."""
+    try:
+        with socket.create_connection((host, port), timeout=timeout) as conn:
+            conn.settimeout(timeout)
+            return conn.recv(4).startswith(b"SSH-")
+    except OSError:
+        return False
+
+
+def startup_scripts_done(console_output: str) -> bool:
+    """Whether the startup scripts of the latest boot in the console output finished."""
+    current_boot = console_output.rsplit(BOOT_MARKER, 1)[-1]
+    return STARTUP_SCRIPTS_DONE_MARKER in current_boot
+
+
+def wait_until_ready(
+    compute_manager: GCPComputeManager,
+    instance_name: str,
+    zone: str,
+    timeout: int = READY_TIMEOUT,
+    poll_interval: float = READY_POLL_INTERVAL,
+    on_external_ip=None,
+    startup_script: bool = True,
+) -> dict:
+    """
+    Wait until the instance has an external IP, sshd answers and, if it has
+    one and startup_script is set, its startup script finished. on_external_ip
+    is called with the instance as soon as its IP is known, while sshd is still
+    starting. Returns the seconds after which each phase was reached, raises
+    TimeoutError naming the phase that did not finish.
+    """
+    start = time.monotonic()
+    phases = {}
+
+    def wait_for(phase: str, check):
+        while True:
+            value = check()
+            if value:
+                phases[phase] = round(time.monotonic() - start, 1)
+                return value
+            if time.monotonic() - start > timeout:
+                raise TimeoutError(
+                    f"Instance '{instance_name}' not ready after {timeout}s, waiting for: {phase}"
+                )
+            time.sleep(poll_interval)
+
+    instance = {}
+
+    def fetch_ip():
+        instance.update(compute_manager.get_instance(instance_name, zone=zone))
+        return external_ip(instance)
+
+    ip = wait_for("external_ip", fetch_ip)
+    if on_external_ip:
+        on_external_ip(instance)
+    wait_for("ssh", lambda: ssh_ready(ip))
+
+    if startup_script and has_startup_script(instance):
+        console = {"output": "", "next": 0}
+
+        def read_console():
+            try:
+                contents, console["next"] = compute_manager.get_serial_port_output(
+                    instance_name, zone=zone, start=console["next"]
+                )
+            except HttpError:
+                return False
+            console["output"] += contents
+            return startup_scripts_done(console["output"])
+
+        wait_for("startup_script", read_console)
+
+    return phases
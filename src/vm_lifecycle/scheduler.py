@@ -0,0 +1,207 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from vm_lifecycle.params import PROFILE_ENV_VAR, SCHEDULE_ACTIONS
+
+# Cron fields: minute, hour, day of month, month, day of week
+CRON_FIELDS = [
+    ("minute", 0, 59),
+    ("hour", 0, 23),
+    ("day of month", 1, 31),
+    ("month", 1, 12),
+    ("day of week", 0, 7),
+]
+WEEKDAYS = ["Sun", "Mon", "Tue", "Wed", "Thu", "Fri", "Sat"]
+
+
+######## Cron rules
+def _parse_field(field: str, name: str, low: int, high: int) -> set:
+    values = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            if not step_text.isdigit() or int(step_text) < 1:
+                raise ValueError(f"Invalid step in {name}: '{step_text}'")
+            step = int(step_text)
+
+        if part == "*":
+            start, end = low, high
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            if not start_text.isdigit() or not end_text.isdigit():
+                raise ValueError(f"Invalid range in {name}: '{part}'")
+            start, end = int(start_text), int(end_text)
+        elif part.isdigit():
+            start = int(part)
+            # 'n/step' runs from n to the end of the field
+            end = high if step > 1 else start
+        else:
+            raise ValueError(f"Invalid {name}: '{part}'")
+
+        if start < low or end > high or start > end:
+            raise ValueError(f"{name.capitalize()} out of range {low}-{high}: '{part}'")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+def parse_cron(expression: str) -> list:
+    """Parse a five field cron expression into the set of values of each field."""
+    fields = expression.split()
+    if len(fields) != len(CRON_FIELDS):
+        raise ValueError(
+            f"Expected 5 fields (minute hour day-of-month month day-of-week), got {len(fields)}"
+        )
+    parsed = [
+        _parse_field(field, name, low, high)
+        for field, (name, low, high) in zip(fields, CRON_FIELDS)
+    ]
+    # Sunday is both 0 and 7
+    if 7 in parsed[4]:
+        parsed[4] = (parsed[4] - {7}) | {0}
+    return parsed
+
+
+def cron_matches(expression: str, moment: datetime) -> bool:
+    """Whether the minute of moment matches the cron expression."""
+    minutes, hours, days, months, weekdays = parse_cron(expression)
+    fields = expression.split()
+    if moment.minute not in minutes or moment.hour not in hours:
+        return False
+    if moment.month not in months:
+        return False
+
+    # Like cron, a restricted day of month or day of week is enough to match
+    day_match = moment.day in days
+    weekday_match = moment.isoweekday() % 7 in weekdays
+    if not fields[2].startswith("*") and not fields[4].startswith("*"):
+        return day_match or weekday_match
+    return day_match and weekday_match
+
+
+def cron_to_on_calendar(expression: str) -> str:
+    """Translate a cron expression into a systemd OnCalendar specification."""
+    parse_cron(expression)
+    minute, hour, day, month, weekday = expression.split()
+    if not day.startswith("*") and not weekday.startswith("*"):
+        raise ValueError(
+            "Rules restricting both day of month and day of week can not be used with systemd timers"
+        )
+
+    def convert(field: str, low: int, names: list = None) -> str:
+        parts = []
+        for part in field.split(","):
+            step = None
+            if "/" in part:
+                part, step = part.split("/", 1)
+            if part == "*":
+                # systemd repeats from a start value, cron from the field minimum
+                part = str(low) if step else "*"
+            elif "-" in part:
+                if step:
+                    raise ValueError(
+                        f"Stepped ranges can not be used with systemd timers: '{field}'"
+                    )
+                start, end = part.split("-", 1)
+                if names:
+                    start, end = names[int(start) % 7], names[int(end) % 7]
+                part = f"{start}..{end}"
+            elif names:
+                part = names[int(part) % 7]
+            parts.append(f"{part}/{step}" if step else part)
+        return ",".join(parts)
+
+    if "/" in weekday:
+        raise ValueError(
+            f"Stepped day of week can not be used with systemd timers: '{weekday}'"
+        )
+    calendar = f"*-{convert(month, 1)}-{convert(day, 1)} {convert(hour, 0)}:{convert(minute, 0)}:00"
+    if weekday != "*":
+        calendar = f"{convert(weekday, 0, WEEKDAYS)} {calendar}"
+    return calendar
+
+
+def due_rules(schedules: dict, moment: datetime) -> list:
+    """(profile, action) of every schedule rule matching the minute of moment."""
+    return [
+        (profile_name, rule["action"])
+        for profile_name, rules in schedules.items()
+        for rule in rules
+        if cron_matches(rule["cron"], moment)
+    ]
+
+
+######## Running scheduled actions
+def action_command(action: str) -> list:
+    """Command line that runs a vmlc action with the interpreter of this install."""
+    if action not in SCHEDULE_ACTIONS:
+        raise ValueError(f"Unsupported scheduled action: '{action}'")
+    return [sys.executable, "-m", "vm_lifecycle.main", action]
+
+
+def systemd_exec(args: list) -> str:
+    """
+    Command line for ExecStart, every argument double quoted so paths with
+    spaces stay one argument. systemd expands % specifiers and $ variables
+    in command lines, both are escaped.
+    """
+    quoted = []
+    for arg in args:
+        arg = arg.replace("\\", "\\\\").replace('"', '\\"')
+        arg = arg.replace("%", "%%").replace("$", "$$")
+        quoted.append(f'"{arg}"')
+    return " ".join(quoted)
+
+
+def systemd_units(profile_name: str, index: int, rule: dict) -> dict:
+    """File name and content of the service and timer running one rule."""
+    unit = f"vmlc-{profile_name}-{index}-{rule['action']}"
+    description = f"vmlc {rule['action']} for profile {profile_name} ({rule['cron']})"
+    service = (
+        "[Unit]\n"
+        f"Description={description}\n\n"
+        "[Service]\n"
+        "Type=oneshot\n"
+        f"Environment={PROFILE_ENV_VAR}={profile_name}\n"
+        f"ExecStart={systemd_exec(action_command(rule['action']))}\n"
+    )
+    timer = (
+        "[Unit]\n"
+        f"Description={description}\n\n"
+        "[Timer]\n"
+        f"OnCalendar={cron_to_on_calendar(rule['cron'])}\n"
+        # Catch up on a run missed while the machine was asleep or off
+        "Persistent=true\n\n"
+        "[Install]\n"
+        "WantedBy=timers.target\n"
+    )
+    return {f"{unit}.service": service, f"{unit}.timer": timer}
+
+
+def write_systemd_units(schedules: dict, unit_dir: Path) -> tuple:
+    """
+    Write a service and timer per schedule rule into unit_dir and remove units
+    of rules that no longer exist. Returns the names of the written and of the
+    removed timers.
+    """
+    unit_dir.mkdir(parents=True, exist_ok=True)
+    units = {}
+    for profile_name, rules in schedules.items():
+        for index, rule in enumerate(rules, 1):
+            units.update(systemd_units(profile_name, index, rule))
+
+    removed = []
+    for stale in unit_dir.glob("vmlc-*"):
+        if stale.name not in units:
+            stale.unlink()
+            removed.append(stale.name)
+    for name, content in units.items():
+        (unit_dir / name).write_text(content, encoding="utf-8")
+
+    timers = sorted(name for name in units if name.endswith(".timer"))
+    return timers, sorted(name for name in removed if name.endswith(".timer"))
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,33 @@
+# Disks created from an image or snapshot fetch each block on first read.
+# Read the hot paths once per instance, so later builds read a warm disk
+PREWARM_PATHS=(@prewarm_paths@)
+PREWARM_ATTRIBUTE_URL="http://metadata.google.internal/computeMetadata/v1/instance/guest-attributes/@prewarm_attribute@"
+
+report_prewarm() {
+    curl -s -X PUT --data "$1" -H "Metadata-Flavor: Google" "$PREWARM_ATTRIBUTE_URL" || true
+}
+
+prewarm() {
+    local start=$SECONDS
+    report_prewarm "running"
+    for path in "${PREWARM_PATHS[@]}"; do
+        [ -e "$path" ] || continue
+        find "$path" -xdev -type f -exec cat {} + > /dev/null 2>&1 || true
+    done
+    report_prewarm "done $((SECONDS - start))s"
+}
+
+instance_id="$(curl -s -H "Metadata-Flavor: Google" http://metadata.google.internal/computeMetadata/v1/instance/id || true)"
+prewarm_marker="$VMLC_STATE_DIR/prewarm.${instance_id:-unknown}"
+# A restarted instance keeps its warm disk
+if [ ! -e "$prewarm_marker" ]; then
+    mkdir -p "$VMLC_STATE_DIR"
+    touch "$prewarm_marker"
+    # Idle IO class and lowest CPU priority, in the background so boot goes on
+    (
+        ionice -c 3 -p "$BASHPID" > /dev/null 2>&1 || true
+        renice -n 19 -p "$BASHPID" > /dev/null 2>&1 || true
+        prewarm
+    ) < /dev/null > /dev/null 2>&1 &
+    disown
+fi
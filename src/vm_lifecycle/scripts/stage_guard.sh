@@ -0,0 +1,20 @@
+#!/usr/bin/env bash
+set -e
+
+# Each stage runs once per version of this script. The markers are kept in
+# parked images, so VMs restored from them skip the stages on boot
+VMLC_STATE_DIR="${VMLC_STATE_DIR:-/var/lib/vmlc/stages}"
+VMLC_SCRIPT_HASH="@script_hash@"
+
+stage() {
+    local name="$1"
+    shift
+    local marker="$VMLC_STATE_DIR/$name.$VMLC_SCRIPT_HASH"
+    if [ -e "$marker" ]; then
+        echo "vmlc: stage '$name' already done, skipping"
+        return 0
+    fi
+    "$@"
+    mkdir -p "$VMLC_STATE_DIR"
+    touch "$marker"
+}
@@ -0,0 +1,22 @@
+# Ensure the user exists
+create_user() {
+    if ! id "@instance_user@" &>/dev/null; then
+        useradd -m -s /bin/bash @instance_user@
+        echo "@instance_user@ ALL=(ALL) NOPASSWD:ALL" >> /etc/sudoers
+    fi
+}
+
+# Ensure Ansible is installed
+install_ansible() {
+    if ! command -v ansible &> /dev/null; then
+        apt update -y
+        apt install -y software-properties-common
+        add-apt-repository --yes --update ppa:ansible/ansible
+        apt install -y ansible
+    fi
+}
+
+stage user create_user
+stage ansible install_ansible
+
+echo "Ansible installed successfully!"
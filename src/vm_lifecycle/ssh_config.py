@@ -0,0 +1,112 @@
+import os
+import tempfile
+from pathlib import Path
+from vm_lifecycle.params import DEFAULT_SSH_CONFIG_PATH
+
+
+class SSHConfigManager:
+    """
+    Keeps one managed Host entry per VM in the user's SSH config, between
+    marker comments, and leaves the rest of the file untouched.
+    """
+
+    BEGIN = "# vmlc begin {host}"
+    END = "# vmlc end {host}"
+
+    def __init__(self, ssh_config_path: Path = DEFAULT_SSH_CONFIG_PATH):
+        self.ssh_config_path = ssh_config_path
+
+    def _read(self) -> str:
+        if self.ssh_config_path.exists():
+            return self.ssh_config_path.read_text(encoding="utf-8")
+        return ""
+
+    def _write(self, content: str):
+        """Replace the file in one step, ssh never reads a half written config."""
+        # Replace the target of a symlinked config, not the link
+        target = self.ssh_config_path.resolve()
+        target.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=".config-vmlc-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _find(self, lines: list, host: str):
+        """Line indexes of the markers of host's managed entry, None if there is none."""
+        begin = self.BEGIN.format(host=host)
+        end = self.END.format(host=host)
+        stripped = [line.rstrip("\n") for line in lines]
+        if begin not in stripped:
+            return None
+        start = stripped.index(begin)
+        if end not in stripped[start:]:
+            return None
+        return start, stripped.index(end, start)
+
+    def _split(self, content: str, host: str):
+        """Content before and after the managed entry of host, None if there is none."""
+        lines = content.splitlines(keepends=True)
+        found = self._find(lines, host)
+        if found is None:
+            return None
+        start, end = found
+        return "".join(lines[:start]), "".join(lines[end + 1 :])
+
+    def render_host(self, host: str, options: dict) -> str:
+        lines = [self.BEGIN.format(host=host), f"Host {host}"]
+        lines += [f"    {key} {value}" for key, value in options.items()]
+        lines.append(self.END.format(host=host))
+        return "\n".join(lines) + "\n"
+
+    def get_host(self, host: str):
+        """Options of the managed entry of host, None if there is none."""
+        lines = self._read().splitlines()
+        found = self._find(lines, host)
+        if found is None:
+            return None
+        start, end = found
+        options = {}
+        # Skip the marker and the Host line
+        for line in lines[start + 2 : end]:
+            key, _, value = line.strip().partition(" ")
+            options[key] = value
+        return options
+
+    def update_host(self, host: str, options: dict) -> bool:
+        """
+        Write the managed entry of host. New entries go first, ssh uses the
+        first value it finds for an option. Returns False if nothing changed.
+        """
+        content = self._read()
+        entry = self.render_host(host, options)
+        parts = self._split(content, host)
+        if parts is None:
+            updated = entry + ("\n" + content if content else "")
+        else:
+            updated = parts[0] + entry + parts[1]
+
+        if updated == content:
+            return False
+        self._write(updated)
+        return True
+
+    def remove_host(self, host: str) -> bool:
+        content = self._read()
+        parts = self._split(content, host)
+        if parts is None:
+            return False
+        before, after = parts
+        # Drop the blank line that separated a prepended entry
+        if not before and after.startswith("\n"):
+            after = after[1:]
+        self._write(before + after)
+        return True
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,72 @@
+import hashlib
+import re
+from importlib.resources import files
+from pathlib import Path
+
+from vm_lifecycle.params import (
+    DEFAULT_SCRIPT_CACHE_DIR,
+    STARTUP_SCRIPT_TEMPLATES,
+    STAGE_GUARD_TEMPLATE,
+)
+
+# @name@ placeholders, braces and $ are left to bash
+PLACEHOLDER = re.compile(r"@(\w+)@")
+
+
+class StartupScriptRenderer:
+    """
+    Renders the startup script templates packaged in vm_lifecycle/scripts.
+    Rendered scripts are cached on disk by the hash of template and values,
+    the same hash versions the stage markers the script leaves on the VM.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_SCRIPT_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    @staticmethod
+    def template(*names: str) -> str:
+        """The stage guard followed by the templates registered for names."""
+        for name in names:
+            if name not in STARTUP_SCRIPT_TEMPLATES:
+                raise ValueError(
+                    f"Unknown startup script: '{name}', expected one of: {', '.join(STARTUP_SCRIPT_TEMPLATES)}"
+                )
+        scripts = files("vm_lifecycle") / "scripts"
+        parts = [STAGE_GUARD_TEMPLATE] + [STARTUP_SCRIPT_TEMPLATES[n] for n in names]
+        return "\n".join((scripts / part).read_text(encoding="utf-8") for part in parts)
+
+    @staticmethod
+    def script_hash(template: str, values: dict) -> str:
+        digest = hashlib.sha256(template.encode("utf-8"))
+        for key, value in sorted(values.items()):
+            digest.update(f"\0{key}={value}".encode("utf-8"))
+        return digest.hexdigest()[:12]
+
+    def render(self, *names: str, **values) -> str:
+        """Render the templates of names into one script, GCP runs a single one."""
+        name = "-".join(names)
+        template = self.template(*names)
+        script_hash = self.script_hash(template, values)
+        cached = self.cache_dir / f"{name}-{script_hash}.sh"
+        if cached.exists():
+            return cached.read_text(encoding="utf-8")
+
+        values = {**values, "script_hash": script_hash}
+
+        def substitute(match):
+            key = match.group(1)
+            if key not in values:
+                raise KeyError(
+                    f"No value for placeholder: '@{key}@' in startup script: '{name}'"
+                )
+            return str(values[key])
+
+        script = PLACEHOLDER.sub(substitute, template)
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cached.write_text(script, encoding="utf-8")
+        return script
+
+
+if __name__ == "__main__":
+    pass
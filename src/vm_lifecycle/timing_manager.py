@@ -0,0 +1,67 @@
+import yaml
+from datetime import datetime
+from pathlib import Path
+from vm_lifecycle.params import DEFAULT_TIMINGS_PATH, TIMING_SAMPLE_LIMIT
+
+
+class TimingManager:
+    """
+    Records how long parking and restoring operations take, per profile, action
+    and strategy, so strategies can be compared with 'vmlc status --timings'.
+    """
+
+    def __init__(self, timings_path: Path = DEFAULT_TIMINGS_PATH):
+        self.timings_path = timings_path
+        self.timings = self._load_timings()
+
+    def _load_timings(self):
+        if self.timings_path.exists():
+            with self.timings_path.open("r", encoding="utf-8") as f:
+                return yaml.safe_load(f) or {}
+        return {}
+
+    def save_timings(self):
+        with self.timings_path.open("w", encoding="utf-8") as f:
+            yaml.dump(self.timings, f)
+
+    def record(self, profile_name: str, action: str, strategy: str, seconds: float):
+        samples = (
+            self.timings.setdefault(profile_name, {})
+            .setdefault(action, {})
+            .setdefault(strategy, [])
+        )
+        samples.append(round(seconds, 1))
+        del samples[:-TIMING_SAMPLE_LIMIT]
+        self.save_timings()
+
+    def summary(self, profile_name: str):
+        """Return {action: {strategy: {'count', 'mean', 'last'}}} for a profile."""
+        summary = {}
+        for action, strategies in self.timings.get(profile_name, {}).items():
+            for strategy, samples in strategies.items():
+                if not samples:
+                    continue
+                summary.setdefault(action, {})[strategy] = {
+                    "count": len(samples),
+                    "mean": round(sum(samples) / len(samples), 1),
+                    "last": samples[-1],
+                }
+        return summary
+
+    @staticmethod
+    def operation_duration(operation: dict):
+        """Seconds from insert to completion of a finished GCP operation, if known."""
+        start = operation.get("insertTime") or operation.get("startTime")
+        end = operation.get("endTime")
+        if not start or not end:
+            return None
+        try:
+            return (
+                datetime.fromisoformat(end) - datetime.fromisoformat(start)
+            ).total_seconds()
+        except ValueError:
+            return None
+
+
+if __name__ == "__main__":
+    pass
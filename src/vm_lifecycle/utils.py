@@ -10,6 +10,8 @@ from contextlib import contextmanager
 from googleapiclient.errors import HttpError
 from functools import wraps
 
+from vm_lifecycle.params import MULTI_REGION_PREFIXES
+
 # from vm_lifecycle.compute_manager import GCPComputeManager
 # from vm_lifecycle.config_manager import ConfigManager
 
@@ -35,6 +37,23 @@ def prompt_validation(prompt_text, validator_fn, error_msg):
         click.echo(f"❌ {error_msg}\n")
 
 
+######## GCP locations
+def region_in_storage_locations(region: str, storage_locations: list) -> bool:
+    """Whether a region is covered by an image's storage locations."""
+    for location in storage_locations:
+        if location == region:
+            return True
+        prefix = MULTI_REGION_PREFIXES.get(location)
+        if prefix and region.startswith(prefix):
+            return True
+    return False
+
+
+def is_interactive() -> bool:
+    """Whether prompts can be answered, False under the scheduler or in pipes."""
+    return sys.stdin.isatty()
+
+
 ######## Click Select from List
 def select_from_list(
     list_opt: List[str],
@@ -0,0 +1,102 @@
+import click
+import subprocess
+
+from vm_lifecycle.params import (
+    SSH_BATCH_OPTIONS,
+    VSCODE_SERVER_URL,
+    VSCODE_SERVER_TIMEOUT,
+)
+from vm_lifecycle.utils import spinner
+
+# Installs the server where Remote - SSH looks for it, the exec server layout
+# of current releases and the bin/<commit> layout of older ones
+INSTALL_SCRIPT = """set -e
+commit="{commit}"
+case "$(uname -m)" in
+    x86_64) arch=x64 ;;
+    aarch64|arm64) arch=arm64 ;;
+    armv7l) arch=armhf ;;
+    *) echo "unsupported architecture: $(uname -m)" >&2; exit 3 ;;
+esac
+server="$HOME/.vscode-server/cli/servers/Stable-$commit/server"
+legacy="$HOME/.vscode-server/bin/$commit"
+if [ -x "$server/bin/code-server" ] || [ -x "$legacy/bin/code-server" ]; then
+    echo present
+    exit 0
+fi
+url="{url}"
+tmp="$(mktemp -d)"
+trap 'rm -rf "$tmp"' EXIT
+if command -v curl >/dev/null; then
+    curl -fsSL "$url" -o "$tmp/server.tar.gz"
+else
+    wget -qO "$tmp/server.tar.gz" "$url"
+fi
+mkdir -p "$server" "$HOME/.vscode-server/bin"
+tar -xzf "$tmp/server.tar.gz" -C "$server" --strip-components=1
+[ -e "$legacy" ] || ln -s "$server" "$legacy"
+echo installed
+"""
+
+
+def local_commit():
+    """Commit of the locally installed VS Code, None if 'code' is not available."""
+    try:
+        result = subprocess.run(["code", "--version"], capture_output=True, text=True)
+    except FileNotFoundError:
+        return None
+    # Output is the version, the commit and the architecture, one per line
+    lines = result.stdout.splitlines()
+    if result.returncode != 0 or len(lines) < 2:
+        return None
+    return lines[1].strip()
+
+
+def install_script(commit: str) -> str:
+    # $arch is resolved on the VM
+    return INSTALL_SCRIPT.format(
+        commit=commit, url=VSCODE_SERVER_URL.format(commit=commit, arch="$arch")
+    )
+
+
+def ensure_server(host: str, commit: str, timeout: int = VSCODE_SERVER_TIMEOUT) -> str:
+    """
+    Install the VS Code server for commit on host over SSH unless it is there.
+    Returns 'present' or 'installed', raises RuntimeError if it fails.
+    """
+    try:
+        result = subprocess.run(
+            ["ssh", *SSH_BATCH_OPTIONS, host, "bash", "-s"],
+            input=install_script(commit),
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        raise RuntimeError(f"Timed out after {timeout}s")
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"exit code {result.returncode}")
+    return result.stdout.strip().splitlines()[-1]
+
+
+def bake_vscode_server(host: str):
+    """
+    Make sure the VM behind host has the server of the local VS Code, so the
+    first connect after a restore does not download it. Returns 'present' or
+    'installed', None if it was skipped or failed.
+    """
+    commit = local_commit()
+    if not commit:
+        click.echo("⚠️ 'code' not found, skipping VS Code server install")
+        return None
+
+    try:
+        with spinner(
+            text=f"Installing VS Code server: '{commit[:10]}' on: {host}",
+            done_text=f"🧩 VS Code server: '{commit[:10]}' on: {host}",
+        ):
+            status = ensure_server(host, commit)
+    except RuntimeError as e:
+        click.echo(f"⚠️ Failed to install VS Code server on: {host}: {e}")
+        return None
+    return status
@@ -0,0 +1,117 @@
+import pytest
+from click.testing import CliRunner
+from vm_lifecycle.commands.bake import bake_image
+
+
+@pytest.fixture
+def mock_context(mocker):
+    config_mock = mocker.Mock()
+    compute_mock = mocker.Mock()
+    config_mock.active = "dev"
+    config_mock.active_profile = {
+        "project_id": "test-project",
+        "zone": "europe-west1-b",
+        "region": "europe-west1",
+        "instance_name": "test-vm",
+        "instance_user": "user1",
+        "machine_type": "e2-standard-4",
+    }
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    compute_mock.stop_instance.return_value = {"name": "op-stop"}
+    compute_mock.delete_instance.return_value = {"name": "op-delete"}
+    compute_mock.delete_image.return_value = {"name": "op-delete-image"}
+    compute_mock.get_serial_port_output.return_value = (
+        "Linux version 6.1\nFinished running startup scripts.\n",
+        120,
+    )
+    compute_mock.create_image_from_instance.return_value = {
+        "name": "op-image",
+        "targetLink": "global/images/vmlc-baked-ansible-20250101-000000",
+    }
+    mocker.patch(
+        "vm_lifecycle.commands.bake.init_gcp_context",
+        return_value=(config_mock, compute_mock, "europe-west1-b"),
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.bake.poll_with_spinner",
+        return_value={"success": True},
+    )
+    timings = mocker.patch("vm_lifecycle.commands.bake.TimingManager")
+    return config_mock, compute_mock, timings
+
+
+def test_bake_images_provisioned_builder(mock_context, mocker):
+    config_mock, compute_mock, timings = mock_context
+    mocker.patch(
+        "vm_lifecycle.commands.bake.wait_until_ready",
+        return_value={"external_ip": 8.0, "ssh": 20.0, "startup_script": 95.0},
+    )
+    compute_mock.list_images.return_value = [
+        {"name": f"vmlc-baked-ansible-{i}", "creationTimestamp": f"2025-01-0{i}"}
+        for i in range(1, 6)
+    ]
+
+    result = CliRunner().invoke(bake_image)
+
+    assert result.exit_code == 0
+    create = compute_mock.create_instance.call_args.kwargs
+    assert create["instance_name"] == "test-vm-bake"
+    assert create["startup_script_type"] == "ansible"
+    image = compute_mock.create_image_from_instance.call_args.kwargs
+    assert image["family"] == "vmlc-baked-ansible"
+    compute_mock.delete_instance.assert_called_once_with(
+        instance_name="test-vm-bake", zone="europe-west1-b"
+    )
+    # Only the newest versions of the family are kept
+    assert [c.args[0] for c in compute_mock.delete_image.call_args_list] == [
+        "vmlc-baked-ansible-1",
+        "vmlc-baked-ansible-2",
+    ]
+    timings.return_value.record.assert_any_call("dev", "bake", "provision", 95.0)
+
+
+def test_bake_deletes_builder_when_provisioning_times_out(mock_context, mocker):
+    config_mock, compute_mock, _ = mock_context
+    mocker.patch(
+        "vm_lifecycle.commands.bake.wait_until_ready",
+        side_effect=TimeoutError("waiting for: startup_script"),
+    )
+
+    result = CliRunner().invoke(bake_image)
+
+    assert result.exit_code == 1
+    assert "waiting for: startup_script" in result.output
+    compute_mock.delete_instance.assert_called_once()
+    compute_mock.create_image_from_instance.assert_not_called()
+
+
+def test_bake_refuses_to_image_unfinished_provisioning(mock_context, mocker):
+    config_mock, compute_mock, _ = mock_context
+    # No startup script phase, the builder came up without the script
+    mocker.patch(
+        "vm_lifecycle.commands.bake.wait_until_ready",
+        return_value={"external_ip": 8.0, "ssh": 20.0},
+    )
+    compute_mock.get_serial_port_output.return_value = ("Linux version 6.1\n", 20)
+
+    result = CliRunner().invoke(bake_image)
+
+    assert result.exit_code == 1
+    assert "did not finish" in result.output
+    compute_mock.get_serial_port_output.assert_called_once_with(
+        "test-vm-bake", zone="europe-west1-b"
+    )
+    compute_mock.create_image_from_instance.assert_not_called()
+    compute_mock.delete_instance.assert_called_once()
+
+
+def test_bake_keeps_failed_builder(mock_context, mocker):
+    config_mock, compute_mock, _ = mock_context
+    mocker.patch(
+        "vm_lifecycle.commands.bake.wait_until_ready", side_effect=TimeoutError("x")
+    )
+
+    result = CliRunner().invoke(bake_image, ["--keep"])
+
+    assert result.exit_code == 1
+    compute_mock.delete_instance.assert_not_called()
@@ -16,6 +16,8 @@ def mock_context(mocker):
         }
     )
     compute = mocker.Mock()
+    # No host keys published by the guest agent yet
+    compute.get_guest_attributes.return_value = {}
     zone = "europe-west1-b"
     return config, compute, zone
 
@@ -35,7 +37,7 @@ def test_instance_not_found(mocker, mock_context):
         "vm_lifecycle.commands.connect.init_gcp_context",
         return_value=(config, compute, zone),
     )
-    compute.get_instance_status.side_effect = ValueError("Instance not found in zone")
+    compute.find_instance.side_effect = ValueError("Instance not found in zone")
     result = CliRunner().invoke(vscode_connect)
     assert result.exit_code == 1
     assert "not found in zone" in result.output
@@ -47,7 +49,7 @@ def test_instance_terminated(mocker, mock_context):
         "vm_lifecycle.commands.connect.init_gcp_context",
         return_value=(config, compute, zone),
     )
-    compute.get_instance_status.return_value = "TERMINATED"
+    compute.find_instance.return_value = {"status": "TERMINATED"}
     result = CliRunner().invoke(vscode_connect)
     assert result.exit_code == 1
     assert "but not running" in result.output
@@ -59,7 +61,7 @@ def test_successful_connection_with_default_path(mocker, mock_context):
         "vm_lifecycle.commands.connect.init_gcp_context",
         return_value=(config, compute, zone),
     )
-    compute.get_instance_status.return_value = "RUNNING"
+    compute.find_instance.return_value = {"status": "RUNNING"}
 
     mocker.patch("vm_lifecycle.commands.connect.create_vm_ssh_connection")
 
@@ -83,7 +85,7 @@ def test_successful_connection_with_custom_path(mocker, mock_context):
         "vm_lifecycle.commands.connect.init_gcp_context",
         return_value=(config, compute, zone),
     )
-    compute.get_instance_status.return_value = "RUNNING"
+    compute.find_instance.return_value = {"status": "RUNNING"}
 
     mocker.patch("vm_lifecycle.commands.connect.create_vm_ssh_connection")
 
@@ -100,3 +102,149 @@ def test_successful_connection_with_custom_path(mocker, mock_context):
         "vscode-remote://ssh-remote+test-vm.europe-west1-b.test-project/my/code"
     )
     mock_subprocess.assert_called_once_with(["code", "--folder-uri", expected_uri])
+
+
+def test_instance_suspended(mocker, mock_context):
+    config, compute, zone = mock_context
+    mocker.patch(
+        "vm_lifecycle.commands.connect.init_gcp_context",
+        return_value=(config, compute, zone),
+    )
+    compute.find_instance.return_value = {"status": "SUSPENDED"}
+    result = CliRunner().invoke(vscode_connect)
+    assert result.exit_code == 1
+    assert "is suspended" in result.output
+
+
+def test_connect_writes_managed_ssh_host(mocker, mock_context, tmp_path):
+    config, compute, zone = mock_context
+    mocker.patch(
+        "vm_lifecycle.commands.connect.init_gcp_context",
+        return_value=(config, compute, zone),
+    )
+    compute.find_instance.return_value = {
+        "id": "123",
+        "status": "RUNNING",
+        "networkInterfaces": [{"accessConfigs": [{"natIP": "203.0.113.7"}]}],
+    }
+    key = tmp_path / "google_compute_engine"
+    key.write_text("")
+    mocker.patch("vm_lifecycle.commands.connect.GCLOUD_SSH_KEY_PATH", key)
+    known_hosts = tmp_path / "google_compute_known_hosts"
+    known_hosts.write_text("compute.123 ssh-ed25519 AAAA\n")
+    mocker.patch("vm_lifecycle.commands.connect.GCLOUD_KNOWN_HOSTS_PATH", known_hosts)
+    ssh_config = mocker.patch("vm_lifecycle.commands.connect.SSHConfigManager")
+    gcloud = mocker.patch("vm_lifecycle.commands.connect.create_vm_ssh_connection")
+    mocker.patch("vm_lifecycle.commands.connect.subprocess.run")
+
+    result = CliRunner().invoke(vscode_connect)
+
+    assert result.exit_code == 0
+    # The host key is known, gcloud already authorized the key for this instance
+    gcloud.assert_not_called()
+    host, options = ssh_config.return_value.update_host.call_args.args
+    assert host == "test-vm.europe-west1-b.test-project"
+    assert options["HostName"] == "203.0.113.7"
+    assert options["HostKeyAlias"] == "compute.123"
+    assert "User" not in options
+    assert "StrictHostKeyChecking" not in options
+    assert options["ControlMaster"] == "auto"
+
+
+def test_connect_adds_host_key_of_restored_instance(mocker, mock_context, tmp_path):
+    config, compute, zone = mock_context
+    mocker.patch(
+        "vm_lifecycle.commands.connect.init_gcp_context",
+        return_value=(config, compute, zone),
+    )
+    # A restored instance has a new id and host key
+    compute.find_instance.return_value = {
+        "id": "456",
+        "status": "RUNNING",
+        "networkInterfaces": [{"accessConfigs": [{"natIP": "203.0.113.7"}]}],
+    }
+    compute.get_guest_attributes.return_value = {"ssh-ed25519": "BBBB"}
+    key = tmp_path / "google_compute_engine"
+    key.write_text("")
+    mocker.patch("vm_lifecycle.commands.connect.GCLOUD_SSH_KEY_PATH", key)
+    known_hosts = tmp_path / "google_compute_known_hosts"
+    known_hosts.write_text("compute.123 ssh-ed25519 AAAA\n")
+    mocker.patch("vm_lifecycle.commands.connect.GCLOUD_KNOWN_HOSTS_PATH", known_hosts)
+    ssh_config = mocker.patch("vm_lifecycle.commands.connect.SSHConfigManager")
+    gcloud = mocker.patch("vm_lifecycle.commands.connect.create_vm_ssh_connection")
+    mocker.patch("vm_lifecycle.commands.connect.subprocess.run")
+
+    result = CliRunner().invoke(vscode_connect)
+
+    assert result.exit_code == 0
+    # The key is already in the project, only the host key is new
+    gcloud.assert_not_called()
+    compute.get_guest_attributes.assert_called_once_with(
+        "test-vm", "hostkeys", zone="europe-west1-b"
+    )
+    assert known_hosts.read_text().splitlines()[-1] == "compute.456 ssh-ed25519 BBBB"
+    _, options = ssh_config.return_value.update_host.call_args.args
+    assert options["HostKeyAlias"] == "compute.456"
+    assert "StrictHostKeyChecking" not in options
+
+
+def test_connect_runs_gcloud_on_first_connection(mocker, mock_context, tmp_path):
+    config, compute, zone = mock_context
+    mocker.patch(
+        "vm_lifecycle.commands.connect.init_gcp_context",
+        return_value=(config, compute, zone),
+    )
+    compute.find_instance.return_value = {
+        "id": "456",
+        "status": "RUNNING",
+        "networkInterfaces": [{"accessConfigs": [{"natIP": "203.0.113.7"}]}],
+    }
+    key = tmp_path / "google_compute_engine"
+    key.write_text("")
+    mocker.patch("vm_lifecycle.commands.connect.GCLOUD_SSH_KEY_PATH", key)
+    known_hosts = tmp_path / "google_compute_known_hosts"
+    mocker.patch("vm_lifecycle.commands.connect.GCLOUD_KNOWN_HOSTS_PATH", known_hosts)
+    ssh_config = mocker.patch("vm_lifecycle.commands.connect.SSHConfigManager")
+    ssh_config.return_value.get_host.return_value = None
+    gcloud = mocker.patch("vm_lifecycle.commands.connect.create_vm_ssh_connection")
+    mocker.patch("vm_lifecycle.commands.connect.subprocess.run")
+
+    result = CliRunner().invoke(vscode_connect)
+
+    assert result.exit_code == 0
+    gcloud.assert_called_once_with(
+        project_id="test-project", instance_name="test-vm", zone="europe-west1-b"
+    )
+    _, options = ssh_config.return_value.update_host.call_args.args
+    # No host key published yet, the first connect accepts it
+    assert options["StrictHostKeyChecking"] == "accept-new"
+
+
+def test_connect_warm_opens_master_connection(mocker, mock_context, tmp_path):
+    config, compute, zone = mock_context
+    mocker.patch(
+        "vm_lifecycle.commands.connect.init_gcp_context",
+        return_value=(config, compute, zone),
+    )
+    compute.find_instance.return_value = {
+        "id": "123",
+        "status": "RUNNING",
+        "networkInterfaces": [{"accessConfigs": [{"natIP": "203.0.113.7"}]}],
+    }
+    key = tmp_path / "google_compute_engine"
+    key.write_text("")
+    mocker.patch("vm_lifecycle.commands.connect.GCLOUD_SSH_KEY_PATH", key)
+    mocker.patch("vm_lifecycle.commands.connect.SSHConfigManager")
+    mocker.patch("vm_lifecycle.commands.connect.create_vm_ssh_connection")
+    run = mocker.patch("vm_lifecycle.commands.connect.subprocess.run")
+    run.return_value = CompletedProcess(args=["ssh"], returncode=255)
+    popen = mocker.patch("vm_lifecycle.commands.connect.subprocess.Popen")
+
+    result = CliRunner().invoke(vscode_connect, ["--warm"])
+
+    assert result.exit_code == 0
+    host = "test-vm.europe-west1-b.test-project"
+    assert run.call_args_list[0].args[0] == ["ssh", "-O", "check", host]
+    assert popen.call_args.args[0] == ["ssh", "-f", "-N", host]
+    # VS Code is launched after the master connection was started
+    assert run.call_args_list[-1].args[0][0] == "code"
@@ -17,6 +17,8 @@ def mock_context(mocker):
         "instance_user": "ubuntu",
     }
     config_mock.update_active_zone_region.return_value = True
+    compute_mock.get_disk.return_value = None
+    mocker.patch("vm_lifecycle.commands.create.MachineTypeCatalog")
 
     mocker.patch(
         "vm_lifecycle.commands.create.init_gcp_context",
@@ -139,4 +141,165 @@ def test_create_uses_custom_image_if_provided(mock_context, mocker):
         image_project=None,
         image_family=None,
         startup_script_type=None,
+        disk_type="pd-balanced",
+        network_tier="STANDARD",
     )
+
+
+def test_create_exits_if_parked_disk_exists(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_disk.return_value = {"name": "test-instance"}
+
+    runner = CliRunner()
+    result = runner.invoke(create_vm_instance)
+
+    assert result.exit_code == 1
+    assert "Parked disk" in result.output
+    compute_mock.create_instance.assert_not_called()
+
+
+def test_create_uses_recommended_machine_type(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.list_images.return_value = []
+    compute_mock.create_instance.return_value = {"name": "op-123"}
+    catalog = mocker.patch("vm_lifecycle.commands.create.MachineTypeCatalog")
+    catalog.return_value.recommend.return_value = {
+        "name": "e2-standard-16",
+        "vcpus": 16,
+        "memory_gb": 64.0,
+    }
+    mocker.patch(
+        "vm_lifecycle.commands.create.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        create_vm_instance, ["--min-vcpus", "16", "--min-memory", "64"]
+    )
+
+    assert result.exit_code == 0
+    catalog.return_value.recommend.assert_called_once_with(
+        "zone", min_vcpus=16, min_memory_gb=64.0
+    )
+    assert (
+        compute_mock.create_instance.call_args.kwargs["machine_type"]
+        == "e2-standard-16"
+    )
+    config_mock.set_profile_option.assert_called_once_with(
+        "machine_type", "e2-standard-16"
+    )
+
+
+def test_create_exits_if_machine_type_not_in_zone(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.list_images.return_value = []
+    catalog = mocker.patch("vm_lifecycle.commands.create.MachineTypeCatalog")
+    catalog.return_value.get.return_value = None
+
+    runner = CliRunner()
+    result = runner.invoke(create_vm_instance)
+
+    assert result.exit_code == 1
+    assert "is not offered in zone" in result.output
+    compute_mock.create_instance.assert_not_called()
+
+
+def test_create_falls_back_to_next_zone_on_stockout(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.list_images.return_value = []
+    compute_mock.create_instance.return_value = {"name": "op-1"}
+    mocker.patch(
+        "vm_lifecycle.commands.create.poll_with_spinner",
+        return_value={
+            "success": False,
+            "error": {"errors": [{"code": "ZONE_RESOURCE_POOL_EXHAUSTED"}]},
+        },
+    )
+    mocker.patch("vm_lifecycle.commands.create.fallback_zones", return_value=["zone-c"])
+    place = mocker.patch(
+        "vm_lifecycle.commands.create.place_instance",
+        return_value=("zone-c", {"success": True}),
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(create_vm_instance)
+
+    assert result.exit_code == 0
+    assert "has no capacity" in result.output
+    assert place.call_args.args[2] == ["zone-c"]
+    config_mock.update_active_zone_region.assert_called_once_with(True, zone="zone-c")
+
+
+def test_create_exits_when_no_zone_has_capacity(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.list_images.return_value = []
+    compute_mock.create_instance.return_value = {"name": "op-1"}
+    mocker.patch(
+        "vm_lifecycle.commands.create.poll_with_spinner",
+        return_value={
+            "success": False,
+            "error": {"errors": [{"code": "ZONE_RESOURCE_POOL_EXHAUSTED"}]},
+        },
+    )
+    mocker.patch("vm_lifecycle.commands.create.fallback_zones", return_value=[])
+
+    runner = CliRunner()
+    result = runner.invoke(create_vm_instance)
+
+    assert result.exit_code == 1
+    assert "No capacity" in result.output
+    config_mock.update_active_zone_region.assert_not_called()
+
+
+def test_create_attaches_static_ip_without_racing(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.list_images.return_value = []
+    compute_mock.create_instance.return_value = {"name": "op-1"}
+    mocker.patch(
+        "vm_lifecycle.commands.create.static_ip_settings",
+        return_value={"nat_ip": "203.0.113.7"},
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.create.poll_with_spinner",
+        return_value={"success": True},
+    )
+    place = mocker.patch("vm_lifecycle.commands.create.place_instance")
+
+    runner = CliRunner()
+    result = runner.invoke(create_vm_instance, ["--race"])
+
+    assert result.exit_code == 0
+    assert "not racing zones" in result.output
+    place.assert_not_called()
+    assert compute_mock.create_instance.call_args.kwargs["nat_ip"] == "203.0.113.7"
+
+
+def test_create_from_baked_family_skips_startup_script(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["project_id"] = "test-project"
+    compute_mock.list_instances.return_value = []
+    compute_mock.list_images.return_value = []
+    compute_mock.create_instance.return_value = {"name": "op-1"}
+    mocker.patch(
+        "vm_lifecycle.commands.create.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(create_vm_instance, ["--baked", "-s", "ansible"])
+
+    assert result.exit_code == 0
+    compute_mock.get_latest_image_from_family.assert_called_once_with(
+        "vmlc-baked-ansible"
+    )
+    kwargs = compute_mock.create_instance.call_args.kwargs
+    assert kwargs["image_project"] == "test-project"
+    assert kwargs["image_family"] == "vmlc-baked-ansible"
+    assert kwargs["startup_script_type"] is None
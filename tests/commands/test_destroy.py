@@ -208,3 +208,105 @@ def test_destroy_images_aborted(mock_context, mocker):
     result = runner.invoke(destroy_vm_instance, ["--images"])
     assert "Aborted" in result.output
     assert result.exit_code == 1
+
+
+def test_destroy_releases_static_ip(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["static_ip"] = True
+    compute_mock.list_instances.return_value = [{"name": "test-vm"}]
+    compute_mock.delete_instance.return_value = {"name": "op-destroy"}
+    mocker.patch("vm_lifecycle.commands.destroy.click.confirm", return_value=True)
+    mocker.patch(
+        "vm_lifecycle.commands.destroy.poll_with_spinner",
+        return_value={"success": True},
+    )
+    release = mocker.patch("vm_lifecycle.commands.destroy.release_static_ip")
+
+    result = CliRunner().invoke(destroy_vm_instance)
+
+    assert result.exit_code == 0
+    release.assert_called_once_with(
+        compute_mock, config_mock.active_profile, "europe-west1"
+    )
+
+
+def test_destroy_releases_static_ip_of_parked_vm(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["static_ip"] = True
+    # 'vmlc stop' deleted the instance, the address is still reserved
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_disk.return_value = None
+    compute_mock.get_address.return_value = {"address": "203.0.113.7"}
+    mocker.patch("vm_lifecycle.commands.destroy.click.confirm", return_value=True)
+    release = mocker.patch(
+        "vm_lifecycle.commands.destroy.release_static_ip", return_value=True
+    )
+
+    result = CliRunner().invoke(destroy_vm_instance)
+
+    assert result.exit_code == 0
+    compute_mock.get_address.assert_called_once_with("test-vm-ip", "europe-west1")
+    release.assert_called_once_with(
+        compute_mock, config_mock.active_profile, "europe-west1"
+    )
+    compute_mock.delete_instance.assert_not_called()
+
+
+def test_destroy_vm_releases_static_ip_of_profile(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    config_mock.config["dev"]["static_ip"] = True
+    compute_mock._list_zones.return_value = ["europe-west4-a"]
+    compute_mock.list_instances.side_effect = lambda zone=None: [
+        {"name": "test-vm", "status": "RUNNING"}
+    ]
+    compute_mock.delete_instance.return_value = {"name": "op-vm"}
+    mocker.patch(
+        "vm_lifecycle.commands.destroy.select_from_list",
+        return_value=("test-vm", "europe-west4-a"),
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.destroy.poll_with_spinner",
+        return_value={"success": True},
+    )
+    release = mocker.patch("vm_lifecycle.commands.destroy.release_static_ip")
+
+    CliRunner().invoke(destroy_vm_instance, ["--vm"])
+
+    # The address is in the region the instance ran in
+    release.assert_called_once_with(
+        compute_mock, config_mock.config["dev"], "europe-west4"
+    )
+
+
+def test_destroy_deletes_parked_boot_disk(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    # 'vmlc stop --strategy disk' kept the boot disk and deleted the instance
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_disk.return_value = {"name": "test-vm"}
+    compute_mock.delete_disk.return_value = {"name": "op-disk"}
+    mocker.patch("vm_lifecycle.commands.destroy.click.confirm", return_value=True)
+    mocker.patch(
+        "vm_lifecycle.commands.destroy.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    result = CliRunner().invoke(destroy_vm_instance)
+
+    assert result.exit_code == 0
+    compute_mock.get_disk.assert_called_once_with("test-vm", zone="europe-west1-b")
+    compute_mock.delete_disk.assert_called_once_with("test-vm", zone="europe-west1-b")
+    compute_mock.delete_instance.assert_not_called()
+
+
+def test_destroy_keeps_disk_in_use(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_disk.return_value = {
+        "name": "test-vm",
+        "users": ["projects/p/zones/z/instances/other"],
+    }
+
+    result = CliRunner().invoke(destroy_vm_instance)
+
+    assert result.exit_code == 1
+    compute_mock.delete_disk.assert_not_called()
@@ -6,6 +6,7 @@ from vm_lifecycle.commands.profile import (
     list_profiles,
     set_profile,
     delete_profile,
+    profile_option,
 )
 
 
@@ -14,6 +15,14 @@ def runner():
     return CliRunner()
 
 
+@pytest.fixture(autouse=True)
+def no_machine_catalog(mocker):
+    """Profile creation falls back to the built-in machine types"""
+    return mocker.patch(
+        "vm_lifecycle.commands.profile._zone_machine_types", return_value=None
+    )
+
+
 @pytest.fixture
 def mock_config_manager(mocker):
     mock = mocker.patch("vm_lifecycle.commands.profile.ConfigManager", autospec=True)
@@ -157,3 +166,64 @@ def test_delete_all_profiles_confirmed(runner, mocker):
 
     assert result.exit_code == 0
     assert "🗑️ All profiles deleted." in result.output
+
+
+def test_profile_option_sets_valid_value(runner, mocker):
+    mock_cm = mocker.MagicMock()
+    mock_cm.active = "test"
+    mock_cm.active_profile = {"zone": "europe-west1-b"}
+    mocker.patch("vm_lifecycle.commands.profile.ConfigManager", return_value=mock_cm)
+
+    result = runner.invoke(profile_option, ["park_strategy", "snapshot"])
+
+    assert result.exit_code == 0
+    mock_cm.set_profile_option.assert_called_once_with("park_strategy", "snapshot")
+
+
+def test_profile_option_rejects_invalid_value(runner, mocker):
+    mock_cm = mocker.MagicMock()
+    mock_cm.active_profile = {"zone": "europe-west1-b"}
+    mocker.patch("vm_lifecycle.commands.profile.ConfigManager", return_value=mock_cm)
+
+    result = runner.invoke(profile_option, ["snapshot_chain_limit", "zero"])
+
+    assert result.exit_code == 1
+    assert "Invalid value" in result.output
+    mock_cm.set_profile_option.assert_not_called()
+
+
+def test_profile_option_lists_defaults(runner, mocker):
+    mock_cm = mocker.MagicMock()
+    mock_cm.active_profile = {"zone": "europe-west1-b"}
+    mocker.patch("vm_lifecycle.commands.profile.ConfigManager", return_value=mock_cm)
+
+    result = runner.invoke(profile_option)
+
+    assert result.exit_code == 0
+    assert "park_strategy: image" in result.output
+
+
+def test_create_profile_offers_zone_machine_types(
+    runner, mocker, mock_config_manager, no_machine_catalog
+):
+    no_machine_catalog.return_value = ["e2-standard-4", "c3-standard-22"]
+    mocker.patch(
+        "vm_lifecycle.commands.profile.prompt_validation",
+        side_effect=["test-profile", "test-project", "test-instance"],
+    )
+    prompt = mocker.patch(
+        "vm_lifecycle.commands.profile.click.prompt",
+        side_effect=["europe-west1-b", "ubuntu", "c3-standard-22", 100],
+    )
+    mocker.patch("vm_lifecycle.commands.profile.click.confirm", return_value=False)
+
+    result = runner.invoke(create_profile)
+
+    assert result.exit_code == 0
+    no_machine_catalog.assert_called_once_with("test-project", "europe-west1-b")
+    machine_prompt = prompt.call_args_list[2]
+    assert list(machine_prompt.kwargs["type"].choices) == [
+        "e2-standard-4",
+        "c3-standard-22",
+    ]
+    assert machine_prompt.kwargs["show_choices"] is False
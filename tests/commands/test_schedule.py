@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import pytest
+from click.testing import CliRunner
+
+from vm_lifecycle.commands import schedule as schedule_cmd
+from vm_lifecycle.config_manager import ConfigManager
+
+
+@pytest.fixture
+def manager(tmp_path, mocker):
+    manager = ConfigManager(config_path=tmp_path / "config.yaml")
+    manager.add_profile("dev", {"instance_name": "test-vm", "zone": "europe-west1-b"})
+    mocker.patch.object(schedule_cmd, "ConfigManager", return_value=manager)
+    return manager
+
+
+def test_add_rejects_invalid_cron(manager):
+    result = CliRunner().invoke(schedule_cmd.add_schedule, ["start", "61 7 * * *"])
+
+    assert result.exit_code == 1
+    assert "Invalid cron expression" in result.output
+    assert manager.list_schedules() == {}
+
+
+def test_add_and_show(manager):
+    runner = CliRunner()
+    runner.invoke(schedule_cmd.add_schedule, ["start", "30 7 * * 1-5"])
+    result = runner.invoke(schedule_cmd.show_schedules)
+
+    assert result.exit_code == 0
+    assert "[1] start\t30 7 * * 1-5" in result.output
+
+
+def test_install_prints_systemctl_commands(manager, tmp_path, mocker):
+    manager.add_schedule("stop", "0 19 * * 1-5")
+    mocker.patch.object(schedule_cmd, "SYSTEMD_USER_DIR", tmp_path / "units")
+
+    result = CliRunner().invoke(schedule_cmd.install_schedules)
+
+    assert result.exit_code == 0
+    assert (tmp_path / "units" / "vmlc-dev-1-stop.timer").exists()
+    assert "systemctl --user enable --now vmlc-dev-1-stop.timer" in result.output
+
+
+def test_agent_once_runs_due_rules(manager, mocker):
+    manager.add_schedule("start", "30 7 * * 1-5")
+    manager.add_schedule("stop", "0 19 * * 1-5")
+    mocker.patch.object(
+        schedule_cmd,
+        "datetime",
+        mocker.Mock(now=lambda: datetime(2026, 10, 19, 7, 30, 12)),
+    )
+    popen = mocker.patch.object(schedule_cmd.subprocess, "Popen")
+    popen.return_value.poll.return_value = 0
+    popen.return_value.returncode = 0
+
+    result = CliRunner().invoke(schedule_cmd.run_agent, ["--once"])
+
+    assert result.exit_code == 0
+    popen.assert_called_once()
+    assert popen.call_args.args[0][-1] == "start"
+    assert popen.call_args.kwargs["env"]["VMLC_PROFILE"] == "dev"
+    assert "'vmlc start' for profile: 'dev' finished" in result.output
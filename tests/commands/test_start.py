@@ -21,6 +21,9 @@ def mock_context(mocker):
         "api_cache": False,
     }
     config_mock.active = "test-profile"
+    compute_mock.get_latest_snapshot_from_chain.return_value = None
+    compute_mock.get_disk.return_value = None
+    compute_mock.get_latest_machine_image.return_value = None
     mocker.patch(
         "vm_lifecycle.commands.start.init_gcp_context",
         return_value=(config_mock, compute_mock, "europe-west1-b"),
@@ -96,12 +99,16 @@ def test_start_instance_from_image_in_new_zone(mock_context, mocker):
         "vm_lifecycle.commands.start.poll_with_spinner",
         side_effect=fake_spinner,
     )
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_many_with_spinner",
+        return_value=[{"success": True}, {"success": True}],
+    )
 
     runner = CliRunner()
     result = runner.invoke(start_vm_instance, ["--zone", "europe-west1-b"])
 
     assert "Creating image from instance" in result.output
-    assert "Destroying VM instance" in result.output
+    assert "VM instance: 'test-vm' in zone: 'europe-west1-a' destroyed" in result.output
     assert "created in zone" in result.output
 
 
@@ -141,7 +148,10 @@ def test_start_instance_spinner_failure(mock_context, mocker):
 
     mocker.patch(
         "vm_lifecycle.commands.start.poll_with_spinner",
-        return_value={"success": False, "error": {"message": "start failed"}},
+        return_value={
+            "success": False,
+            "error": {"errors": [{"message": "start failed"}]},
+        },
     )
 
     runner = CliRunner()
@@ -162,7 +172,10 @@ def test_start_image_creation_failure(mock_context, mocker):
     compute_mock.create_image_from_instance.return_value = {"name": "op-image"}
     mocker.patch(
         "vm_lifecycle.commands.start.poll_with_spinner",
-        return_value={"success": False, "error": {"message": "image creation failed"}},
+        return_value={
+            "success": False,
+            "error": {"errors": [{"message": "image creation failed"}]},
+        },
     )
 
     runner = CliRunner()
@@ -253,3 +266,764 @@ def test_start_handles_http_error_on_image_fetch(mock_context, mocker):
 
     assert "❗ Error:" in result.output
     assert result.exit_code == 1
+
+
+def test_start_prefetches_image_once(mock_context, mocker):
+    """Should issue the image lookup alongside the instance lookup and reuse it."""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_latest_image_from_family.return_value = {"name": "img-42"}
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    compute_mock.get_latest_image_from_family.assert_called_once_with(family="vm-image")
+    assert (
+        compute_mock.create_instance.call_args.kwargs["custom_image_name"] == "img-42"
+    )
+
+
+def test_start_running_instance_ignores_image_lookup_error(mock_context, mocker):
+    """Should discard a failed image prefetch when the image is not needed."""
+    from httplib2 import Response
+
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+    compute_mock.get_latest_image_from_family.side_effect = HttpError(
+        resp=Response({"status": 404}), content=b"Not found"
+    )
+    compute_mock.start_instance.return_value = {"name": "op-123"}
+
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    compute_mock.start_instance.assert_called_once()
+
+
+@pytest.fixture
+def migrate_context(mock_context):
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["zone"] = "europe-west1-a"
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+    compute_mock.create_image_from_instance.return_value = {"name": "op-image"}
+    compute_mock.create_instance.side_effect = [
+        {"name": "op-create"},
+        {"name": "op-rollback"},
+    ]
+    compute_mock.delete_instance.return_value = {"name": "op-delete"}
+    return config_mock, compute_mock
+
+
+def test_start_migration_uses_image_from_target_link(migrate_context, mocker):
+    """Should create the new instance from the targetLink image without a family lookup."""
+    config_mock, compute_mock = migrate_context
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True, "operation": {"targetLink": "link/img-new"}},
+    )
+    poll_many = mocker.patch(
+        "vm_lifecycle.commands.start.poll_many_with_spinner",
+        return_value=[{"success": True}, {"success": True}],
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance, ["--zone", "europe-west1-b"])
+
+    assert result.exit_code == 0
+    create_kwargs = compute_mock.create_instance.call_args.kwargs
+    assert create_kwargs["custom_image_name"] == "img-new"
+    assert create_kwargs["zone"] == "europe-west1-b"
+    operations = poll_many.call_args.kwargs["operations"]
+    assert [op["op_name"] for op in operations] == ["op-create", "op-delete"]
+    config_mock.update_active_zone_region.assert_called_once_with(
+        True, zone="europe-west1-b"
+    )
+
+
+def test_start_migration_rolls_back_when_create_fails(migrate_context, mocker):
+    """Should recreate the instance in the original zone if the new one fails."""
+    config_mock, compute_mock = migrate_context
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True, "operation": {"targetLink": "link/img-new"}},
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_many_with_spinner",
+        return_value=[
+            {
+                "success": False,
+                "error": {"errors": [{"code": "ZONE_RESOURCE_POOL_EXHAUSTED"}]},
+            },
+            {"success": True},
+        ],
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance, ["--zone", "europe-west1-b"])
+
+    assert result.exit_code == 1
+    assert "ZONE_RESOURCE_POOL_EXHAUSTED" in result.output
+    rollback_kwargs = compute_mock.create_instance.call_args_list[-1].kwargs
+    assert rollback_kwargs["zone"] == "europe-west1-a"
+    assert rollback_kwargs["custom_image_name"] == "img-new"
+    config_mock.update_active_zone_region.assert_not_called()
+
+
+def test_start_migration_rolls_back_on_operation_error(migrate_context, mocker):
+    """Operation errors only hold an 'errors' list, the rollback must still run."""
+    config_mock, compute_mock = migrate_context
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True, "operation": {"targetLink": "link/img-new"}},
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_many_with_spinner",
+        return_value=[
+            {
+                "success": False,
+                "error": {
+                    "errors": [
+                        {
+                            "code": "ZONE_RESOURCE_POOL_EXHAUSTED",
+                            "message": "The zone does not have enough resources",
+                        }
+                    ]
+                },
+            },
+            {"success": True},
+        ],
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance, ["--zone", "europe-west1-b"])
+
+    assert result.exit_code == 1
+    assert not isinstance(result.exception, KeyError)
+    assert "The zone does not have enough resources" in result.output
+    assert compute_mock.create_instance.call_count == 2
+    rollback_kwargs = compute_mock.create_instance.call_args_list[-1].kwargs
+    assert rollback_kwargs["zone"] == "europe-west1-a"
+
+
+def test_start_migration_no_rollback_if_delete_failed(migrate_context, mocker):
+    """Should leave the original instance alone when both operations fail."""
+    config_mock, compute_mock = migrate_context
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True, "operation": {"targetLink": "link/img-new"}},
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_many_with_spinner",
+        return_value=[
+            {"success": False, "error": {"errors": [{"message": "create failed"}]}},
+            {"success": False, "error": {"errors": [{"message": "delete failed"}]}},
+        ],
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance, ["--zone", "europe-west1-b"])
+
+    assert result.exit_code == 1
+    assert compute_mock.create_instance.call_count == 1
+
+
+def test_start_migration_reserves_static_ip_after_artifact(migrate_context, mocker):
+    """A failed migration artifact should not leave a reserved address behind."""
+    config_mock, compute_mock = migrate_context
+    config_mock.active_profile["static_ip"] = True
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={
+            "success": False,
+            "error": {
+                "errors": [{"code": "QUOTA_EXCEEDED", "message": "quota exceeded"}]
+            },
+        },
+    )
+    static_ip = mocker.patch("vm_lifecycle.commands.start.static_ip_settings")
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance, ["--zone", "europe-west1-b"])
+
+    assert result.exit_code == 1
+    assert "Failed to create image: quota exceeded" in result.output
+    static_ip.assert_not_called()
+
+
+def test_start_migration_releases_target_static_ip_on_failure(migrate_context, mocker):
+    """The address reserved in the new region should be released if the move fails."""
+    config_mock, compute_mock = migrate_context
+    config_mock.active_profile["static_ip"] = True
+    mocker.patch(
+        "vm_lifecycle.commands.start.init_gcp_context",
+        return_value=(config_mock, compute_mock, "us-central1-a"),
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.start.static_ip_settings",
+        return_value={"nat_ip": "203.0.113.7"},
+    )
+    release = mocker.patch("vm_lifecycle.commands.start.release_static_ip")
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True, "operation": {"targetLink": "link/img-new"}},
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_many_with_spinner",
+        return_value=[
+            {"success": False, "error": {"errors": [{"message": "create failed"}]}},
+            {"success": False, "error": {"errors": [{"message": "delete failed"}]}},
+        ],
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance, ["--zone", "us-central1-a"])
+
+    assert result.exit_code == 1
+    release.assert_called_once_with(
+        compute_mock, config_mock.active_profile, "us-central1"
+    )
+
+
+def test_start_restores_from_newer_snapshot(mock_context, mocker):
+    """Should restore from the snapshot when it is newer than the latest image."""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_latest_image_from_family.return_value = {
+        "name": "img-old",
+        "creationTimestamp": "2025-01-01T00:00:00.000-00:00",
+    }
+    compute_mock.get_latest_snapshot_from_chain.return_value = {
+        "name": "snap-new",
+        "creationTimestamp": "2025-02-01T00:00:00.000-00:00",
+    }
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    kwargs = compute_mock.create_instance.call_args.kwargs
+    assert kwargs["source_snapshot_name"] == "snap-new"
+    assert "custom_image_name" not in kwargs
+
+
+def test_start_restores_snapshot_when_image_family_missing(mock_context, mocker):
+    """Should treat a missing image family as empty and use the snapshot."""
+    from httplib2 import Response
+
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_latest_image_from_family.side_effect = HttpError(
+        resp=Response({"status": 404}), content=b"Not found"
+    )
+    compute_mock.get_latest_snapshot_from_chain.return_value = {"name": "snap-1"}
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    assert (
+        compute_mock.create_instance.call_args.kwargs["source_snapshot_name"]
+        == "snap-1"
+    )
+
+
+def test_start_migration_with_snapshot_strategy(migrate_context, mocker):
+    """Should move the instance through a snapshot when requested."""
+    config_mock, compute_mock = migrate_context
+    compute_mock.create_snapshot_from_instance.return_value = {"name": "op-snap"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True, "operation": {"targetLink": "link/snap-new"}},
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_many_with_spinner",
+        return_value=[{"success": True}, {"success": True}],
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        start_vm_instance, ["--zone", "europe-west1-b", "--strategy", "snapshot"]
+    )
+
+    assert result.exit_code == 0
+    compute_mock.create_image_from_instance.assert_not_called()
+    # The snapshot is the first of the chain 'vmlc stop' compacts
+    snapshot_kwargs = compute_mock.create_snapshot_from_instance.call_args.kwargs
+    assert snapshot_kwargs["labels"] == {"vmlc-park-seq": "1"}
+    assert (
+        compute_mock.create_instance.call_args.kwargs["source_snapshot_name"]
+        == "snap-new"
+    )
+
+
+def test_start_reattaches_parked_disk(mock_context, mocker):
+    """Should create the instance on the kept boot disk instead of restoring."""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_disk.return_value = {"name": "test-vm"}
+    compute_mock.get_latest_image_from_family.return_value = {"name": "img-1"}
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    kwargs = compute_mock.create_instance.call_args.kwargs
+    assert kwargs["source_disk_name"] == "test-vm"
+    assert "custom_image_name" not in kwargs
+
+
+def test_start_ignores_attached_disk(mock_context, mocker):
+    """Should not treat a disk that is in use as parked."""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_disk.return_value = {"name": "test-vm", "users": ["other-vm"]}
+    compute_mock.get_latest_image_from_family.return_value = {"name": "img-1"}
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    runner.invoke(start_vm_instance)
+
+    assert compute_mock.create_instance.call_args.kwargs["custom_image_name"] == "img-1"
+
+
+def test_start_moves_parked_disk_to_new_zone(mock_context, mocker):
+    """Should image the parked disk, create in the new zone and delete the disk."""
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["zone"] = "europe-west1-a"
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_disk.return_value = {"name": "test-vm"}
+    compute_mock.create_image_from_disk.return_value = {"name": "op-image"}
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    compute_mock.delete_disk.return_value = {"name": "op-delete-disk"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True, "operation": {"targetLink": "link/img-new"}},
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_many_with_spinner",
+        return_value=[{"success": True}, {"success": True}],
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance, ["--zone", "europe-west1-b"])
+
+    assert result.exit_code == 0
+    compute_mock.create_image_from_disk.assert_called_once()
+    compute_mock.delete_disk.assert_called_once_with("test-vm", zone="europe-west1-a")
+    compute_mock.delete_instance.assert_not_called()
+    assert compute_mock.create_instance.call_args.kwargs["zone"] == "europe-west1-b"
+
+
+def test_start_resumes_suspended_instance(mock_context, mocker):
+    """Should resume a SUSPENDED instance instead of starting or restoring it."""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "SUSPENDED"}
+    ]
+    compute_mock.resume_instance.return_value = {"name": "op-resume"}
+    poll = mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    compute_mock.resume_instance.assert_called_once_with(
+        instance_name="test-vm", zone="europe-west1-b"
+    )
+    compute_mock.start_instance.assert_not_called()
+    compute_mock.create_instance.assert_not_called()
+    assert "Resuming Instance" in poll.call_args.kwargs["text"]
+
+
+def test_start_suspending_instance_exits(mock_context, mocker):
+    """Should ask to retry while the instance is still suspending."""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "SUSPENDING"}
+    ]
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 1
+    assert "is being suspended" in result.output
+    compute_mock.resume_instance.assert_not_called()
+
+
+def test_start_suspended_instance_refuses_zone_change(mock_context, mocker):
+    """Should not move a suspended instance between zones."""
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["zone"] = "europe-west1-a"
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "SUSPENDED"}
+    ]
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance, ["--zone", "europe-west1-b"])
+
+    assert result.exit_code == 1
+    compute_mock.create_image_from_instance.assert_not_called()
+
+
+def test_start_restores_from_newer_machine_image(mock_context, mocker):
+    """Should restore from a newer machine image with a single insert."""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_latest_image_from_family.return_value = {
+        "name": "img-old",
+        "creationTimestamp": "2025-01-01T00:00:00.000-00:00",
+    }
+    compute_mock.get_latest_machine_image.return_value = {
+        "name": "mi-new",
+        "creationTimestamp": "2025-02-01T00:00:00.000-00:00",
+    }
+    compute_mock.create_instance_from_machine_image.return_value = {"name": "op-create"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    compute_mock.create_instance.assert_not_called()
+    compute_mock.create_instance_from_machine_image.assert_called_once_with(
+        instance_name="test-vm",
+        machine_image_name="mi-new",
+        machine_type="e2-standard-4",
+        zone="europe-west1-b",
+    )
+
+
+def test_start_records_restore_timing(mock_context, mocker):
+    """Should record the duration of the restore operation per strategy."""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_latest_image_from_family.return_value = {"name": "img-1"}
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    poll_result = {
+        "success": True,
+        "operation": {
+            "insertTime": "2025-01-01T00:00:00.000-00:00",
+            "endTime": "2025-01-01T00:00:42.000-00:00",
+        },
+    }
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner", return_value=poll_result
+    )
+    record = mocker.patch("vm_lifecycle.commands.start.record_timing")
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    record.assert_called_once_with(config_mock, "restore", "image", poll_result)
+
+
+def test_start_migration_with_machine_image_strategy(migrate_context, mocker):
+    """Should move the instance through a machine image when requested."""
+    config_mock, compute_mock = migrate_context
+    compute_mock.create_machine_image_from_instance.return_value = {"name": "op-mi"}
+    compute_mock.create_instance_from_machine_image.return_value = {"name": "op-create"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True, "operation": {"targetLink": "link/mi-new"}},
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_many_with_spinner",
+        return_value=[{"success": True}, {"success": True}],
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(
+        start_vm_instance, ["--zone", "europe-west1-b", "--strategy", "machine-image"]
+    )
+
+    assert result.exit_code == 0
+    compute_mock.create_image_from_instance.assert_not_called()
+    compute_mock.create_instance.assert_not_called()
+    kwargs = compute_mock.create_instance_from_machine_image.call_args.kwargs
+    assert kwargs["machine_image_name"] == "mi-new"
+    assert kwargs["zone"] == "europe-west1-b"
+
+
+def test_start_offers_image_copy_outside_storage_location(mock_context, mocker):
+    """Should copy the image into the target region when the user accepts."""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_latest_image_from_family.return_value = {
+        "name": "img-1",
+        "storageLocations": ["us"],
+    }
+    compute_mock.copy_image.return_value = {"name": "op-copy"}
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True, "operation": {"targetLink": "link/img-2"}},
+    )
+    mocker.patch("vm_lifecycle.commands.start.is_interactive", return_value=True)
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance, input="y\n")
+
+    assert result.exit_code == 0
+    assert "outside region: 'europe-west1'" in result.output
+    compute_mock.copy_image.assert_called_once_with(
+        source_image_name="img-1",
+        image_name="vm-image",
+        storage_location="europe-west1",
+        family="vm-image",
+    )
+    assert compute_mock.create_instance.call_args.kwargs["custom_image_name"] == "img-2"
+
+
+def test_start_does_not_prompt_for_image_copy_without_tty(mock_context, mocker):
+    """Scheduled starts should restore across regions instead of aborting on the prompt."""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_latest_image_from_family.return_value = {
+        "name": "img-1",
+        "storageLocations": ["us"],
+    }
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True},
+    )
+    mocker.patch("vm_lifecycle.commands.start.is_interactive", return_value=False)
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    assert "copy_image always" in result.output
+    compute_mock.copy_image.assert_not_called()
+    assert compute_mock.create_instance.call_args.kwargs["custom_image_name"] == "img-1"
+
+
+def test_start_copies_image_when_profile_says_always(mock_context, mocker):
+    """Should copy without prompting when the profile 'copy_image' option is 'always'."""
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["copy_image"] = "always"
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_latest_image_from_family.return_value = {
+        "name": "img-1",
+        "storageLocations": ["us"],
+    }
+    compute_mock.copy_image.return_value = {"name": "op-copy"}
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True, "operation": {"targetLink": "link/img-2"}},
+    )
+    mocker.patch("vm_lifecycle.commands.start.is_interactive", return_value=False)
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    compute_mock.copy_image.assert_called_once()
+    assert compute_mock.create_instance.call_args.kwargs["custom_image_name"] == "img-2"
+
+
+def test_start_skips_copy_for_colocated_image(mock_context, mocker):
+    """Should restore directly when the image is stored in a covering multi-region."""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_latest_image_from_family.return_value = {
+        "name": "img-1",
+        "storageLocations": ["eu"],
+    }
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    compute_mock.copy_image.assert_not_called()
+    assert compute_mock.create_instance.call_args.kwargs["custom_image_name"] == "img-1"
+
+
+def test_start_migration_stores_image_in_target_region(migrate_context, mocker):
+    """Should store the migration image in the region of the target zone."""
+    config_mock, compute_mock = migrate_context
+    mocker.patch(
+        "vm_lifecycle.commands.start.init_gcp_context",
+        return_value=(config_mock, compute_mock, "us-central1-a"),
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True, "operation": {"targetLink": "link/img-new"}},
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_many_with_spinner",
+        return_value=[{"success": True}, {"success": True}],
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance, ["--zone", "us-central1-a"])
+
+    assert result.exit_code == 0
+    assert (
+        compute_mock.create_image_from_instance.call_args.kwargs["storage_location"]
+        == "us-central1"
+    )
+
+
+def test_start_restores_with_profile_disk_type(mock_context, mocker):
+    """Should restore the boot disk with the profile disk tier once checked."""
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["disk_type"] = "pd-ssd"
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_latest_image_from_family.return_value = {"name": "img-1"}
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    check = mocker.patch(
+        "vm_lifecycle.commands.start.check_disk_type", return_value=True
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    check.assert_called_once_with(
+        compute_mock, config_mock.active_profile, "europe-west1-b"
+    )
+    assert compute_mock.create_instance.call_args.kwargs["disk_type"] == "pd-ssd"
+
+
+def test_start_migration_exits_on_unavailable_disk_type(migrate_context, mocker):
+    """Should not touch the instance when the disk type is missing in the target zone."""
+    config_mock, compute_mock = migrate_context
+    mocker.patch("vm_lifecycle.commands.start.check_disk_type", return_value=False)
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance, ["--zone", "europe-west1-b"])
+
+    assert result.exit_code == 1
+    compute_mock.create_image_from_instance.assert_not_called()
+    compute_mock.delete_instance.assert_not_called()
+
+
+def test_restore_falls_back_to_next_zone_on_stockout(mock_context, mocker):
+    """A restore from an image moves on to another zone of the region."""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_latest_image_from_family.return_value = {
+        "name": "img-42",
+        "storageLocations": ["europe-west1"],
+    }
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={
+            "success": False,
+            "error": {"errors": [{"code": "ZONE_RESOURCE_POOL_EXHAUSTED"}]},
+        },
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.start.fallback_zones", return_value=["europe-west1-c"]
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.start.place_instance",
+        return_value=("europe-west1-c", {"success": True}),
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    config_mock.update_active_zone_region.assert_called_once_with(
+        True, zone="europe-west1-c"
+    )
+
+
+def test_start_wait_ready(mock_context, mocker):
+    """--wait-ready returns only once the guest is ready, and fails if it never is."""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+    compute_mock.start_instance.return_value = {"name": "op-123"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True},
+    )
+    wait = mocker.patch(
+        "vm_lifecycle.commands.start.wait_for_ready", return_value=False
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance, ["--wait-ready"])
+
+    wait.assert_called_once_with(config_mock, compute_mock, "europe-west1-b")
+    assert result.exit_code == 1
+
+
+def test_start_restore_prewarms_profile_paths(mock_context, mocker):
+    """Restores from a snapshot read the profile's hot paths in the background."""
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["prewarm_paths"] = "/home/test/repo"
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_latest_snapshot_from_chain.return_value = {"name": "snap-1"}
+    compute_mock.get_latest_image_from_family.return_value = None
+    compute_mock.create_instance.return_value = {"name": "op-create"}
+    mocker.patch(
+        "vm_lifecycle.commands.start.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(start_vm_instance)
+
+    assert result.exit_code == 0
+    assert compute_mock.create_instance.call_args.kwargs["prewarm_paths"] == [
+        "/home/test/repo"
+    ]
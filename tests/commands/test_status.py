@@ -66,3 +66,46 @@ def test_status_command_runs_without_errors(mock_context, mocker):
     runner = CliRunner()
     result = runner.invoke(gcp_vm_instance_status)
     assert result.exit_code == 0
+
+
+def test_status_shows_recorded_timings(mock_context, mocker):
+    """Should list timings of the active profile, fastest strategy first"""
+    timing_mock = mocker.patch("vm_lifecycle.commands.status.TimingManager")
+    timing_mock.return_value.summary.return_value = {
+        "restore": {
+            "image": {"count": 3, "mean": 61.2, "last": 58.0},
+            "machine-image": {"count": 1, "mean": 40.5, "last": 40.5},
+        }
+    }
+
+    runner = CliRunner()
+    result = runner.invoke(gcp_vm_instance_status, ["--timings"])
+
+    assert result.exit_code == 0
+    timing_mock.return_value.summary.assert_called_once_with("dev")
+    assert result.output.index("machine-image") < result.output.index("image ")
+    assert "mean: 61.2s" in result.output
+
+
+def test_status_timings_empty(mock_context, mocker):
+    """Should exit with code 1 when nothing has been recorded"""
+    timing_mock = mocker.patch("vm_lifecycle.commands.status.TimingManager")
+    timing_mock.return_value.summary.return_value = {}
+
+    runner = CliRunner()
+    result = runner.invoke(gcp_vm_instance_status, ["--timings"])
+
+    assert result.exit_code == 1
+
+
+def test_status_prewarm_reports_guest_attribute(mock_context):
+    _, compute_mock = mock_context
+    compute_mock.get_guest_attribute.return_value = "done 42s"
+
+    result = CliRunner().invoke(gcp_vm_instance_status, ["--prewarm"])
+
+    assert result.exit_code == 0
+    assert "finished in 42s" in result.output
+    compute_mock.get_guest_attribute.assert_called_once_with(
+        "test-vm", "vmlc/prewarm", zone="europe-west1-b"
+    )
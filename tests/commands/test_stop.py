@@ -19,6 +19,8 @@ def mock_context(mocker):
         "api_cache": False,
     }
     config_mock.active = "test-profile"
+    compute_mock.get_guest_attribute.return_value = None
+    compute_mock.get_instance.return_value = {"disks": []}
     mocker.patch(
         "vm_lifecycle.commands.stop.init_gcp_context",
         return_value=(config_mock, compute_mock, "europe-west1-b"),
@@ -282,3 +284,481 @@ def test_stop_instance_name_mismatch(mock_context):
     result = runner.invoke(stop_vm_instance)
 
     assert "No instance named" in result.output or result.exit_code == 1
+
+
+def test_stop_snapshot_strategy(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+    compute_mock.create_snapshot_from_instance.return_value = {
+        "name": "op-snap",
+        "targetLink": "link/snap-1",
+    }
+    compute_mock.get_latest_snapshot_from_chain.return_value = None
+    compute_mock.delete_instance.return_value = {"name": "op-delete"}
+
+    spinner = mocker.patch("vm_lifecycle.commands.stop.poll_with_spinner")
+    spinner.return_value = {"success": True}
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance, ["--strategy", "snapshot"])
+
+    assert result.exit_code == 0
+    compute_mock.create_image_from_instance.assert_not_called()
+    compute_mock.create_snapshot_from_instance.assert_called_once_with(
+        instance_name="test-vm",
+        snapshot_name="vm-image",
+        chain="vm-image",
+        zone="europe-west1-b",
+        labels={"vmlc-park-seq": "1"},
+    )
+    # Earlier snapshots are kept until the chain is compacted
+    compute_mock.delete_snapshot.assert_not_called()
+    texts = [call.kwargs.get("text", "") for call in spinner.call_args_list]
+    assert any("Destroying VM instance" in t for t in texts)
+
+
+def test_stop_snapshot_lookup_error_starts_new_chain(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    from googleapiclient.errors import HttpError
+    from httplib2 import Response
+
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+    compute_mock.get_latest_snapshot_from_chain.side_effect = HttpError(
+        Response({"status": 403}), b"forbidden"
+    )
+    compute_mock.create_snapshot_from_instance.return_value = {"name": "op-snap"}
+    compute_mock.delete_instance.return_value = {"name": "op-delete"}
+
+    spinner = mocker.patch("vm_lifecycle.commands.stop.poll_with_spinner")
+    spinner.return_value = {"success": True}
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance, ["--strategy", "snapshot"])
+
+    assert result.exit_code == 0
+    labels = compute_mock.create_snapshot_from_instance.call_args.kwargs["labels"]
+    assert labels == {"vmlc-park-seq": "1"}
+
+
+def test_stop_uses_profile_park_strategy(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["park_strategy"] = "snapshot"
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+    compute_mock.get_latest_snapshot_from_chain.return_value = {
+        "name": "snap-3",
+        "creationTimestamp": "2025-02-01",
+        "labels": {"vmlc-park-seq": "3"},
+    }
+    compute_mock.get_latest_image_from_family.return_value = {
+        "name": "img-1",
+        "creationTimestamp": "2025-01-01",
+    }
+    compute_mock.create_snapshot_from_instance.return_value = {"name": "op-snap"}
+    compute_mock.delete_instance.return_value = {"name": "op-delete"}
+
+    spinner = mocker.patch("vm_lifecycle.commands.stop.poll_with_spinner")
+    spinner.return_value = {"success": True}
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance)
+
+    assert result.exit_code == 0
+    compute_mock.create_image_from_instance.assert_not_called()
+    labels = compute_mock.create_snapshot_from_instance.call_args.kwargs["labels"]
+    assert labels == {"vmlc-park-seq": "4"}
+
+
+def test_stop_compacts_snapshot_chain_into_image(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["park_strategy"] = "snapshot"
+    config_mock.active_profile["snapshot_chain_limit"] = 2
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+    compute_mock.get_latest_snapshot_from_chain.return_value = {
+        "name": "snap-2",
+        "creationTimestamp": "2025-02-01",
+        "labels": {"vmlc-park-seq": "2"},
+    }
+    compute_mock.get_latest_image_from_family.return_value = {
+        "name": "img-1",
+        "creationTimestamp": "2025-01-01",
+    }
+    compute_mock.create_image_from_instance.return_value = {
+        "name": "op-img",
+        "targetLink": "link/img-2",
+    }
+    compute_mock.get_dangling_images.return_value = []
+    compute_mock.list_snapshots.return_value = [{"name": "snap-2"}]
+    compute_mock.delete_snapshot.return_value = {"name": "op-snap-del"}
+    compute_mock.delete_instance.return_value = {"name": "op-delete"}
+
+    spinner = mocker.patch("vm_lifecycle.commands.stop.poll_with_spinner")
+    spinner.return_value = {"success": True}
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance)
+
+    assert result.exit_code == 0
+    assert "compacting into an image" in result.output
+    compute_mock.create_snapshot_from_instance.assert_not_called()
+    compute_mock.create_image_from_instance.assert_called_once()
+    compute_mock.delete_snapshot.assert_called_once_with("snap-2")
+
+
+def test_stop_disk_strategy_keeps_boot_disk(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "RUNNING"}
+    ]
+    compute_mock.stop_instance.return_value = {"name": "op-stop"}
+    compute_mock.set_boot_disk_auto_delete.return_value = {"name": "op-auto-delete"}
+    compute_mock.delete_instance.return_value = {"name": "op-delete"}
+
+    spinner = mocker.patch("vm_lifecycle.commands.stop.poll_with_spinner")
+    spinner.return_value = {"success": True}
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance, ["--strategy", "disk"])
+
+    assert result.exit_code == 0
+    compute_mock.create_image_from_instance.assert_not_called()
+    compute_mock.create_snapshot_from_instance.assert_not_called()
+    compute_mock.set_boot_disk_auto_delete.assert_called_once_with(
+        instance_name="test-vm", auto_delete=False, zone="europe-west1-b"
+    )
+    op_names = [call.kwargs["op_name"] for call in spinner.call_args_list]
+    assert op_names == ["op-stop", "op-auto-delete", "op-delete"]
+
+
+def test_stop_suspend_running_instance(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "RUNNING"}
+    ]
+    compute_mock.suspend_instance.return_value = {"name": "op-suspend"}
+
+    spinner = mocker.patch("vm_lifecycle.commands.stop.poll_with_spinner")
+    spinner.return_value = {"success": True}
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance, ["--suspend"])
+
+    assert result.exit_code == 0
+    compute_mock.suspend_instance.assert_called_once()
+    compute_mock.stop_instance.assert_not_called()
+    compute_mock.create_image_from_instance.assert_not_called()
+    compute_mock.delete_instance.assert_not_called()
+
+
+def test_stop_suspend_terminated_instance_exits(mock_context):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance, ["--suspend"])
+
+    assert result.exit_code == 1
+    assert "Nothing to suspend" in result.output
+
+
+def test_stop_suspending_instance(mock_context):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "SUSPENDING"}
+    ]
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance)
+
+    assert result.exit_code == 1
+    assert "is being suspended" in result.output
+    compute_mock.stop_instance.assert_not_called()
+
+    result = runner.invoke(stop_vm_instance, ["--suspend"])
+
+    assert result.exit_code == 0
+    assert "already being suspended" in result.output
+    compute_mock.suspend_instance.assert_not_called()
+
+
+def test_stop_suspended_instance_is_stopped_before_parking(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "SUSPENDED"}
+    ]
+    compute_mock.stop_instance.return_value = {"name": "op-stop"}
+
+    spinner = mocker.patch("vm_lifecycle.commands.stop.poll_with_spinner")
+    spinner.return_value = {"success": True}
+
+    runner = CliRunner()
+    runner.invoke(stop_vm_instance, ["--basic"])
+
+    compute_mock.stop_instance.assert_called_once()
+
+
+def test_stop_machine_image_strategy(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+    compute_mock.create_machine_image_from_instance.return_value = {
+        "name": "op-mi",
+        "targetLink": "link/mi-1",
+    }
+    compute_mock.get_dangling_machine_images.return_value = ["mi-0"]
+    compute_mock.delete_machine_image.return_value = {"name": "op-mi-del"}
+    compute_mock.delete_instance.return_value = {"name": "op-delete"}
+
+    spinner = mocker.patch("vm_lifecycle.commands.stop.poll_with_spinner")
+    spinner.return_value = {"success": True}
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance, ["--strategy", "machine-image"])
+
+    assert result.exit_code == 0
+    compute_mock.create_image_from_instance.assert_not_called()
+    compute_mock.create_machine_image_from_instance.assert_called_once_with(
+        instance_name="test-vm",
+        machine_image_name="vm-image",
+        zone="europe-west1-b",
+    )
+    compute_mock.delete_machine_image.assert_called_once_with("mi-0")
+    compute_mock.delete_instance.assert_called_once()
+
+
+@pytest.fixture
+def unchanged_disk(mock_context):
+    """Boot disk restored from the latest image and not used since"""
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+    compute_mock.get_instance.return_value = {
+        "disks": [{"boot": True, "source": "zones/europe-west1-b/disks/test-vm"}],
+        "lastStartTimestamp": "2025-01-01T09:00:00.000-08:00",
+    }
+    compute_mock.get_disk.return_value = {
+        "id": "disk-1",
+        "sourceImageId": "img-id-1",
+        "lastAttachTimestamp": "2025-01-01T09:00:00.000-08:00",
+    }
+    compute_mock.get_latest_image_from_family.return_value = {
+        "name": "vm-image-1",
+        "id": "img-id-1",
+        "creationTimestamp": "2025-01-01T10:00:00.000-08:00",
+    }
+    compute_mock.delete_instance.return_value = {"name": "op-delete"}
+    return config_mock, compute_mock
+
+
+def test_stop_skips_image_when_disk_unchanged(unchanged_disk, mocker):
+    config_mock, compute_mock = unchanged_disk
+    spinner = mocker.patch("vm_lifecycle.commands.stop.poll_with_spinner")
+    spinner.return_value = {"success": True}
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance)
+
+    assert result.exit_code == 0
+    assert "skipping image creation" in result.output
+    compute_mock.create_image_from_instance.assert_not_called()
+    compute_mock.get_dangling_images.assert_not_called()
+    compute_mock.delete_instance.assert_called_once()
+
+
+def test_stop_images_disk_started_after_last_image(unchanged_disk, mocker):
+    config_mock, compute_mock = unchanged_disk
+    compute_mock.get_instance.return_value["lastStartTimestamp"] = (
+        "2025-01-01T11:00:00.000-08:00"
+    )
+    compute_mock.create_image_from_instance.return_value = {"name": "op-image"}
+    compute_mock.get_dangling_images.return_value = []
+    spinner = mocker.patch("vm_lifecycle.commands.stop.poll_with_spinner")
+    spinner.return_value = {"success": True}
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance)
+
+    assert result.exit_code == 0
+    compute_mock.create_image_from_instance.assert_called_once()
+
+
+def test_stop_dirty_marker_overrides_timestamps(unchanged_disk, mocker):
+    config_mock, compute_mock = unchanged_disk
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "RUNNING"}
+    ]
+    compute_mock.get_instance.return_value["lastStartTimestamp"] = (
+        "2025-01-01T11:00:00.000-08:00"
+    )
+    compute_mock.get_guest_attribute.return_value = "false"
+    compute_mock.stop_instance.return_value = {"name": "op-stop"}
+    spinner = mocker.patch("vm_lifecycle.commands.stop.poll_with_spinner")
+    spinner.return_value = {"success": True}
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance)
+
+    assert result.exit_code == 0
+    compute_mock.get_guest_attribute.assert_called_once_with(
+        "test-vm", "vmlc/dirty", zone="europe-west1-b"
+    )
+    compute_mock.create_image_from_instance.assert_not_called()
+
+
+def test_stop_force_images_unchanged_disk(unchanged_disk, mocker):
+    config_mock, compute_mock = unchanged_disk
+    compute_mock.create_image_from_instance.return_value = {"name": "op-image"}
+    compute_mock.get_dangling_images.return_value = []
+    spinner = mocker.patch("vm_lifecycle.commands.stop.poll_with_spinner")
+    spinner.return_value = {"success": True}
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance, ["--force"])
+
+    assert result.exit_code == 0
+    compute_mock.create_image_from_instance.assert_called_once()
+    compute_mock.get_instance.assert_not_called()
+
+
+def test_stop_stores_image_in_profile_region(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+    compute_mock.create_image_from_instance.return_value = {"name": "op-image"}
+    compute_mock.get_dangling_images.return_value = []
+    compute_mock.delete_instance.return_value = {"name": "op-delete"}
+    mocker.patch(
+        "vm_lifecycle.commands.stop.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    runner.invoke(stop_vm_instance)
+    assert (
+        compute_mock.create_image_from_instance.call_args.kwargs["storage_location"]
+        == "europe-west1"
+    )
+
+    config_mock.active_profile["image_storage_location"] = "eu"
+    runner.invoke(stop_vm_instance)
+    assert (
+        compute_mock.create_image_from_instance.call_args.kwargs["storage_location"]
+        == "eu"
+    )
+
+
+def test_stop_marks_image_gvnic_capable(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["nic_type"] = "GVNIC"
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+    compute_mock.create_image_from_instance.return_value = {"name": "op-image"}
+    compute_mock.get_dangling_images.return_value = []
+    compute_mock.delete_instance.return_value = {"name": "op-delete"}
+    mocker.patch(
+        "vm_lifecycle.commands.stop.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance)
+
+    assert result.exit_code == 0
+    assert compute_mock.create_image_from_instance.call_args.kwargs[
+        "guest_os_features"
+    ] == ["GVNIC"]
+
+
+def test_stop_standby_keeps_instance(mock_context, mocker):
+    """With standby the stopped instance is kept after imaging and its cost reported."""
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["standby"] = True
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "RUNNING"}
+    ]
+    compute_mock.stop_instance.return_value = {"name": "op-stop"}
+    compute_mock.create_image_from_instance.return_value = {
+        "name": "op-image",
+        "targetLink": "link/img-123",
+    }
+    compute_mock.get_dangling_images.return_value = []
+    mocker.patch(
+        "vm_lifecycle.commands.stop.poll_with_spinner",
+        return_value={"success": True},
+    )
+    timings = mocker.patch("vm_lifecycle.commands.stop.TimingManager")
+    timings.return_value.summary.return_value = {
+        "restore": {
+            "image": {"count": 3, "mean": 180.0, "last": 170.0},
+            "instance": {"count": 2, "mean": 20.0, "last": 19.0},
+        }
+    }
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance)
+
+    assert result.exit_code == 0
+    compute_mock.create_image_from_instance.assert_called_once()
+    compute_mock.delete_instance.assert_not_called()
+    assert "50 GB pd-balanced, about $5.00/month" in result.output
+    assert "160.0s saved" in result.output
+
+
+def test_stop_standby_ignored_for_other_strategies(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    config_mock.active_profile["standby"] = True
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+    compute_mock.set_boot_disk_auto_delete.return_value = {"name": "op-keep"}
+    compute_mock.delete_instance.return_value = {"name": "op-delete"}
+    mocker.patch(
+        "vm_lifecycle.commands.stop.poll_with_spinner",
+        return_value={"success": True},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance, ["--strategy", "disk"])
+
+    assert result.exit_code == 0
+    compute_mock.delete_instance.assert_called_once()
+
+
+def test_stop_bakes_vscode_server_before_parking(unchanged_disk, mocker):
+    config_mock, compute_mock = unchanged_disk
+    config_mock.active_profile["vscode_server"] = True
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "RUNNING"}
+    ]
+    compute_mock.get_guest_attribute.return_value = "false"
+    compute_mock.stop_instance.return_value = {"name": "op-stop"}
+    compute_mock.create_image_from_instance.return_value = {"name": "op-image"}
+    compute_mock.get_dangling_images.return_value = []
+    mocker.patch(
+        "vm_lifecycle.commands.stop.poll_with_spinner", return_value={"success": True}
+    )
+    bake = mocker.patch(
+        "vm_lifecycle.commands.stop.bake_vscode_server", return_value="installed"
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(stop_vm_instance)
+
+    assert result.exit_code == 0
+    bake.assert_called_once_with("test-vm.europe-west1-b.test-project")
+    # The new server files make the disk differ from the last image
+    compute_mock.get_guest_attribute.assert_not_called()
+    compute_mock.create_image_from_instance.assert_called_once()
@@ -0,0 +1,82 @@
+import pytest
+from click.testing import CliRunner
+from vm_lifecycle.commands.up import vm_up
+
+
+INSTANCE = {
+    "id": "123",
+    "networkInterfaces": [{"accessConfigs": [{"natIP": "203.0.113.7"}]}],
+}
+
+
+@pytest.fixture
+def mock_context(mocker, tmp_path):
+    config_mock = mocker.Mock()
+    compute_mock = mocker.Mock()
+    config_mock.active_profile = {
+        "instance_name": "test-vm",
+        "project_id": "test-project",
+        "instance_user": "test-user",
+        "zone": "europe-west1-b",
+    }
+    mocker.patch(
+        "vm_lifecycle.commands.up.init_gcp_context",
+        return_value=(config_mock, compute_mock, "europe-west1-b"),
+    )
+    start = mocker.patch(
+        "vm_lifecycle.commands.up.start_instance", return_value="europe-west1-c"
+    )
+    key = tmp_path / "google_compute_engine"
+    key.write_text("key")
+    mocker.patch("vm_lifecycle.commands.up.GCLOUD_SSH_KEY_PATH", key)
+    return config_mock, compute_mock, start
+
+
+def test_up_writes_ssh_host_while_booting_then_opens_vscode(mock_context, mocker):
+    config_mock, compute_mock, start = mock_context
+    write = mocker.patch("vm_lifecycle.commands.up.write_ssh_host", return_value=True)
+    launch = mocker.patch("vm_lifecycle.commands.up.launch_vscode")
+
+    def ready(config, compute, zone, on_external_ip, startup_script):
+        # The entry is written before sshd answers
+        on_external_ip(INSTANCE)
+        assert write.called
+        return True
+
+    wait = mocker.patch("vm_lifecycle.commands.up.wait_for_ready", side_effect=ready)
+
+    result = CliRunner().invoke(vm_up, ["--warm"])
+
+    assert result.exit_code == 0
+    start.assert_called_once_with(
+        config_mock, compute_mock, "europe-west1-b", "image", False
+    )
+    host = "test-vm.europe-west1-c.test-project"
+    assert wait.call_args.kwargs["startup_script"] is False
+    assert "Updated SSH host: test-vm.europe-west1-c.test-project (203.0.113.7)" in (
+        result.output
+    )
+    launch.assert_called_once_with(config_mock.active_profile, host, None, True, True)
+
+
+def test_up_exits_when_instance_never_ready(mock_context, mocker):
+    mocker.patch("vm_lifecycle.commands.up.wait_for_ready", return_value=False)
+    launch = mocker.patch("vm_lifecycle.commands.up.launch_vscode")
+
+    result = CliRunner().invoke(vm_up)
+
+    assert result.exit_code == 1
+    launch.assert_not_called()
+
+
+def test_up_falls_back_to_gcloud_without_key(mock_context, mocker, tmp_path):
+    mocker.patch("vm_lifecycle.commands.up.GCLOUD_SSH_KEY_PATH", tmp_path / "missing")
+    mocker.patch("vm_lifecycle.commands.up.wait_for_ready", return_value=True)
+    gcloud = mocker.patch("vm_lifecycle.commands.up.create_vm_ssh_connection")
+    launch = mocker.patch("vm_lifecycle.commands.up.launch_vscode")
+
+    result = CliRunner().invoke(vm_up)
+
+    assert result.exit_code == 0
+    gcloud.assert_called_once()
+    assert launch.call_args.args[-1] is False
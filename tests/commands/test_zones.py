@@ -0,0 +1,118 @@
+import json
+
+import pytest
+from click.testing import CliRunner
+from vm_lifecycle.commands.zones import probe_zones
+
+
+@pytest.fixture
+def mock_context(mocker):
+    config_mock = mocker.Mock()
+    compute_mock = mocker.Mock()
+    config_mock.active = "dev"
+    config_mock.active_profile = {
+        "project_id": "test-project",
+        "zone": "europe-west1-b",
+        "region": "europe-west1",
+        "instance_name": "test-vm",
+        "machine_type": "c3-standard-22",
+    }
+    compute_mock.list_zones_offering_machine_type.return_value = [
+        "europe-west1-b",
+        "europe-west1-c",
+        "europe-west2-a",
+        "us-central1-a",
+    ]
+    compute_mock.list_instances.return_value = []
+    compute_mock.get_disk.return_value = None
+    mocker.patch(
+        "vm_lifecycle.commands.zones.init_gcp_context",
+        return_value=(config_mock, compute_mock, "europe-west1-b"),
+    )
+    mocker.patch(
+        "vm_lifecycle.commands.zones.fetch_region_endpoints",
+        return_value={"europe-west1": "https://ew1", "europe-west2": "https://ew2"},
+    )
+    return config_mock, compute_mock
+
+
+def test_probe_ranks_regions_offering_machine_type(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    probe = mocker.patch(
+        "vm_lifecycle.commands.zones.probe_regions",
+        return_value={"europe-west1": 24.0, "europe-west2": 9.5},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(probe_zones)
+
+    assert result.exit_code == 0
+    compute_mock.list_zones_offering_machine_type.assert_called_once_with(
+        "c3-standard-22"
+    )
+    assert sorted(probe.call_args.args[1]) == [
+        "europe-west1",
+        "europe-west2",
+        "us-central1",
+    ]
+    assert result.output.index("europe-west2") < result.output.index("europe-west1 ")
+    assert "Lowest latency zone: 'europe-west2-a'" in result.output
+    config_mock.update_active_zone_region.assert_not_called()
+
+
+def test_probe_apply_updates_profile_zone(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    mocker.patch(
+        "vm_lifecycle.commands.zones.probe_regions",
+        return_value={"europe-west1": 24.0, "europe-west2": 9.5},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(probe_zones, ["--apply"])
+
+    assert result.exit_code == 0
+    config_mock.update_active_zone_region.assert_called_once_with(
+        True, zone="europe-west2-a"
+    )
+
+
+def test_probe_apply_refuses_with_existing_instance(mock_context, mocker):
+    config_mock, compute_mock = mock_context
+    compute_mock.list_instances.return_value = [
+        {"name": "test-vm", "status": "TERMINATED"}
+    ]
+    mocker.patch(
+        "vm_lifecycle.commands.zones.probe_regions",
+        return_value={"europe-west2": 9.5},
+    )
+
+    runner = CliRunner()
+    result = runner.invoke(probe_zones, ["--apply"])
+
+    assert result.exit_code == 1
+    assert "vmlc start -z europe-west2-a" in result.output
+    config_mock.update_active_zone_region.assert_not_called()
+
+
+def test_probe_exits_when_no_region_reachable(mock_context, mocker):
+    mocker.patch("vm_lifecycle.commands.zones.probe_regions", return_value={})
+
+    runner = CliRunner()
+    result = runner.invoke(probe_zones)
+
+    assert result.exit_code == 1
+
+
+def test_probe_exits_on_malformed_endpoints(mock_context, mocker):
+    mocker.patch(
+        "vm_lifecycle.commands.zones.fetch_region_endpoints",
+        side_effect=json.JSONDecodeError("Expecting value", "<html>", 0),
+    )
+    probe = mocker.patch("vm_lifecycle.commands.zones.probe_regions")
+
+    runner = CliRunner()
+    result = runner.invoke(probe_zones)
+
+    assert result.exit_code == 1
+    assert "Failed to fetch region endpoints" in result.output
+    probe.assert_not_called()
@@ -0,0 +1,34 @@
+import pytest
+from vm_lifecycle.cache_manager import CacheManager
+
+
+@pytest.fixture
+def temp_cache_path(tmp_path):
+    return tmp_path / "cache.yaml"
+
+
+def test_get_or_fetch_caches_value(temp_cache_path, mocker):
+    """A fetched value is persisted and reused until it expires."""
+    fetch = mocker.Mock(return_value=["pd-balanced", "pd-ssd"])
+
+    manager = CacheManager(cache_path=temp_cache_path)
+    assert manager.get_or_fetch("disk_types/p/z", fetch, zone="z") == [
+        "pd-balanced",
+        "pd-ssd",
+    ]
+
+    reloaded = CacheManager(cache_path=temp_cache_path)
+    assert reloaded.get_or_fetch("disk_types/p/z", fetch, zone="z") == [
+        "pd-balanced",
+        "pd-ssd",
+    ]
+    fetch.assert_called_once_with(zone="z")
+
+
+def test_expired_entry_is_refetched(temp_cache_path, mocker):
+    """Entries older than the ttl are ignored."""
+    manager = CacheManager(cache_path=temp_cache_path, ttl=-1)
+    manager.set("key", "old")
+
+    assert manager.get("key") is None
+    assert manager.get_or_fetch("key", lambda: "new") == "new"
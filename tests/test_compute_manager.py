@@ -1,6 +1,6 @@
 import pytest
 from vm_lifecycle.compute_manager import GCPComputeManager
-from vm_lifecycle.gcp_helpers import poll_with_spinner
+from vm_lifecycle.gcp_helpers import poll_with_spinner, poll_many_with_spinner
 from vm_lifecycle.utils import gcphttperror
 from googleapiclient.errors import HttpError
 
@@ -192,19 +192,15 @@ def test_create_instance_with_custom_image(manager, mock_gcp_clients):
 def test_create_instance_with_ansible_script(
     manager, mock_gcp_clients, tmp_path, mocker
 ):
-    """Test create_instance loads ansible startup script and formats it correctly."""
-    compute_mock, _ = mock_gcp_clients
+    """Test create_instance renders the packaged ansible startup script."""
+    from vm_lifecycle.startup_scripts import StartupScriptRenderer
 
-    # Create a temporary ansible script file
-    script_dir = tmp_path / "scripts"
-    script_dir.mkdir()
-    script_path = script_dir / "startup_ansible.sh"
-    script_path.write_text("echo Hello {instance_user}")
+    compute_mock, _ = mock_gcp_clients
 
-    # Patch the internal path reference in the module
+    # Keep rendered scripts out of the user config dir
     mocker.patch(
-        "vm_lifecycle.compute_manager.Path",
-        lambda *args, **kwargs: tmp_path / "scripts",
+        "vm_lifecycle.compute_manager.StartupScriptRenderer",
+        lambda: StartupScriptRenderer(cache_dir=tmp_path),
     )
 
     insert_mock = compute_mock.instances.return_value.insert
@@ -392,6 +388,7 @@ def test_poll_with_spinner_generator_returns_failure_dict(mocker):
     )
 
     assert result["success"] is False
+    assert result["error"] == {"msg": "failed operation"}
 
 
 def test_gcphttperror_decorator_prints_and_exits(mocker):
@@ -470,3 +467,474 @@ def test_create_image_from_instance_uses_boot_disk_correctly(manager, mock_gcp_c
     call_args = insert_mock.call_args.kwargs["body"]
     assert "sourceDisk" in call_args
     assert "my-disk" in call_args["sourceDisk"]
+
+
+def test_build_request_uses_http_per_thread(manager):
+    """Requests built on different threads should not share an http connection."""
+    import threading
+
+    main_http = manager._build_request(None, None, "uri").http
+    assert manager._build_request(None, None, "uri").http is main_http
+
+    other = []
+    thread = threading.Thread(
+        target=lambda: other.append(manager._build_request(None, None, "uri").http)
+    )
+    thread.start()
+    thread.join()
+
+    assert other[0] is not main_http
+
+
+def test_thread_http_keeps_socket_timeout(manager):
+    """Per thread connections should keep the client's default socket timeout."""
+    from googleapiclient.http import DEFAULT_HTTP_TIMEOUT_SEC
+
+    assert manager._thread_http().http.timeout == DEFAULT_HTTP_TIMEOUT_SEC
+
+
+def test_poll_many_with_spinner_returns_results_in_order(mocker):
+    """Should drain every operation and keep results aligned with the input."""
+
+    def generator(op_name, scope, zone=None):
+        yield "RUNNING"
+        return {"success": op_name != "op-bad", "operation": {"name": op_name}}
+
+    mock_manager = mocker.Mock()
+    mock_manager.wait_for_operation = generator
+
+    results = poll_many_with_spinner(
+        compute_manager=mock_manager,
+        operations=[
+            {"op_name": "op-good", "scope": "zone", "zone": "europe-west1-b"},
+            {"op_name": "op-bad", "scope": "global"},
+        ],
+        text="Testing spinner...",
+    )
+
+    assert [r["success"] for r in results] == [True, False]
+    assert results[0]["operation"]["name"] == "op-good"
+
+
+def test_get_latest_snapshot_from_chain(manager, mocker):
+    """Should return the newest READY snapshot in the chain."""
+    mocker.patch.object(
+        manager,
+        "list_snapshots",
+        return_value=[
+            {"name": "s-1", "status": "READY", "creationTimestamp": "2025-01-01"},
+            {"name": "s-3", "status": "CREATING", "creationTimestamp": "2025-03-01"},
+            {"name": "s-2", "status": "READY", "creationTimestamp": "2025-02-01"},
+        ],
+    )
+
+    assert manager.get_latest_snapshot_from_chain("chain")["name"] == "s-2"
+
+
+def test_list_snapshots_filters_chain(manager, mock_gcp_clients):
+    """Should page through snapshots and filter on chainName."""
+    compute_mock, _ = mock_gcp_clients
+    compute_mock.snapshots.return_value.list.return_value.execute.return_value = {
+        "items": [
+            {"name": "s-a", "chainName": "c1"},
+            {"name": "s-b", "chainName": "c2"},
+        ]
+    }
+    compute_mock.snapshots.return_value.list_next.return_value = None
+
+    assert manager.list_snapshots(chain="c1") == [{"name": "s-a", "chainName": "c1"}]
+
+
+def test_create_instance_from_snapshot(manager, mock_gcp_clients):
+    """Should use sourceSnapshot instead of sourceImage for the boot disk."""
+    compute_mock, _ = mock_gcp_clients
+    insert_mock = compute_mock.instances.return_value.insert
+    insert_mock.return_value.execute.return_value = {"status": "PENDING"}
+
+    manager.create_instance(
+        instance_name="test-vm",
+        machine_type="e2-standard-2",
+        disk_size=50,
+        source_snapshot_name="snap-1",
+    )
+
+    params = insert_mock.call_args.kwargs["body"]["disks"][0]["initializeParams"]
+    assert params["sourceSnapshot"].endswith("global/snapshots/snap-1")
+    assert "sourceImage" not in params
+
+
+def test_create_instance_from_existing_disk(manager, mock_gcp_clients):
+    """Should attach the existing disk as boot disk without initializeParams."""
+    compute_mock, _ = mock_gcp_clients
+    insert_mock = compute_mock.instances.return_value.insert
+    insert_mock.return_value.execute.return_value = {"status": "PENDING"}
+
+    manager.create_instance(
+        instance_name="test-vm",
+        machine_type="e2-standard-2",
+        source_disk_name="test-vm",
+    )
+
+    boot_disk = insert_mock.call_args.kwargs["body"]["disks"][0]
+    assert boot_disk["source"].endswith("zones/europe-west1-b/disks/test-vm")
+    assert "initializeParams" not in boot_disk
+
+
+def test_set_boot_disk_auto_delete_uses_device_name(manager, mock_gcp_clients):
+    """Should look up the boot disk device name and pass it to the API."""
+    compute_mock, _ = mock_gcp_clients
+    compute_mock.instances.return_value.get.return_value.execute.return_value = {
+        "disks": [
+            {"boot": False, "deviceName": "data", "source": "x/disks/data"},
+            {"boot": True, "deviceName": "persistent-disk-0", "source": "x/disks/vm"},
+        ]
+    }
+
+    manager.set_boot_disk_auto_delete("vm", auto_delete=False)
+
+    kwargs = compute_mock.instances.return_value.setDiskAutoDelete.call_args.kwargs
+    assert kwargs["deviceName"] == "persistent-disk-0"
+    assert kwargs["autoDelete"] is False
+
+
+def test_get_disk_returns_none_when_missing(manager, mock_gcp_clients):
+    """Should return None instead of raising when the disk does not exist."""
+    from httplib2 import Response
+
+    compute_mock, _ = mock_gcp_clients
+    compute_mock.disks.return_value.get.return_value.execute.side_effect = HttpError(
+        resp=Response({"status": 404}), content=b"Not found"
+    )
+
+    assert manager.get_disk("missing") is None
+
+
+def test_create_instance_from_machine_image(manager, mock_gcp_clients):
+    """Should insert the instance with only the machine image and overrides."""
+    compute_mock, _ = mock_gcp_clients
+    insert = compute_mock.instances.return_value.insert
+    insert.return_value.execute.return_value = {"name": "op-create"}
+
+    manager.create_instance_from_machine_image(
+        instance_name="vm-1",
+        machine_image_name="mi-1",
+        machine_type="e2-standard-4",
+        zone="europe-west1-c",
+    )
+
+    body = insert.call_args.kwargs["body"]
+    assert insert.call_args.kwargs["zone"] == "europe-west1-c"
+    assert body == {
+        "name": "vm-1",
+        "sourceMachineImage": "projects/test-project/global/machineImages/mi-1",
+        "machineType": "zones/europe-west1-c/machineTypes/e2-standard-4",
+    }
+
+
+def test_get_dangling_machine_images(manager, mock_gcp_clients):
+    """Should page through machine images sharing the base name, keeping the newest READY one."""
+    compute_mock, _ = mock_gcp_clients
+    list_mock = compute_mock.machineImages.return_value.list
+    list_mock.return_value.execute.return_value = {
+        "items": [
+            {"name": "base-1", "status": "READY", "creationTimestamp": "2025-01"},
+            {"name": "base-2", "status": "READY", "creationTimestamp": "2025-02"},
+            {"name": "base-3", "status": "CREATING", "creationTimestamp": "2025-03"},
+            {"name": "other-1", "status": "READY", "creationTimestamp": "2025-04"},
+        ]
+    }
+    compute_mock.machineImages.return_value.list_next.return_value = None
+
+    assert manager.get_latest_machine_image("base")["name"] == "base-2"
+    assert manager.get_dangling_machine_images("base") == ["base-1", "base-3"]
+
+
+def test_get_guest_attribute(manager, mock_gcp_clients):
+    """Should return the value of the queried guest attribute, or None."""
+    from httplib2 import Response
+
+    compute_mock, _ = mock_gcp_clients
+    get_attrs = compute_mock.instances.return_value.getGuestAttributes
+    get_attrs.return_value.execute.return_value = {
+        "queryValue": {
+            "items": [{"namespace": "vmlc", "key": "dirty", "value": "false"}]
+        }
+    }
+
+    assert manager.get_guest_attribute("vm-1", "vmlc/dirty") == "false"
+    assert get_attrs.call_args.kwargs["queryPath"] == "vmlc/dirty"
+
+    get_attrs.return_value.execute.side_effect = HttpError(
+        resp=Response({"status": 404}), content=b"Not found"
+    )
+    assert manager.get_guest_attribute("vm-1", "vmlc/dirty") is None
+
+
+def test_get_guest_attributes(manager, mock_gcp_clients):
+    """Should map the keys of a namespace to their values."""
+    compute_mock, _ = mock_gcp_clients
+    get_attrs = compute_mock.instances.return_value.getGuestAttributes
+    get_attrs.return_value.execute.return_value = {
+        "queryValue": {
+            "items": [
+                {"namespace": "hostkeys", "key": "ssh-ed25519", "value": "AAAA"},
+                {"namespace": "hostkeys", "key": "ssh-rsa", "value": "BBBB"},
+            ]
+        }
+    }
+
+    assert manager.get_guest_attributes("vm-1", "hostkeys") == {
+        "ssh-ed25519": "AAAA",
+        "ssh-rsa": "BBBB",
+    }
+    assert get_attrs.call_args.kwargs["queryPath"] == "hostkeys/"
+
+
+def test_get_serial_port_output(manager, mock_gcp_clients):
+    """Should return the console contents and the offset to continue from."""
+    compute_mock, _ = mock_gcp_clients
+    serial = compute_mock.instances.return_value.getSerialPortOutput
+    serial.return_value.execute.return_value = {"contents": "boot\n", "next": "105"}
+
+    assert manager.get_serial_port_output("vm-1", start=100) == ("boot\n", 105)
+    assert serial.call_args.kwargs["start"] == 100
+
+
+def test_region_in_storage_locations():
+    """Regions match themselves and the multi-region that covers them."""
+    from vm_lifecycle.utils import region_in_storage_locations
+
+    assert region_in_storage_locations("europe-west1", ["europe-west1"])
+    assert region_in_storage_locations("europe-west4", ["eu"])
+    assert not region_in_storage_locations("us-central1", ["eu", "europe-west1"])
+
+
+def test_copy_image_sets_storage_location(manager, mock_gcp_clients):
+    """Should insert an image from the source image into the given location."""
+    compute_mock, _ = mock_gcp_clients
+    insert_mock = compute_mock.images.return_value.insert
+
+    manager.copy_image("img-1", "vm-image", "us-central1", family="vm-image")
+
+    body = insert_mock.call_args.kwargs["body"]
+    assert body["sourceImage"] == "projects/test-project/global/images/img-1"
+    assert body["storageLocations"] == ["us-central1"]
+    assert body["family"] == "vm-image"
+
+
+def test_create_instance_with_provisioned_disk(manager, mock_gcp_clients):
+    """Should set the disk type and provisioned performance on the boot disk."""
+    compute_mock, _ = mock_gcp_clients
+    insert_mock = compute_mock.instances.return_value.insert
+
+    manager.create_instance(
+        instance_name="test-vm",
+        machine_type="c3-standard-8",
+        disk_size=100,
+        zone="europe-west1-b",
+        disk_type="hyperdisk-balanced",
+        provisioned_iops=6000,
+        provisioned_throughput=290,
+    )
+
+    params = insert_mock.call_args.kwargs["body"]["disks"][0]["initializeParams"]
+    assert params["diskType"] == "zones/europe-west1-b/diskTypes/hyperdisk-balanced"
+    assert params["provisionedIops"] == 6000
+    assert params["provisionedThroughput"] == 290
+
+
+def test_check_disk_type_uses_cached_zone_disk_types(tmp_path, mocker):
+    """Should validate against the zone disk types and cache the lookup."""
+    from vm_lifecycle.cache_manager import CacheManager
+    from vm_lifecycle.gcp_helpers import check_disk_type
+
+    compute = mocker.Mock()
+    compute.list_disk_types.return_value = ["pd-balanced", "pd-ssd"]
+    cache = CacheManager(cache_path=tmp_path / "cache.yaml")
+    profile = {"project_id": "p", "disk_type": "pd-ssd"}
+
+    assert check_disk_type(compute, profile, "europe-west1-b", cache_manager=cache)
+    assert check_disk_type(compute, profile, "europe-west1-b", cache_manager=cache)
+    compute.list_disk_types.assert_called_once_with(zone="europe-west1-b")
+
+    profile["disk_type"] = "pd-extreme"
+    assert not check_disk_type(compute, profile, "europe-west1-b", cache_manager=cache)
+
+
+def test_disk_settings_only_passes_supported_performance():
+    """Provisioned performance is only passed for disk types that take it."""
+    from vm_lifecycle.gcp_helpers import disk_settings
+
+    assert disk_settings({}) == {"disk_type": "pd-balanced"}
+    assert disk_settings(
+        {"disk_type": "pd-extreme", "disk_iops": 10000, "disk_throughput": 500}
+    ) == {"disk_type": "pd-extreme", "provisioned_iops": 10000}
+
+
+def test_create_instance_with_premium_gvnic_tier1(manager, mock_gcp_clients):
+    """Should set the network tier, NIC type and Tier_1 bandwidth."""
+    compute_mock, _ = mock_gcp_clients
+    insert_mock = compute_mock.instances.return_value.insert
+
+    manager.create_instance(
+        instance_name="test-vm",
+        machine_type="n2-standard-32",
+        disk_size=100,
+        network_tier="PREMIUM",
+        nic_type="GVNIC",
+        tier1_networking=True,
+    )
+
+    body = insert_mock.call_args.kwargs["body"]
+    nic = body["networkInterfaces"][0]
+    assert nic["accessConfigs"][0]["networkTier"] == "PREMIUM"
+    assert nic["nicType"] == "GVNIC"
+    assert body["networkPerformanceConfig"] == {"totalEgressBandwidthTier": "TIER_1"}
+
+
+def test_create_image_with_guest_os_features(manager, mock_gcp_clients):
+    """Should mark the image with the requested guest OS features."""
+    compute_mock, _ = mock_gcp_clients
+    insert_mock = compute_mock.images.return_value.insert
+
+    manager.create_image_from_disk("disk-1", "vm-image", guest_os_features=["GVNIC"])
+
+    body = insert_mock.call_args.kwargs["body"]
+    assert body["guestOsFeatures"] == [{"type": "GVNIC"}]
+
+
+def test_network_settings_tier1_requires_supported_machine_type():
+    """Tier_1 forces gVNIC on supported machine types and is dropped otherwise."""
+    from vm_lifecycle.gcp_helpers import network_settings, image_guest_os_features
+
+    assert network_settings({"machine_type": "e2-medium"}) == {
+        "network_tier": "STANDARD"
+    }
+    assert network_settings(
+        {"machine_type": "n2-standard-32", "tier1_networking": True}
+    ) == {"network_tier": "STANDARD", "tier1_networking": True, "nic_type": "GVNIC"}
+    assert network_settings(
+        {
+            "machine_type": "e2-standard-32",
+            "tier1_networking": True,
+            "network_tier": "PREMIUM",
+        }
+    ) == {"network_tier": "PREMIUM"}
+    assert image_guest_os_features({"nic_type": "GVNIC"}) == ["GVNIC"]
+    assert image_guest_os_features({}) == []
+
+
+def test_list_zones_offering_machine_type(manager, mock_gcp_clients):
+    """Should return the zones whose aggregated list holds the machine type."""
+    compute_mock, _ = mock_gcp_clients
+    machine_types = compute_mock.machineTypes.return_value
+    machine_types.aggregatedList.return_value.execute.return_value = {
+        "items": {
+            "zones/europe-west4-a": {"machineTypes": [{"name": "c3-standard-22"}]},
+            "zones/europe-west1-b": {"machineTypes": [{"name": "c3-standard-22"}]},
+            "zones/europe-west1-c": {"warning": {"code": "NO_RESULTS_ON_PAGE"}},
+        }
+    }
+    machine_types.aggregatedList_next.return_value = None
+
+    assert manager.list_zones_offering_machine_type("c3-standard-22") == [
+        "europe-west1-b",
+        "europe-west4-a",
+    ]
+    assert (
+        machine_types.aggregatedList.call_args.kwargs["filter"]
+        == 'name = "c3-standard-22"'
+    )
+
+
+def test_create_instance_with_static_ip(manager, mock_gcp_clients):
+    """Should attach the reserved address to the access config."""
+    compute_mock, _ = mock_gcp_clients
+    insert_mock = compute_mock.instances.return_value.insert
+
+    manager.create_instance(
+        instance_name="test-vm",
+        machine_type="e2-standard-2",
+        disk_size=50,
+        nat_ip="203.0.113.7",
+    )
+
+    access_config = insert_mock.call_args.kwargs["body"]["networkInterfaces"][0][
+        "accessConfigs"
+    ][0]
+    assert access_config["natIP"] == "203.0.113.7"
+
+
+def test_wait_for_operation_region(manager, mock_gcp_clients):
+    """Region scoped operations are polled through regionOperations."""
+    compute_mock, _ = mock_gcp_clients
+    op_get = compute_mock.regionOperations.return_value.get
+    op_get.return_value.execute.return_value = {"status": "DONE"}
+
+    gen = manager.wait_for_operation("op-ip", scope="region", zone="europe-west1")
+    with pytest.raises(StopIteration) as stop:
+        next(gen)
+
+    assert stop.value.value["success"] is True
+    assert op_get.call_args.kwargs["region"] == "europe-west1"
+
+
+def test_static_ip_settings_reserves_missing_address(mocker):
+    """Should reserve the profile address on first use and pass its IP."""
+    from vm_lifecycle.gcp_helpers import static_ip_settings
+
+    compute = mocker.Mock()
+    compute.get_address.side_effect = [None, {"address": "203.0.113.7"}]
+    compute.reserve_address.return_value = {"name": "op-ip"}
+    poll = mocker.patch(
+        "vm_lifecycle.gcp_helpers.poll_with_spinner", return_value={"success": True}
+    )
+    profile = {"instance_name": "dev-vm", "static_ip": True}
+
+    assert static_ip_settings(compute, profile, "europe-west1") == {
+        "nat_ip": "203.0.113.7"
+    }
+    compute.reserve_address.assert_called_once_with(
+        "dev-vm-ip", "europe-west1", network_tier="STANDARD"
+    )
+    assert poll.call_args.kwargs["scope"] == "region"
+    assert (
+        static_ip_settings(compute, {"instance_name": "dev-vm"}, "europe-west1") == {}
+    )
+
+
+def test_prewarm_settings_splits_profile_paths():
+    """Hot paths are only passed when the profile has any."""
+    from vm_lifecycle.gcp_helpers import prewarm_settings
+
+    assert prewarm_settings({}) == {}
+    assert prewarm_settings({"prewarm_paths": "/home/u/repo, /opt/cache,"}) == {
+        "prewarm_paths": ["/home/u/repo", "/opt/cache"]
+    }
+
+
+def test_create_instance_with_prewarm_paths(
+    manager, mock_gcp_clients, tmp_path, mocker
+):
+    """Should add the pre-warm stage to the startup script."""
+    from vm_lifecycle.startup_scripts import StartupScriptRenderer
+
+    compute_mock, _ = mock_gcp_clients
+    mocker.patch(
+        "vm_lifecycle.compute_manager.StartupScriptRenderer",
+        lambda: StartupScriptRenderer(cache_dir=tmp_path),
+    )
+    insert_mock = compute_mock.instances.return_value.insert
+
+    manager.create_instance(
+        instance_name="test-vm",
+        machine_type="e2-standard-2",
+        disk_size=50,
+        custom_image_name="vm-image-1",
+        prewarm_paths=["/home/u/my repo"],
+    )
+
+    items = insert_mock.call_args.kwargs["body"]["metadata"]["items"]
+    script = next(i["value"] for i in items if i["key"] == "startup-script")
+    assert "PREWARM_PATHS=('/home/u/my repo')" in script
+    assert "stage ansible" not in script
@@ -190,3 +190,60 @@ def test_pre_run_profile_check_invalid(temp_config_path):
     manager.add_profile("test_profile", incomplete_profile)
 
     assert manager.pre_run_profile_check() is False
+
+
+def test_pre_run_profile_check_allows_optional_settings(temp_config_path, config_data):
+    """Optional profile settings should not fail the pre-run check."""
+    config_data = config_data()
+    config_data["park_strategy"] = "snapshot"
+    manager = ConfigManager(config_path=temp_config_path)
+    manager.add_profile("test_profile", config_data)
+
+    assert manager.pre_run_profile_check() is True
+
+
+def test_set_profile_option(temp_config_path, config_data):
+    """Setting an option should persist it on the active profile."""
+    config_data = config_data()
+    manager = ConfigManager(config_path=temp_config_path)
+    manager.add_profile("test_profile", config_data)
+
+    assert manager.set_profile_option("park_strategy", "snapshot") is True
+    assert manager.active_profile["park_strategy"] == "snapshot"
+    assert (
+        ConfigManager(config_path=temp_config_path).active_profile["park_strategy"]
+        == "snapshot"
+    )
+
+
+def test_add_and_remove_schedule(temp_config_path, config_data):
+    manager = ConfigManager(config_path=temp_config_path)
+    manager.add_profile("dev", config_data())
+    manager.add_profile("other", config_data())
+
+    manager.add_schedule("start", "30 7 * * 1-5")
+    manager.add_schedule("stop", "0 19 * * 1-5")
+
+    assert ConfigManager(config_path=temp_config_path).list_schedules() == {
+        "dev": [
+            {"action": "start", "cron": "30 7 * * 1-5"},
+            {"action": "stop", "cron": "0 19 * * 1-5"},
+        ]
+    }
+    assert manager.remove_schedule(3) is None
+    assert manager.remove_schedule(1) == {"action": "start", "cron": "30 7 * * 1-5"}
+    assert manager.active_profile["schedules"] == [
+        {"action": "stop", "cron": "0 19 * * 1-5"}
+    ]
+
+
+def test_profile_env_var_overrides_active(temp_config_path, config_data, monkeypatch):
+    manager = ConfigManager(config_path=temp_config_path)
+    manager.add_profile("dev", config_data())
+    manager.add_profile("other", config_data())
+
+    monkeypatch.setenv("VMLC_PROFILE", "other")
+    scheduled = ConfigManager(config_path=temp_config_path)
+
+    assert scheduled.active == "other"
+    assert scheduled.get_active_profile() == "dev"
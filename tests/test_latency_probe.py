@@ -0,0 +1,59 @@
+import io
+
+import pytest
+from vm_lifecycle import latency_probe
+from vm_lifecycle.cache_manager import CacheManager
+
+
+def test_probe_regions_skips_unknown_and_unreachable(mocker):
+    """Only regions with an endpoint that answered are returned."""
+    mocker.patch.object(
+        latency_probe,
+        "probe_latency",
+        side_effect=lambda url: {"https://a": 12.0, "https://b": None}[url],
+    )
+
+    result = latency_probe.probe_regions(
+        {"region-a": "https://a", "region-b": "https://b"},
+        ["region-a", "region-b", "region-c"],
+    )
+
+    assert result == {"region-a": 12.0}
+
+
+def test_probe_latency_ignores_connection_setup(mocker):
+    """The first request opens the connection and is not counted."""
+    conn = mocker.patch.object(latency_probe.http.client, "HTTPSConnection")
+    clock = iter([0.0, 1.0, 1.01, 2.0, 2.03, 3.0, 3.02])
+    mocker.patch.object(latency_probe.time, "perf_counter", lambda: next(clock))
+
+    assert latency_probe.probe_latency("https://ew1.example", attempts=3) == 20.0
+    conn.assert_called_once_with("ew1.example", timeout=latency_probe.PROBE_TIMEOUT)
+
+
+def test_probe_latency_unreachable(mocker):
+    conn = mocker.patch.object(latency_probe.http.client, "HTTPSConnection")
+    conn.return_value.request.side_effect = OSError("unreachable")
+
+    assert latency_probe.probe_latency("https://ew1.example") is None
+
+
+def test_fetch_region_endpoints_uses_cache(tmp_path, mocker):
+    cache = CacheManager(cache_path=tmp_path / "cache.yaml")
+    cache.set("probe_endpoints", {"europe-west1": "https://ew1"})
+    urlopen = mocker.patch.object(latency_probe.urllib.request, "urlopen")
+
+    assert latency_probe.fetch_region_endpoints(cache) == {
+        "europe-west1": "https://ew1"
+    }
+    urlopen.assert_not_called()
+
+
+def test_fetch_region_endpoints_rejects_malformed_response(tmp_path, mocker):
+    cache = CacheManager(cache_path=tmp_path / "cache.yaml")
+    urlopen = mocker.patch.object(latency_probe.urllib.request, "urlopen")
+    urlopen.return_value.__enter__.return_value = io.BytesIO(b"<html>")
+
+    with pytest.raises(ValueError):
+        latency_probe.fetch_region_endpoints(cache)
+    assert cache.get("probe_endpoints") is None
@@ -0,0 +1,58 @@
+import pytest
+from vm_lifecycle.cache_manager import CacheManager
+from vm_lifecycle.machine_catalog import MachineTypeCatalog
+
+
+@pytest.fixture
+def catalog(tmp_path, mocker):
+    compute = mocker.Mock()
+    compute.project_id = "test-project"
+    compute.list_machine_types.return_value = [
+        {"name": "e2-standard-4", "guestCpus": 4, "memoryMb": 16384},
+        {"name": "e2-standard-16", "guestCpus": 16, "memoryMb": 65536},
+        {"name": "e2-highcpu-16", "guestCpus": 16, "memoryMb": 16384},
+        {"name": "n2-standard-16", "guestCpus": 16, "memoryMb": 65536},
+        {"name": "c3-standard-22", "guestCpus": 22, "memoryMb": 90112},
+        {"name": "n2-standard-32", "guestCpus": 32, "memoryMb": 131072},
+    ]
+    cache = CacheManager(cache_path=tmp_path / "cache.yaml")
+    return MachineTypeCatalog(compute, cache_manager=cache), compute
+
+
+def test_query_filters_by_size_and_family(catalog):
+    """Only machine types meeting the minimums are returned, smallest first."""
+    catalog, _ = catalog
+
+    names = [e["name"] for e in catalog.query("z", min_vcpus=16, min_memory_gb=64)]
+    assert names == [
+        "e2-standard-16",
+        "n2-standard-16",
+        "c3-standard-22",
+        "n2-standard-32",
+    ]
+
+    names = [e["name"] for e in catalog.query("z", min_vcpus=16, families=["n2"])]
+    assert names == ["n2-standard-16", "n2-standard-32"]
+
+
+def test_recommend_picks_cheapest_family(catalog):
+    """The cheapest family meeting the minimums is recommended."""
+    catalog, _ = catalog
+
+    assert catalog.recommend("z", min_vcpus=16, min_memory_gb=64)["name"] == (
+        "e2-standard-16"
+    )
+    assert catalog.recommend("z", min_vcpus=20)["name"] == "c3-standard-22"
+    assert catalog.recommend("z", min_vcpus=64) is None
+
+
+def test_zone_is_fetched_once(catalog, tmp_path):
+    """Zone machine types are cached across catalog instances."""
+    catalog, compute = catalog
+    assert catalog.get("z", "e2-standard-4")["vcpus"] == 4
+
+    fresh = MachineTypeCatalog(
+        compute, cache_manager=CacheManager(cache_path=tmp_path / "cache.yaml")
+    )
+    assert "n2-standard-32" in fresh.machine_types("z")
+    compute.list_machine_types.assert_called_once_with(zone="z")
@@ -0,0 +1,151 @@
+from vm_lifecycle import placement
+
+STOCKOUT = {"errors": [{"code": "ZONE_RESOURCE_POOL_EXHAUSTED"}]}
+
+
+def _operations(outcomes: dict):
+    """wait_for_operation that finishes each zone's insert with the given result."""
+
+    def wait_for_operation(op_name, scope, zone=None):
+        yield "RUNNING"
+        return outcomes[zone]
+
+    return wait_for_operation
+
+
+def test_is_stockout():
+    assert placement.is_stockout(STOCKOUT)
+    assert not placement.is_stockout({"errors": [{"code": "QUOTA_EXCEEDED"}]})
+    assert not placement.is_stockout(None)
+
+
+def test_fallback_zones_same_region(mocker):
+    compute = mocker.Mock()
+    compute.list_zones_offering_machine_type.return_value = [
+        "europe-west1-b",
+        "europe-west1-c",
+        "europe-west1-d",
+        "europe-west4-a",
+    ]
+
+    assert placement.fallback_zones(compute, "europe-west1-b", "n2-standard-8") == [
+        "europe-west1-c",
+        "europe-west1-d",
+    ]
+
+
+def test_place_instance_moves_on_after_stockout(mocker):
+    compute = mocker.Mock()
+    compute.wait_for_operation.side_effect = _operations(
+        {
+            "europe-west1-c": {"success": False, "error": STOCKOUT},
+            "europe-west1-d": {"success": True},
+        }
+    )
+    create_fn = mocker.Mock(return_value={"name": "op"})
+
+    zone, result = placement.place_instance(
+        compute,
+        create_fn,
+        ["europe-west1-c", "europe-west1-d"],
+        "vm",
+        "n2-standard-8",
+        "Creating instance",
+    )
+
+    assert zone == "europe-west1-d"
+    assert result["success"]
+    assert [c.args[0] for c in create_fn.call_args_list] == [
+        "europe-west1-c",
+        "europe-west1-d",
+    ]
+
+
+def test_place_instance_stops_on_other_errors(mocker):
+    compute = mocker.Mock()
+    error = {"errors": [{"code": "QUOTA_EXCEEDED"}]}
+    compute.wait_for_operation.side_effect = _operations(
+        {"europe-west1-c": {"success": False, "error": error}}
+    )
+    create_fn = mocker.Mock(return_value={"name": "op"})
+
+    zone, result = placement.place_instance(
+        compute,
+        create_fn,
+        ["europe-west1-c", "europe-west1-d"],
+        "vm",
+        "n2-standard-8",
+        "Creating instance",
+    )
+
+    assert zone is None
+    assert result["error"] == error
+    create_fn.assert_called_once()
+
+
+def test_place_instance_race_deletes_loser(mocker):
+    compute = mocker.Mock()
+    compute.wait_for_operation.side_effect = _operations(
+        {
+            "europe-west1-b": {"success": True},
+            "europe-west1-c": {"success": True},
+        }
+    )
+    create_fn = mocker.Mock(return_value={"name": "op"})
+
+    zone, result = placement.place_instance(
+        compute,
+        create_fn,
+        ["europe-west1-b", "europe-west1-c"],
+        "vm",
+        "n2-standard-8",
+        "Creating instance",
+        race=True,
+    )
+
+    assert result["success"]
+    loser = ({"europe-west1-b", "europe-west1-c"} - {zone}).pop()
+    compute.delete_instance.assert_called_once_with("vm", zone=loser)
+
+
+def test_place_instance_race_waits_for_loser_insert_before_deleting(mocker):
+    import threading
+    import time
+
+    compute = mocker.Mock()
+    events = []
+    won = threading.Event()
+
+    def wait_for_operation(op_name, scope, zone=None):
+        if zone == "europe-west1-c":
+            # The loser's insert is still running when the winner comes up
+            while not won.is_set():
+                time.sleep(0.01)
+                yield "RUNNING"
+            for _ in range(5):
+                time.sleep(0.01)
+                yield "RUNNING"
+        events.append(("done", zone))
+        won.set()
+        return {"success": True}
+
+    compute.wait_for_operation.side_effect = wait_for_operation
+    compute.delete_instance.side_effect = lambda name, zone: events.append(
+        ("delete", zone)
+    )
+    create_fn = mocker.Mock(return_value={"name": "op"})
+
+    zone, result = placement.place_instance(
+        compute,
+        create_fn,
+        ["europe-west1-b", "europe-west1-c"],
+        "vm",
+        "n2-standard-8",
+        "Creating instance",
+        race=True,
+    )
+
+    assert zone == "europe-west1-b"
+    assert events.index(("done", "europe-west1-c")) < events.index(
+        ("delete", "europe-west1-c")
+    )
@@ -0,0 +1,84 @@
+import pytest
+
+from vm_lifecycle import readiness
+
+INSTANCE = {
+    "networkInterfaces": [{"accessConfigs": [{"natIP": "203.0.113.7"}]}],
+    "metadata": {"items": [{"key": "startup-script", "value": "echo hi"}]},
+}
+
+
+def test_external_ip():
+    assert readiness.external_ip(INSTANCE) == "203.0.113.7"
+    assert (
+        readiness.external_ip({"networkInterfaces": [{"accessConfigs": [{}]}]}) is None
+    )
+
+
+def test_startup_scripts_done_only_counts_latest_boot():
+    previous_boot = "Linux version 6.1\nFinished running startup scripts.\n"
+
+    assert readiness.startup_scripts_done(previous_boot)
+    assert not readiness.startup_scripts_done(previous_boot + "Linux version 6.1\n")
+
+
+def test_wait_until_ready_reports_phases(mocker):
+    compute = mocker.Mock()
+    compute.get_instance.side_effect = [
+        {"networkInterfaces": [{"accessConfigs": [{}]}]},
+        INSTANCE,
+    ]
+    compute.get_serial_port_output.side_effect = [
+        ("Linux version 6.1\n", 18),
+        ("Finished running startup scripts.\n", 52),
+    ]
+    ssh = mocker.patch.object(readiness, "ssh_ready", side_effect=[False, True])
+    mocker.patch.object(readiness.time, "sleep")
+
+    phases = readiness.wait_until_ready(compute, "vm", "europe-west1-b")
+
+    assert list(phases) == ["external_ip", "ssh", "startup_script"]
+    ssh.assert_called_with("203.0.113.7")
+    assert compute.get_serial_port_output.call_args.kwargs["start"] == 18
+
+
+def test_wait_until_ready_skips_startup_script_without_one(mocker):
+    compute = mocker.Mock()
+    compute.get_instance.return_value = {**INSTANCE, "metadata": {}}
+    mocker.patch.object(readiness, "ssh_ready", return_value=True)
+
+    phases = readiness.wait_until_ready(compute, "vm", "europe-west1-b")
+
+    assert list(phases) == ["external_ip", "ssh"]
+    compute.get_serial_port_output.assert_not_called()
+
+
+def test_wait_until_ready_times_out(mocker):
+    compute = mocker.Mock()
+    compute.get_instance.return_value = INSTANCE
+    mocker.patch.object(readiness, "ssh_ready", return_value=False)
+    mocker.patch.object(readiness.time, "sleep")
+
+    with pytest.raises(TimeoutError, match="ssh"):
+        readiness.wait_until_ready(compute, "vm", "europe-west1-b", timeout=0)
+
+
+def test_wait_until_ready_hands_over_instance_before_ssh(mocker):
+    compute = mocker.Mock()
+    compute.get_instance.return_value = INSTANCE
+    calls = []
+    mocker.patch.object(
+        readiness, "ssh_ready", side_effect=lambda ip: calls.append("ssh") or True
+    )
+
+    phases = readiness.wait_until_ready(
+        compute,
+        "vm",
+        "europe-west1-b",
+        on_external_ip=lambda instance: calls.append("ip"),
+        startup_script=False,
+    )
+
+    assert calls == ["ip", "ssh"]
+    assert list(phases) == ["external_ip", "ssh"]
+    compute.get_serial_port_output.assert_not_called()
@@ -0,0 +1,84 @@
+from datetime import datetime
+
+import pytest
+
+from vm_lifecycle import scheduler
+
+
+def test_parse_cron_fields():
+    minutes, hours, days, months, weekdays = scheduler.parse_cron("*/15 7-9 * * 1-5,7")
+
+    assert minutes == {0, 15, 30, 45}
+    assert hours == {7, 8, 9}
+    assert days == set(range(1, 32))
+    assert weekdays == {0, 1, 2, 3, 4, 5}
+
+
+@pytest.mark.parametrize(
+    "expression", ["* * * *", "60 * * * *", "a * * * *", "5-1 * * * *"]
+)
+def test_parse_cron_rejects_invalid(expression):
+    with pytest.raises(ValueError):
+        scheduler.parse_cron(expression)
+
+
+def test_cron_matches_weekdays():
+    # 2026-10-19 is a Monday, 2026-10-18 a Sunday
+    assert scheduler.cron_matches("30 7 * * 1-5", datetime(2026, 10, 19, 7, 30))
+    assert not scheduler.cron_matches("30 7 * * 1-5", datetime(2026, 10, 18, 7, 30))
+    assert not scheduler.cron_matches("30 7 * * 1-5", datetime(2026, 10, 19, 7, 31))
+
+
+def test_cron_matches_day_of_month_or_weekday():
+    """Like cron, restricting both days matches either of them."""
+    assert scheduler.cron_matches("0 8 1 * 1", datetime(2026, 10, 19, 8, 0))
+    assert scheduler.cron_matches("0 8 1 * 1", datetime(2026, 10, 1, 8, 0))
+    assert not scheduler.cron_matches("0 8 1 * 1", datetime(2026, 10, 20, 8, 0))
+
+
+@pytest.mark.parametrize(
+    "expression, calendar",
+    [
+        ("30 7 * * 1-5", "Mon..Fri *-*-* 7:30:00"),
+        ("0 19 * * *", "*-*-* 19:0:00"),
+        ("*/15 8-18 * * 0,6", "Sun,Sat *-*-* 8..18:0/15:00"),
+        ("0 6 1 */3 *", "*-1/3-1 6:0:00"),
+    ],
+)
+def test_cron_to_on_calendar(expression, calendar):
+    assert scheduler.cron_to_on_calendar(expression) == calendar
+
+
+def test_cron_to_on_calendar_rejects_day_and_weekday():
+    with pytest.raises(ValueError):
+        scheduler.cron_to_on_calendar("0 8 1 * 1")
+
+
+def test_write_systemd_units_removes_stale(tmp_path):
+    (tmp_path / "vmlc-old-1-stop.timer").write_text("")
+    (tmp_path / "other.timer").write_text("")
+
+    timers, removed = scheduler.write_systemd_units(
+        {"dev": [{"action": "start", "cron": "30 7 * * 1-5"}]}, tmp_path
+    )
+
+    assert timers == ["vmlc-dev-1-start.timer"]
+    assert removed == ["vmlc-old-1-stop.timer"]
+    assert (tmp_path / "other.timer").exists()
+    service = (tmp_path / "vmlc-dev-1-start.service").read_text()
+    assert "Environment=VMLC_PROFILE=dev" in service
+    assert service.rstrip().endswith('"-m" "vm_lifecycle.main" "start"')
+    timer = (tmp_path / "vmlc-dev-1-start.timer").read_text()
+    assert "OnCalendar=Mon..Fri *-*-* 7:30:00\nPersistent=true\n" in timer
+
+
+def test_systemd_units_quote_exec_start(mocker):
+    mocker.patch.object(scheduler.sys, "executable", "/home/me/my venv/bin/python")
+
+    units = scheduler.systemd_units("dev", 1, {"action": "stop", "cron": "0 19 * * *"})
+
+    assert (
+        'ExecStart="/home/me/my venv/bin/python" "-m" "vm_lifecycle.main" "stop"\n'
+        in units["vmlc-dev-1-stop.service"]
+    )
+    assert scheduler.systemd_exec(["50%", "$HOME"]) == '"50%%" "$$HOME"'
@@ -0,0 +1,42 @@
+from vm_lifecycle.ssh_config import SSHConfigManager
+
+OTHER = "Host github.com\n    User git\n"
+
+
+def test_update_host_prepends_and_keeps_other_entries(tmp_path):
+    path = tmp_path / "config"
+    path.write_text(OTHER)
+    manager = SSHConfigManager(ssh_config_path=path)
+
+    assert manager.update_host("vm.zone.project", {"HostName": "203.0.113.7"})
+
+    content = path.read_text()
+    assert content.startswith("# vmlc begin vm.zone.project\nHost vm.zone.project\n")
+    assert content.endswith(OTHER)
+    assert manager.get_host("vm.zone.project") == {"HostName": "203.0.113.7"}
+    assert path.stat().st_mode & 0o777 == 0o600
+
+
+def test_update_host_replaces_entry_in_place(tmp_path):
+    path = tmp_path / "config"
+    manager = SSHConfigManager(ssh_config_path=path)
+    manager.update_host("vm", {"HostName": "203.0.113.7"})
+    manager.update_host("vm2", {"HostName": "203.0.113.8"})
+
+    assert manager.update_host("vm", {"HostName": "203.0.113.9"})
+    assert not manager.update_host("vm", {"HostName": "203.0.113.9"})
+
+    assert manager.get_host("vm") == {"HostName": "203.0.113.9"}
+    assert manager.get_host("vm2") == {"HostName": "203.0.113.8"}
+    assert path.read_text().count("Host vm\n") == 1
+
+
+def test_remove_host(tmp_path):
+    path = tmp_path / "config"
+    path.write_text(OTHER)
+    manager = SSHConfigManager(ssh_config_path=path)
+    manager.update_host("vm", {"HostName": "203.0.113.7"})
+
+    assert manager.remove_host("vm")
+    assert not manager.remove_host("vm")
+    assert path.read_text() == OTHER
@@ -0,0 +1,68 @@
+import subprocess
+
+import pytest
+
+from vm_lifecycle.startup_scripts import StartupScriptRenderer
+
+
+@pytest.fixture
+def renderer(tmp_path):
+    return StartupScriptRenderer(cache_dir=tmp_path / "scripts")
+
+
+def test_render_substitutes_values_and_leaves_bash_alone(renderer):
+    script = renderer.render("ansible", instance_user="goku")
+
+    assert script.startswith("#!/usr/bin/env bash")
+    assert 'id "goku"' in script
+    assert "@instance_user@" not in script
+    # Bash expansions are not template placeholders
+    assert 'VMLC_STATE_DIR="${VMLC_STATE_DIR:-/var/lib/vmlc/stages}"' in script
+
+
+def test_render_is_cached_by_content_hash(renderer):
+    script = renderer.render("ansible", instance_user="goku")
+    cached = list(renderer.cache_dir.iterdir())
+    assert len(cached) == 1
+
+    cached[0].write_text("cached", encoding="utf-8")
+    assert renderer.render("ansible", instance_user="goku") == "cached"
+    # Other values hash differently and version the stage markers
+    other = renderer.render("ansible", instance_user="vegeta")
+    assert other != script
+    assert len(list(renderer.cache_dir.iterdir())) == 2
+
+
+def test_render_rejects_unknown_scripts_and_missing_values(renderer):
+    with pytest.raises(ValueError, match="Unknown startup script"):
+        renderer.render("puppet")
+    with pytest.raises(KeyError, match="@instance_user@"):
+        renderer.render("ansible")
+
+
+def test_stage_guard_runs_each_stage_once(renderer, tmp_path):
+    guard = renderer.template("ansible").split("# Ensure the user exists")[0]
+    script = guard.replace("@script_hash@", "abc") + "stage demo echo ran\n"
+    env = {"VMLC_STATE_DIR": str(tmp_path / "stages"), "PATH": "/usr/bin:/bin"}
+
+    first = subprocess.run(["bash", "-c", script], env=env, capture_output=True)
+    second = subprocess.run(["bash", "-c", script], env=env, capture_output=True)
+
+    assert first.stdout == b"ran\n"
+    assert b"already done" in second.stdout
+    assert (tmp_path / "stages" / "demo.abc").exists()
+
+
+def test_render_combines_scripts_with_one_guard(renderer):
+    script = renderer.render(
+        "ansible",
+        "prewarm",
+        instance_user="goku",
+        prewarm_paths="/home/goku/repo '/srv/my data'",
+        prewarm_attribute="vmlc/prewarm",
+    )
+
+    assert script.count("#!/usr/bin/env bash") == 1
+    assert "stage ansible install_ansible" in script
+    assert "PREWARM_PATHS=(/home/goku/repo '/srv/my data')" in script
+    assert "guest-attributes/vmlc/prewarm" in script
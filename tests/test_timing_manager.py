@@ -0,0 +1,47 @@
+import pytest
+from vm_lifecycle.timing_manager import TimingManager
+from vm_lifecycle.params import TIMING_SAMPLE_LIMIT
+
+
+@pytest.fixture
+def temp_timings_path(tmp_path):
+    return tmp_path / "timings.yaml"
+
+
+def test_record_and_summary(temp_timings_path):
+    """Recorded durations are persisted and summarised per action and strategy."""
+    manager = TimingManager(timings_path=temp_timings_path)
+    manager.record("dev", "restore", "image", 60.0)
+    manager.record("dev", "restore", "image", 50.0)
+    manager.record("dev", "restore", "machine-image", 30.0)
+
+    reloaded = TimingManager(timings_path=temp_timings_path)
+    summary = reloaded.summary("dev")
+
+    assert summary["restore"]["image"] == {"count": 2, "mean": 55.0, "last": 50.0}
+    assert summary["restore"]["machine-image"]["count"] == 1
+    assert reloaded.summary("other") == {}
+
+
+def test_record_keeps_latest_samples(temp_timings_path):
+    """Only the most recent samples are kept."""
+    manager = TimingManager(timings_path=temp_timings_path)
+    for i in range(TIMING_SAMPLE_LIMIT + 5):
+        manager.record("dev", "park", "snapshot", float(i))
+
+    samples = manager.timings["dev"]["park"]["snapshot"]
+    assert len(samples) == TIMING_SAMPLE_LIMIT
+    assert samples[-1] == float(TIMING_SAMPLE_LIMIT + 4)
+
+
+def test_operation_duration():
+    """Duration is taken from the insert and end times of the operation."""
+    operation = {
+        "insertTime": "2025-01-01T10:00:00.000-08:00",
+        "startTime": "2025-01-01T10:00:05.000-08:00",
+        "endTime": "2025-01-01T10:01:30.500-08:00",
+    }
+
+    assert TimingManager.operation_duration(operation) == 90.5
+    assert TimingManager.operation_duration({"insertTime": "x"}) is None
+    assert TimingManager.operation_duration({"insertTime": "x", "endTime": "y"}) is None
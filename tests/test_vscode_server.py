@@ -0,0 +1,59 @@
+import subprocess
+
+import pytest
+
+from vm_lifecycle import vscode_server
+
+
+def test_local_commit_reads_second_line(mocker):
+    mocker.patch.object(
+        vscode_server.subprocess,
+        "run",
+        return_value=subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="1.95.0\nabc123\nx64\n"
+        ),
+    )
+    assert vscode_server.local_commit() == "abc123"
+
+
+def test_local_commit_without_code(mocker):
+    mocker.patch.object(
+        vscode_server.subprocess, "run", side_effect=FileNotFoundError("code")
+    )
+    assert vscode_server.local_commit() is None
+
+
+def test_install_script_resolves_arch_on_the_vm():
+    script = vscode_server.install_script("abc123")
+
+    assert 'commit="abc123"' in script
+    assert "commit:abc123/server-linux-$arch/stable" in script
+
+
+def test_ensure_server_runs_script_over_batch_ssh(mocker):
+    run = mocker.patch.object(
+        vscode_server.subprocess,
+        "run",
+        return_value=subprocess.CompletedProcess(
+            args=[], returncode=0, stdout="installed\n", stderr=""
+        ),
+    )
+
+    assert vscode_server.ensure_server("vm.zone.project", "abc123") == "installed"
+    command = run.call_args.args[0]
+    assert command[0] == "ssh" and "BatchMode=yes" in command
+    assert command[-3:] == ["vm.zone.project", "bash", "-s"]
+    assert run.call_args.kwargs["input"] == vscode_server.install_script("abc123")
+
+
+def test_ensure_server_raises_on_ssh_failure(mocker):
+    mocker.patch.object(
+        vscode_server.subprocess,
+        "run",
+        return_value=subprocess.CompletedProcess(
+            args=[], returncode=255, stdout="", stderr="Permission denied"
+        ),
+    )
+
+    with pytest.raises(RuntimeError, match="Permission denied"):
+        vscode_server.ensure_server("vm.zone.project", "abc123")